@@ -32,11 +32,15 @@ from activity.organizational_learning_activities import (
 # Scheduler activities (system operations)
 from activity.scheduler_activities import (
     cleanup_old_data,
+    deactivate_idle_vector_tenants,
     health_check_external_services,
     schedule_competitor_scan,
     send_scheduled_notification,
 )
 
+# Storage activities (class-based: hold the pooled MinIO client)
+from activity.storage_activities import StorageActivities
+
 # AI-powered activities (delegate to AI agents)
 from agent_activity.ai_activities import (
     analyze_document_content,
@@ -47,6 +51,7 @@ from agent_activity.ai_activities import (
 
 # Export all activities for worker registration
 __all__ = [
+    "StorageActivities",
     "TrainingJobStatus",
     "TrainingJobSubmission",
     "analyze_document_content",
@@ -54,6 +59,7 @@ __all__ = [
     "check_training_job_status",
     "cleanup_old_data",
     "collect_model_feedback",
+    "deactivate_idle_vector_tenants",
     "generate_document_summary",
     "get_organization_training_history",
     "health_check_external_services",
@@ -4,8 +4,12 @@ Handles document upload, text extraction, and basic file operations.
 AI-powered activities are in agent_activity/ai_activities.py
 """
 
+import asyncio
+from collections.abc import Awaitable, Iterator
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
 
 from temporalio import activity
 
@@ -25,6 +29,19 @@ try:
 except ImportError:
     pd = None
 
+# Plain-text files are streamed in blocks of this many characters
+_TEXT_BLOCK_CHARS = 64 * 1024
+# Spreadsheet rows rendered per extracted segment
+_SHEET_ROWS_PER_SEGMENT = 500
+# How often a long extraction reports liveness to Temporal
+_HEARTBEAT_INTERVAL_SECONDS = 10
+# Characters of a claim-checked document kept inline as a preview
+_CLAIM_CHECK_PREVIEW_CHARS = 1000
+# Bump whenever extraction output changes, so cached text from older extractors is not reused
+EXTRACTOR_VERSION = 1
+
+T = TypeVar("T")
+
 
 @dataclass
 class DocumentInfo:
@@ -34,8 +51,13 @@ class DocumentInfo:
     file_name: str
     file_size: int
     file_type: str
-    extracted_text: str
+    extracted_text: str  # Full text, or a preview when text_ref is set
     page_count: int | None = None
+    # Claim check: large text is kept in object storage and only this reference
+    # travels through workflow history (see resolve_extracted_text)
+    text_ref: str | None = None
+    text_chars: int = 0
+    text_sha256: str | None = None
 
 
 @dataclass
@@ -79,18 +101,70 @@ class SimpleResearchResult:
     error_message: str | None = None
 
 
+def summary_from_analysis(
+    analysis: DocumentSummaryResult, processing_time: str
+) -> DocumentSummaryWorkflowResult:
+    """Admin UI summary derived from a full analysis (no extra extraction or LLM call)"""
+    return DocumentSummaryWorkflowResult(
+        document_name=analysis.document_info.file_name,
+        document_type=analysis.document_info.file_type,
+        summary_text=analysis.short_summary,
+        key_points=analysis.key_takeaways,
+        topics=analysis.main_topics,
+        processing_time=processing_time,
+        success=True,
+    )
+
+
+def failed_summary(
+    file_path: str, error_msg: str, processing_time: str
+) -> DocumentSummaryWorkflowResult:
+    """Admin UI summary reporting that a document could not be analyzed"""
+    return DocumentSummaryWorkflowResult(
+        document_name=Path(file_path).name,
+        document_type="unknown",
+        summary_text=f"Error: {error_msg}",
+        key_points=[],
+        topics=[],
+        processing_time=processing_time,
+        success=False,
+        error_message=error_msg,
+    )
+
+
+@dataclass
+class TextSegment:
+    """A page, paragraph or block of extracted text and where it starts in the document"""
+
+    text: str
+    offset: int  # Character offset of the segment in the joined document text
+    page: int | None = None  # 1-based page number for paged formats (PDF)
+    truncated: bool = False  # Set on the last segment when the size cap cut extraction short
+
+
 @activity.defn
 async def process_document_upload(file_path: str) -> DocumentInfo:
-    """Process uploaded document and extract text"""
+    """
+    Process uploaded document and extract text.
+
+    ``file_path`` is a local path or a ``minio://`` reference to a stored
+    document, which is streamed to a local copy for extraction and then removed.
+    """
+    local_copy = None
     try:
-        file_path_obj = Path(file_path)
+        if file_path.startswith("minio://"):
+            from activity.storage_activities import get_storage_activities
+
+            local_copy = await get_storage_activities().retrieve_document_to_file(file_path)
+        source = local_copy or file_path
+        file_path_obj = Path(source)
 
         if not file_path_obj.exists():
             raise FileNotFoundError(f"Document not found: {file_path}")
 
         # Get basic file info
         file_stats = file_path_obj.stat()
-        file_name = file_path_obj.name
+        file_name = Path(file_path).name
         file_size = file_stats.st_size
         file_type = file_path_obj.suffix.lower()
 
@@ -98,21 +172,82 @@ async def process_document_upload(file_path: str) -> DocumentInfo:
             f"Processing document: {file_name} ({file_size} bytes, type: {file_type})"
         )
 
-        # Extract text based on file type
-        extracted_text = await _extract_text_from_file(file_path, file_type)
+        # Imported here to keep workflow sandbox imports light
+        from activity.extraction_cache import file_sha256, get_extraction_cache
+        from activity.extraction_pool import (
+            POOLED_FILE_TYPES,
+            ExtractionError,
+            get_extraction_pool,
+        )
+        from shared.config import get_settings
+
+        settings = get_settings()
+        max_chars = settings.max_extracted_chars
 
-        # Count pages if possible (rough estimate based on text length)
-        page_count = max(1, len(extracted_text) // 2000) if extracted_text else 1
+        # Repeats (retries, re-onboarding, re-analysis) of the same bytes skip parsing
+        cache = get_extraction_cache()
+        cache_key = None
+        cached = None
+        if cache is not None:
+            try:
+                digest = await asyncio.to_thread(file_sha256, source)
+                cache_key = f"{digest}-{_extractor_key(file_type, max_chars)}"
+                cached = await asyncio.to_thread(cache.get, cache_key)
+            except Exception as e:
+                activity.logger.warning(f"Extraction cache lookup failed for {file_name}: {e}")
 
-        return DocumentInfo(
+        if cached is not None:
+            extracted_text, pages = cached
+            activity.logger.info(f"Extraction cache hit for {file_name}")
+        else:
+            # Extract off the event loop: CPU-bound parsers in the process pool,
+            # plain text streamed in a thread
+            if file_type in POOLED_FILE_TYPES:
+                extract = partial(get_extraction_pool().extract, source, max_chars)
+            else:
+                extract = partial(_collect_text, source, max_chars)
+
+            try:
+                extracted_text, pages = await _heartbeat_until_done(
+                    asyncio.to_thread(extract), file_name
+                )
+            except ExtractionError as e:
+                # Never cached: only a completed extraction is stored, since a parse
+                # failure, timeout or memory kill may succeed on the next attempt
+                activity.logger.error(f"Text extraction failed for {file_path}: {e}")
+                extracted_text, pages = f"Text extraction failed: {e!s}", 0
+            else:
+                if cache_key is not None:
+                    try:
+                        await asyncio.to_thread(cache.put, cache_key, extracted_text, pages)
+                    except Exception as e:
+                        activity.logger.warning(
+                            f"Could not cache extracted text for {file_name}: {e}"
+                        )
+
+        # Count pages if known, otherwise estimate from text length
+        if pages:
+            page_count = pages
+        else:
+            page_count = max(1, len(extracted_text) // 2000) if extracted_text else 1
+
+        document_info = DocumentInfo(
             file_path=file_path,
             file_name=file_name,
             file_size=file_size,
             file_type=file_type,
             extracted_text=extracted_text,
             page_count=page_count,
+            text_chars=len(extracted_text),
         )
 
+        # Keep large text out of Temporal payloads and history
+        threshold = settings.claim_check_threshold_chars
+        if threshold and len(extracted_text) > threshold:
+            await _claim_check_text(document_info)
+
+        return document_info
+
     except Exception as e:
         activity.logger.error(f"Document processing failed: {e}")
         # Return basic info even if text extraction fails
@@ -125,76 +260,176 @@ async def process_document_upload(file_path: str) -> DocumentInfo:
             extracted_text=f"Failed to extract text from document: {e}",
             page_count=0,
         )
+    finally:
+        if local_copy:
+            Path(local_copy).unlink(missing_ok=True)
 
 
-async def _extract_text_from_file(file_path: str, file_type: str) -> str:
-    """Extract text from various file formats"""
+async def _claim_check_text(document_info: DocumentInfo) -> None:
+    """Move extracted text to MinIO and leave a reference plus preview inline"""
+    text = document_info.extracted_text
+    try:
+        from activity.storage_activities import get_storage_activities
+
+        stored = await asyncio.to_thread(get_storage_activities().store_text, text)
+    except Exception as e:
+        stored = None
+        activity.logger.warning(f"Claim check upload failed for {document_info.file_name}: {e}")
+
+    if stored is None:
+        activity.logger.warning(
+            f"Passing {len(text)} characters of {document_info.file_name} inline; "
+            "MinIO is unavailable for the claim check"
+        )
+        return
+
+    document_info.text_ref = stored["ref"]
+    document_info.text_sha256 = stored["sha256"]
+    document_info.extracted_text = text[:_CLAIM_CHECK_PREVIEW_CHARS]
+
+
+async def resolve_extracted_text(document_info: DocumentInfo) -> str:
+    """
+    Full extracted text of a document, loading claim-checked text from MinIO.
+
+    Call this inside activities; workflows should pass DocumentInfo along untouched.
+
+    Raises:
+        ValueError: If the stored text does not match the recorded hash
+    """
+    if not document_info.text_ref:
+        return document_info.extracted_text
+
+    from activity.storage_activities import get_storage_activities
+
+    return await asyncio.to_thread(
+        get_storage_activities().load_text, document_info.text_ref, document_info.text_sha256
+    )
+
+
+async def _heartbeat_until_done(work: Awaitable[T], details: str) -> T:
+    """Await work while heartbeating, so a long parse is not mistaken for a dead worker"""
+    task = asyncio.ensure_future(work)
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=_HEARTBEAT_INTERVAL_SECONDS)
+        if done:
+            return task.result()
+        activity.heartbeat(details)
+
+
+def _extractor_key(file_type: str, max_chars: int) -> str:
+    """
+    Extraction settings that change the output: version, installed parsers, size cap and
+    file type (the same bytes under another suffix go through another parser)
+    """
+    parsers = "".join("1" if module is not None else "0" for module in (PyPDF2, docx, pd))
+    return f"v{EXTRACTOR_VERSION}-{parsers}-{max_chars}-{file_type.lstrip('.') or 'none'}"
+
+
+def _collect_text(file_path: str, max_chars: int) -> tuple[str, int]:
+    """Join streamed segments once (no quadratic concatenation); returns text and page count"""
+    parts = []
+    pages = 0
+    for segment in iter_document_text(file_path, max_chars):
+        parts.append(segment.text)
+        pages = segment.page or pages
+    return "".join(parts), pages
+
+
+def iter_document_text(file_path: str, max_chars: int | None = None) -> Iterator[TextSegment]:
+    """
+    Stream a document's text as page, paragraph or block segments.
+
+    PDFs yield one segment per page, Word documents one per paragraph,
+    spreadsheets blocks of rows and other files blocks of characters, so the
+    parsers never build the whole text themselves (see _collect_text).
+    Extraction stops after ``max_chars`` characters; the last segment is cut to
+    fit and flagged ``truncated``. A file that cannot be parsed raises
+    ExtractionError rather than yielding a note.
+    """
+    offset = 0
+    for page, text in _iter_raw_text(file_path, Path(file_path).suffix.lower()):
+        if max_chars is not None and offset + len(text) > max_chars:
+            yield TextSegment(text[: max_chars - offset], offset, page, truncated=True)
+            activity.logger.warning(
+                f"Stopped extracting {Path(file_path).name} at {max_chars} characters"
+            )
+            return
+
+        yield TextSegment(text, offset, page)
+        offset += len(text)
+
+
+async def chunk_document(text: str, chunk_size: int = 1024) -> list[str]:
+    """Split extracted text into ``chunk_size`` character chunks"""
+    return [text[start : start + chunk_size] for start in range(0, len(text), chunk_size)]
+
+
+def _iter_raw_text(file_path: str, file_type: str) -> Iterator[tuple[int | None, str]]:
+    """
+    Yield (page, text) pieces of a file.
+
+    Raises:
+        ExtractionError: If the file cannot be read or parsed
+        MemoryError: Passed through, so the extraction pool's memory cap fails the parse
+    """
+    from activity.extraction_pool import ExtractionError
+
+    name = Path(file_path).name
     try:
         if file_type in [".txt", ".md", ".csv"]:
             # Plain text files
             with Path(file_path).open(encoding="utf-8") as f:
-                return f.read()
+                while block := f.read(_TEXT_BLOCK_CHARS):
+                    yield None, block
 
         elif file_type == ".pdf":
             # Try to extract from PDF
             if PyPDF2 is None:
                 activity.logger.warning("PyPDF2 not available for PDF extraction")
-                return f"PDF file: {Path(file_path).name} (text extraction requires PyPDF2)"
+                yield None, f"PDF file: {name} (text extraction requires PyPDF2)"
+                return
 
-            try:
-                with Path(file_path).open("rb") as f:
-                    reader = PyPDF2.PdfReader(f)
-                    text = ""
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
-                    return text
-            except Exception as e:
-                activity.logger.warning(f"PDF extraction failed: {e}")
-                return f"PDF file: {Path(file_path).name} (PDF extraction failed: {e})"
+            with Path(file_path).open("rb") as f:
+                reader = PyPDF2.PdfReader(f)
+                for number, page in enumerate(reader.pages, start=1):
+                    yield number, (page.extract_text() or "") + "\n"
 
         elif file_type in [".docx", ".doc"]:
             # Try to extract from Word documents
             if docx is None:
                 activity.logger.warning("python-docx not available for Word extraction")
-                return (
-                    f"Word document: {Path(file_path).name} (text extraction requires python-docx)"
-                )
+                yield None, f"Word document: {name} (text extraction requires python-docx)"
+                return
 
-            try:
-                doc = docx.Document(file_path)
-                text = ""
-                for paragraph in doc.paragraphs:
-                    text += paragraph.text + "\n"
-                return text
-            except Exception as e:
-                activity.logger.warning(f"Word extraction failed: {e}")
-                return f"Word document: {Path(file_path).name} (Word extraction failed: {e})"
+            doc = docx.Document(file_path)
+            for paragraph in doc.paragraphs:
+                yield None, paragraph.text + "\n"
 
         elif file_type in [".xlsx", ".xls"]:
             # Try to extract from Excel
             if pd is None:
                 activity.logger.warning("pandas not available for Excel extraction")
-                return f"Excel file: {Path(file_path).name} (text extraction requires pandas)"
+                yield None, f"Excel file: {name} (text extraction requires pandas)"
+                return
 
-            try:
-                df = pd.read_excel(file_path)
-                return df.to_string()
-            except Exception as e:
-                activity.logger.warning(f"Excel extraction failed: {e}")
-                return f"Excel file: {Path(file_path).name} (Excel extraction failed: {e})"
+            df = pd.read_excel(file_path)
+            for start in range(0, len(df), _SHEET_ROWS_PER_SEGMENT):
+                rows = df.iloc[start : start + _SHEET_ROWS_PER_SEGMENT]
+                yield None, rows.to_string(header=start == 0) + "\n"
 
         else:
             # Unsupported file type - try reading as plain text
-            try:
-                with Path(file_path).open(encoding="utf-8", errors="ignore") as f:
-                    content = f.read()
-                    if content.strip():
-                        return content
-                    else:
-                        return f"Binary or empty file: {Path(file_path).name}"
-            except Exception:
-                return f"Unsupported file type: {file_type}"
-
+            has_content = False
+            with Path(file_path).open(encoding="utf-8", errors="ignore") as f:
+                while block := f.read(_TEXT_BLOCK_CHARS):
+                    has_content = has_content or bool(block.strip())
+                    yield None, block
+            if not has_content:
+                yield None, f"Binary or empty file: {name}"
+
+    except MemoryError:
+        raise
     except Exception as e:
-        activity.logger.error(f"Text extraction failed for {file_path}: {e}")
-        return f"Text extraction failed: {e!s}"
+        activity.logger.warning(f"Text extraction failed for {name}: {e}")
+        raise ExtractionError(f"{type(e).__name__}: {e}") from e
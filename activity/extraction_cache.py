@@ -0,0 +1,161 @@
+"""
+Content-addressed cache of extracted document text.
+
+Entries are keyed by the SHA-256 of the file bytes plus an extraction key
+(extractor version, size cap, available parsers and file type), so a
+re-uploaded or retried document skips parsing entirely while any change to
+the file or the extractor misses the cache. Only completed extractions are
+stored. Entries are gzip-compressed JSON holding the text and page count,
+stored on local disk or in a MinIO bucket.
+"""
+
+import gzip
+import hashlib
+from io import BytesIO
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+
+try:
+    from minio.error import S3Error
+except ImportError:
+    S3Error = Exception
+
+logger = logging.getLogger(__name__)
+
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file's bytes, read in blocks"""
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as f:
+        while block := f.read(_HASH_BLOCK_BYTES):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode(text: str, pages: int) -> bytes:
+    return gzip.compress(json.dumps({"text": text, "pages": pages}).encode("utf-8"))
+
+
+def _decode(payload: bytes) -> tuple[str, int]:
+    entry = json.loads(gzip.decompress(payload))
+    return entry["text"], entry["pages"]
+
+
+class LocalExtractionCache:
+    """Extraction cache in a local directory, pruned oldest-first beyond ``max_bytes``"""
+
+    def __init__(self, directory: str, max_bytes: int = 2 * 1024**3):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        # Two-level fan-out keeps directories small
+        return self.directory / key[:2] / f"{key}.json.gz"
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        path = self._path(key)
+        try:
+            payload = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # Mark as recently used for pruning
+        return _decode(payload)
+
+    def put(self, key: str, text: str, pages: int) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(_encode(text, pages))
+        os.replace(tmp_path, path)
+        self._prune()
+
+    def _prune(self) -> None:
+        with self._lock:
+            entries = [(p.stat(), p) for p in self.directory.glob("*/*.json.gz")]
+            total = sum(stat.st_size for stat, _ in entries)
+            for stat, path in sorted(entries, key=lambda entry: entry[0].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+
+
+class MinioExtractionCache:
+    """Extraction cache in a MinIO bucket, shared by every worker"""
+
+    def __init__(self, client, bucket_name: str = "extraction-cache"):
+        from activity.storage_activities import ensure_bucket
+
+        self.client = client
+        self.bucket_name = bucket_name
+        ensure_bucket(client, bucket_name)
+
+    def get(self, key: str) -> tuple[str, int] | None:
+        try:
+            response = self.client.get_object(self.bucket_name, f"{key}.json.gz")
+        except S3Error as e:
+            if e.code == "NoSuchKey":
+                return None
+            raise
+        try:
+            return _decode(response.read())
+        finally:
+            response.close()
+            response.release_conn()
+
+    def put(self, key: str, text: str, pages: int) -> None:
+        payload = _encode(text, pages)
+        self.client.put_object(
+            self.bucket_name,
+            f"{key}.json.gz",
+            BytesIO(payload),
+            length=len(payload),
+            content_type="application/gzip",
+        )
+
+
+_cache = None
+_cache_loaded = False
+_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> LocalExtractionCache | MinioExtractionCache | None:
+    """
+    Process-wide extraction cache from the application settings (None when disabled).
+
+    ``extraction_cache`` selects "local" (``extraction_cache_dir``), "minio"
+    (MINIO_ENDPOINT / MINIO_ACCESS_KEY / MINIO_SECRET_KEY) or "off". A cache
+    that cannot be set up is disabled with a warning.
+    """
+    global _cache, _cache_loaded
+
+    with _cache_lock:
+        if not _cache_loaded:
+            from shared.config import get_settings
+
+            settings = get_settings()
+            try:
+                if settings.extraction_cache == "local":
+                    _cache = LocalExtractionCache(
+                        settings.extraction_cache_dir,
+                        settings.extraction_cache_max_mb * 1024 * 1024,
+                    )
+                elif settings.extraction_cache == "minio":
+                    # Shares the pooled client used by the storage activities
+                    from activity.storage_activities import get_minio_client
+
+                    _cache = MinioExtractionCache(get_minio_client())
+            except Exception as e:
+                logger.warning(f"Extraction cache disabled: {e}")
+                _cache = None
+            _cache_loaded = True
+        return _cache
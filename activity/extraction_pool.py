@@ -0,0 +1,132 @@
+"""
+Bounded process pool for CPU-bound document parsing.
+
+PyPDF2, python-docx and pandas parse synchronously and hold the GIL, so running
+them on the worker's event loop (or in a thread) stalls every other activity.
+Each parse runs in its own child process instead: at most ``max_workers`` at a
+time, killed after ``timeout_seconds`` and capped at ``memory_limit_mb`` of
+address space, so a pathological file fails alone instead of taking the
+worker down with it.
+"""
+
+import logging
+import multiprocessing
+import threading
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; memory limits are skipped there
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# File types whose parsers are CPU-bound; everything else is streamed in a thread
+POOLED_FILE_TYPES = (".pdf", ".docx", ".doc", ".xlsx", ".xls")
+
+
+class ExtractionError(Exception):
+    """Extraction in the child process failed, timed out or ran out of memory"""
+
+
+def _start_method() -> str:
+    # Forking a multi-threaded asyncio worker is unsafe; forkserver is the cheap safe option
+    return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _extract_in_child(conn, file_path: str, max_chars: int, memory_limit_mb: int) -> None:
+    """Child process entry point: parse the file and send back (status, payload)"""
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    try:
+        from activity.document_activities import _collect_text
+
+        conn.send(("ok", _collect_text(file_path, max_chars)))
+    except MemoryError:
+        conn.send(("error", f"exceeded the {memory_limit_mb} MB extraction memory limit"))
+    except ExtractionError as e:
+        conn.send(("error", str(e)))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class ExtractionPool:
+    """Runs extractions in child processes with bounded concurrency, timeouts and memory caps"""
+
+    def __init__(
+        self, max_workers: int = 2, timeout_seconds: float = 120.0, memory_limit_mb: int = 1024
+    ):
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._context = multiprocessing.get_context(_start_method())
+
+    def extract(self, file_path: str, max_chars: int) -> tuple[str, int]:
+        """
+        Extract a file's text in a child process (blocking; call from a thread).
+
+        Args:
+            file_path: Document to parse
+            max_chars: Extraction size cap
+
+        Returns:
+            The extracted text and page count (0 when unknown)
+
+        Raises:
+            ExtractionError: If the parse fails, times out or exceeds the memory limit
+        """
+        with self._slots:
+            receiver, sender = self._context.Pipe(duplex=False)
+            process = self._context.Process(
+                target=_extract_in_child,
+                args=(sender, file_path, max_chars, self.memory_limit_mb),
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+
+            try:
+                if not receiver.poll(self.timeout_seconds):
+                    raise ExtractionError(f"timed out after {self.timeout_seconds:.0f}s")
+                status, payload = receiver.recv()
+            except EOFError as e:
+                # The child died without answering (e.g. killed for memory)
+                raise ExtractionError(f"extraction process exited with {process.exitcode}") from e
+            finally:
+                receiver.close()
+                if process.is_alive():
+                    process.kill()
+                process.join()
+
+        if status != "ok":
+            raise ExtractionError(payload)
+        return payload
+
+
+_pool: ExtractionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Process-wide extraction pool, sized from the application settings on first use"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            from shared.config import get_settings
+
+            settings = get_settings()
+            _pool = ExtractionPool(
+                max_workers=settings.extraction_workers,
+                timeout_seconds=settings.extraction_timeout_seconds,
+                memory_limit_mb=settings.extraction_memory_limit_mb,
+            )
+            logger.info(
+                f"Extraction pool: {_pool.max_workers} processes, "
+                f"{_pool.timeout_seconds:.0f}s timeout, {_pool.memory_limit_mb} MB limit"
+            )
+        return _pool
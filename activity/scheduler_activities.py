@@ -290,3 +290,45 @@ async def health_check_external_services() -> ScheduledTaskResult:
             success=False,
             results={"error": str(e), "services_checked": 0},
         )
+
+
+@activity.defn
+async def deactivate_idle_vector_tenants(idle_seconds: float | None = None) -> ScheduledTaskResult:
+    """
+    Periodic unloading of Weaviate tenants that no worker has used recently.
+    Idleness comes from the shared tenant usage collection, so any worker can run it.
+    """
+    task_id = f"idle-tenants-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+    execution_time = datetime.now()
+
+    try:
+        # Imported here to keep workflow sandbox imports light
+        from service.vector_store import get_vector_store_registry
+
+        registry = get_vector_store_registry()
+        if registry.weaviate_config is None:
+            deactivated = []
+            logger.info("Weaviate is not configured, no tenants to deactivate")
+        else:
+            store = await registry.async_weaviate_store()
+            deactivated = await store.deactivate_idle_tenants(idle_seconds)
+
+        return ScheduledTaskResult(
+            task_id=task_id,
+            task_type="idle_tenant_deactivation",
+            execution_time=execution_time,
+            success=True,
+            results={"deactivated_tenants": deactivated, "count": len(deactivated)},
+            next_execution=execution_time + timedelta(hours=1),  # Hourly
+        )
+
+    except Exception as e:
+        logger.error(f"Idle tenant deactivation failed: {e}")
+
+        return ScheduledTaskResult(
+            task_id=task_id,
+            task_type="idle_tenant_deactivation",
+            execution_time=execution_time,
+            success=False,
+            results={"error": str(e)},
+        )
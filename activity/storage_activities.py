@@ -3,20 +3,85 @@ Storage activities with single responsibility for MinIO operations.
 Maintains separation of concerns - only handles storage, not analysis.
 """
 
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime
+import hashlib
 from io import BytesIO
 import logging
 import os
 from pathlib import Path
+import shutil
 import tempfile
+import threading
+import time
 from typing import Any
+import uuid
+import weakref
 
 from minio import Minio
 from minio.error import S3Error
 from temporalio import activity
+import urllib3
 
 logger = logging.getLogger(__name__)
 
+# S3 multipart uploads require parts of at least 5 MiB
+_MIN_PART_SIZE_MB = 5
+
+_clients: dict[tuple[str, str, str], Minio] = {}
+_known_buckets: weakref.WeakKeyDictionary[Minio, set[str]] = weakref.WeakKeyDictionary()
+_minio_lock = threading.Lock()
+
+
+def get_minio_client(
+    endpoint: str | None = None, access_key: str | None = None, secret_key: str | None = None
+) -> Minio:
+    """
+    Shared MinIO client for an endpoint and credentials (MINIO_* env vars by default).
+
+    Clients are created once per process and share one pooled urllib3 connection
+    manager (``MINIO_MAX_CONNECTIONS``, default 20), so activities reuse warm
+    connections instead of setting up a client per call.
+    """
+    endpoint = endpoint or os.getenv("MINIO_ENDPOINT", "localhost:9000")
+    access_key = access_key or os.getenv("MINIO_ACCESS_KEY", "minioadmin")
+    secret_key = secret_key or os.getenv("MINIO_SECRET_KEY", "minioadmin")
+    key = (endpoint, access_key, secret_key)
+
+    with _minio_lock:
+        if key not in _clients:
+            http_client = urllib3.PoolManager(
+                maxsize=int(os.getenv("MINIO_MAX_CONNECTIONS", "20")),
+                timeout=urllib3.Timeout(connect=10, read=300),
+                retries=urllib3.Retry(
+                    total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]
+                ),
+            )
+            _clients[key] = Minio(
+                endpoint,
+                access_key=access_key,
+                secret_key=secret_key,
+                secure=False,
+                http_client=http_client,
+            )
+            logger.info(f"MinIO storage client initialized: {endpoint}")
+        return _clients[key]
+
+
+def ensure_bucket(client: Minio, bucket_name: str) -> None:
+    """Create the bucket if missing, checking each client and bucket only once per process"""
+    with _minio_lock:
+        if bucket_name in _known_buckets.get(client, ()):
+            return
+
+    if not client.bucket_exists(bucket_name):
+        client.make_bucket(bucket_name)
+        logger.info(f"Created MinIO bucket: {bucket_name}")
+
+    with _minio_lock:
+        _known_buckets.setdefault(client, set()).add(bucket_name)
+
 
 class StorageActivities:
     """Storage activities focused solely on MinIO operations."""
@@ -27,23 +92,54 @@ class StorageActivities:
         self.minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin")
         self.minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin")
         self.bucket_name = "documents"
+        # Large files move in parts of this size, several uploaded at once
+        self.part_size = (
+            max(_MIN_PART_SIZE_MB, int(os.getenv("MINIO_PART_SIZE_MB", "16"))) * 1024 * 1024
+        )
+        self.parallel_uploads = max(1, int(os.getenv("MINIO_PARALLEL_UPLOADS", "4")))
+
+        # Local fallback storage when MinIO is unavailable, pruned to stay bounded
+        self.spill_dir = Path(
+            os.getenv("MINIO_SPILL_DIR", Path(tempfile.gettempdir()) / "document-spill")
+        )
+        self.spill_max_bytes = int(os.getenv("MINIO_SPILL_MAX_MB", "2048")) * 1024 * 1024
+        self.spill_ttl_seconds = float(os.getenv("MINIO_SPILL_TTL_HOURS", "24")) * 3600
+        self._spill_lock = threading.Lock()
+
+        # A failed connection is retried at most this often, not given up for good
+        self.reconnect_seconds = float(os.getenv("MINIO_RECONNECT_SECONDS", "30"))
+        self._connect_lock = threading.Lock()
+        self.minio_client: Minio | None = None
+        self._connect()
 
+    def _connect(self) -> None:
+        """Set up the MinIO client and bucket; on failure fall back to temp files for now"""
+        self._last_connect_attempt = time.monotonic()
         try:
-            self.minio_client = Minio(
-                self.minio_endpoint,
-                access_key=self.minio_access_key,
-                secret_key=self.minio_secret_key,
-                secure=False,
+            client = get_minio_client(
+                self.minio_endpoint, self.minio_access_key, self.minio_secret_key
             )
-            # Ensure bucket exists
-            if not self.minio_client.bucket_exists(self.bucket_name):
-                self.minio_client.make_bucket(self.bucket_name)
-                logger.info(f"Created MinIO bucket: {self.bucket_name}")
-
-            logger.info(f"MinIO storage client initialized: {self.minio_endpoint}")
+            ensure_bucket(client, self.bucket_name)
         except Exception as e:
             logger.warning(f"Failed to initialize MinIO client: {e}. Using temp files.")
-            self.minio_client = None
+            return
+        self.minio_client = client
+
+    def _reconnect(self) -> bool:
+        """
+        Retry a failed MinIO setup once ``reconnect_seconds`` have passed.
+
+        Returns whether a client is available. Blocks on the network, so async
+        activities call it in a thread.
+        """
+        with self._connect_lock:
+            if self.minio_client is None and (
+                time.monotonic() - self._last_connect_attempt >= self.reconnect_seconds
+            ):
+                self._connect()
+                if self.minio_client is not None:
+                    logger.info("MinIO client reconnected")
+        return self.minio_client is not None
 
     @activity.defn
     async def store_document_in_minio(
@@ -60,16 +156,19 @@ class StorageActivities:
         storage_path = f"documents/{document_type}/{timestamp}_{filename}"
         document_size = len(document_data)
 
-        if self.minio_client:
+        if self.minio_client or await asyncio.to_thread(self._reconnect):
             try:
-                # Store in MinIO
+                # Store in MinIO, off the event loop: multipart uploads block for a while
                 data = BytesIO(document_data)
-                result = self.minio_client.put_object(
+                result = await asyncio.to_thread(
+                    self.minio_client.put_object,
                     bucket_name=self.bucket_name,
                     object_name=storage_path,
                     data=data,
                     length=document_size,
                     content_type=self._get_content_type(filename),
+                    part_size=self.part_size,
+                    num_parallel_uploads=self.parallel_uploads,
                 )
 
                 logger.info(f"✅ Document stored in MinIO: {storage_path} ({document_size} bytes)")
@@ -89,8 +188,7 @@ class StorageActivities:
                 raise
         else:
             # Fallback to temporary file storage for processing
-            temp_dir = tempfile.mkdtemp()
-            temp_file_path = Path(temp_dir) / filename
+            temp_file_path = self._spill_path(filename, document_size)
 
             with open(temp_file_path, "wb") as f:
                 f.write(document_data)
@@ -107,13 +205,127 @@ class StorageActivities:
                 "local_file_path": str(temp_file_path),
             }
 
+    @activity.defn
+    async def store_document_file_in_minio(
+        self, file_path: str, document_type: str, filename: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Store a document from a local file with a streaming multipart upload.
+
+        Only the path travels through Temporal and the file is read part by part,
+        so large documents never sit in worker memory. Prefer this over
+        store_document_in_minio for anything but small in-memory payloads.
+        """
+        source = Path(file_path)
+        filename = filename or source.name
+        document_size = source.stat().st_size
+        logger.info(f"Storing document file: {filename} ({document_size} bytes)")
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        storage_path = f"documents/{document_type}/{timestamp}_{filename}"
+
+        if self.minio_client or await asyncio.to_thread(self._reconnect):
+            try:
+                result = await asyncio.to_thread(
+                    self.minio_client.fput_object,
+                    bucket_name=self.bucket_name,
+                    object_name=storage_path,
+                    file_path=str(source),
+                    content_type=self._get_content_type(filename),
+                    part_size=self.part_size,
+                    num_parallel_uploads=self.parallel_uploads,
+                )
+            except S3Error as e:
+                logger.error(f"MinIO storage error: {e}")
+                raise
+
+            logger.info(f"✅ Document stored in MinIO: {storage_path} ({document_size} bytes)")
+            return {
+                "storage_path": storage_path,
+                "bucket": self.bucket_name,
+                "size_bytes": document_size,
+                "etag": result.etag,
+                "stored_at": datetime.now().isoformat(),
+                "storage_type": "minio",
+                "file_path": f"minio://{self.bucket_name}/{storage_path}",
+                "local_file_path": str(source),
+            }
+
+        # Fallback to temporary file storage, copied in blocks
+        temp_file_path = self._spill_path(filename, document_size)
+        await asyncio.to_thread(shutil.copyfile, source, temp_file_path)
+        logger.info(f"✅ Document stored temporarily: {temp_file_path} ({document_size} bytes)")
+        return {
+            "storage_path": storage_path,
+            "bucket": "temp",
+            "size_bytes": document_size,
+            "stored_at": datetime.now().isoformat(),
+            "storage_type": "temp_file",
+            "file_path": str(temp_file_path),
+            "local_file_path": str(temp_file_path),
+        }
+
+    @activity.defn
+    async def retrieve_document_to_file(
+        self, storage_path: str, destination: str | None = None
+    ) -> str:
+        """
+        Download a document from MinIO to a local file, streamed in parts.
+
+        ``storage_path`` is a path in the documents bucket or a ``minio://``
+        reference as returned by the store activities. Without a destination the
+        document lands in the spill directory; the caller removes it when done.
+
+        Returns the destination path; use this instead of
+        retrieve_document_from_minio for documents too large to hold in memory.
+        """
+        if not (self.minio_client or await asyncio.to_thread(self._reconnect)):
+            raise RuntimeError("MinIO client not available for document retrieval")
+
+        bucket, object_name = self._object_location(storage_path)
+
+        def download() -> str:
+            target = destination
+            if target is None:
+                size = self.minio_client.stat_object(bucket, object_name).size
+                target = str(self._spill_path(Path(object_name).name, size))
+            # fget_object writes to a temporary part file and renames it when complete
+            self.minio_client.fget_object(
+                bucket_name=bucket, object_name=object_name, file_path=target
+            )
+            return target
+
+        try:
+            target = await asyncio.to_thread(download)
+        except S3Error as e:
+            logger.error(f"MinIO retrieval error: {e}")
+            raise
+
+        logger.info(f"✅ Document retrieved from MinIO: {storage_path} -> {target}")
+        return target
+
+    def iter_document(self, storage_path: str) -> Iterator[bytes]:
+        """Stream a stored document in part-sized chunks (helper for use inside activities)"""
+        if not (self.minio_client or self._reconnect()):
+            raise RuntimeError("MinIO client not available for document retrieval")
+
+        response = self.minio_client.get_object(self.bucket_name, storage_path)
+        try:
+            yield from response.stream(self.part_size)
+        finally:
+            response.close()
+            response.release_conn()
+
     @activity.defn
     async def retrieve_document_from_minio(self, storage_path: str) -> bytes:
         """
         Retrieve document from MinIO.
         Single responsibility: retrieval only.
+
+        Returns the whole document through Temporal; use retrieve_document_to_file
+        or iter_document for large documents.
         """
-        if self.minio_client:
+        if self.minio_client or await asyncio.to_thread(self._reconnect):
             try:
                 response = self.minio_client.get_object(self.bucket_name, storage_path)
                 data = response.read()
@@ -128,6 +340,102 @@ class StorageActivities:
         else:
             raise RuntimeError("MinIO client not available for document retrieval")
 
+    def store_text(self, text: str) -> dict[str, Any] | None:
+        """
+        Store extracted text under its SHA-256 (claim check for large payloads).
+
+        Content addressing makes retries idempotent and lets identical documents
+        share one object.
+
+        Returns:
+            Reference, character count and hash, or None when MinIO is unavailable
+        """
+        if not (self.minio_client or self._reconnect()):
+            return None
+
+        data = text.encode("utf-8")
+        sha256 = hashlib.sha256(data).hexdigest()
+        storage_path = f"extracted/{sha256}.txt"
+        self.minio_client.put_object(
+            bucket_name=self.bucket_name,
+            object_name=storage_path,
+            data=BytesIO(data),
+            length=len(data),
+            content_type="text/plain; charset=utf-8",
+        )
+        logger.info(f"✅ Extracted text stored in MinIO: {storage_path} ({len(data)} bytes)")
+        return {
+            "ref": f"minio://{self.bucket_name}/{storage_path}",
+            "chars": len(text),
+            "sha256": sha256,
+        }
+
+    def load_text(self, ref: str, sha256: str | None = None) -> str:
+        """
+        Load text stored by store_text, verifying its hash when given.
+
+        Raises:
+            RuntimeError: If MinIO is unavailable
+            ValueError: If the reference is malformed or the content does not match
+        """
+        if not (self.minio_client or self._reconnect()):
+            raise RuntimeError("MinIO client not available for text retrieval")
+
+        bucket, _, storage_path = ref.removeprefix("minio://").partition("/")
+        if not ref.startswith("minio://") or not storage_path:
+            raise ValueError(f"Invalid text reference: {ref}")
+
+        response = self.minio_client.get_object(bucket, storage_path)
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+        if sha256 and hashlib.sha256(data).hexdigest() != sha256:
+            raise ValueError(f"Content hash mismatch for {ref}")
+        return data.decode("utf-8")
+
+    def _object_location(self, storage_path: str) -> tuple[str, str]:
+        """Bucket and object name for a ``minio://`` reference or a documents bucket path"""
+        if not storage_path.startswith("minio://"):
+            return self.bucket_name, storage_path
+        bucket, _, object_name = storage_path.removeprefix("minio://").partition("/")
+        if not object_name:
+            raise ValueError(f"Invalid storage reference: {storage_path}")
+        return bucket, object_name
+
+    def _spill_path(self, filename: str, size: int) -> Path:
+        """
+        Path in the spill directory for a fallback copy, after removing expired copies.
+
+        Only copies older than the TTL are removed: newer ones may still be read by
+        the activities they were returned to.
+
+        Raises:
+            RuntimeError: If ``size`` more bytes do not fit under ``spill_max_bytes``
+        """
+        with self._spill_lock:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+            expired_before = time.time() - self.spill_ttl_seconds
+            total = 0
+            for path in self.spill_dir.iterdir():
+                if not path.is_file():
+                    continue
+                stat = path.stat()
+                if stat.st_mtime < expired_before:
+                    path.unlink(missing_ok=True)
+                else:
+                    total += stat.st_size
+
+            if total + size > self.spill_max_bytes:
+                raise RuntimeError(
+                    f"No room for {filename} ({size} bytes) in the spill directory: "
+                    f"{total} of {self.spill_max_bytes} bytes held by unexpired copies"
+                )
+            # Unique prefix: documents with the same name must not overwrite each other
+            return self.spill_dir / f"{uuid.uuid4().hex[:12]}_{filename}"
+
     def _get_content_type(self, filename: str) -> str:
         """Determine content type based on file extension."""
         ext = Path(filename).suffix.lower()
@@ -140,3 +448,22 @@ class StorageActivities:
             ".csv": "text/csv",
         }
         return content_types.get(ext, "application/octet-stream")
+
+
+_storage: StorageActivities | None = None
+_storage_lock = threading.Lock()
+
+
+def get_storage_activities() -> StorageActivities:
+    """
+    Process-wide StorageActivities for helpers that run inside other activities.
+
+    The instance is kept even when MinIO was unreachable at startup; it retries
+    the connection on use (see StorageActivities._reconnect).
+    """
+    global _storage
+
+    with _storage_lock:
+        if _storage is None:
+            _storage = StorageActivities()
+        return _storage
@@ -4,7 +4,6 @@ These activities handle all AI operations that require OpenAI API calls.
 """
 
 from datetime import datetime
-from pathlib import Path
 
 from temporalio import activity
 
@@ -14,6 +13,9 @@ from activity.document_activities import (
     DocumentSummaryResult,
     DocumentSummaryWorkflowResult,
     SimpleResearchResult,
+    failed_summary,
+    resolve_extracted_text,
+    summary_from_analysis,
 )
 from agent_activity.core.writer_agent import (
     ReportData,
@@ -40,6 +42,9 @@ async def analyze_document_content(document_info: DocumentInfo) -> DocumentSumma
         # Create an agent to analyze the document
         research_agent = new_writer_agent()
 
+        # Claim-checked documents carry only a reference; load the text here
+        extracted_text = await resolve_extracted_text(document_info)
+
         # Create prompt for document analysis
         analysis_prompt = f"""
         Please analyze the following document and provide a comprehensive summary:
@@ -47,7 +52,7 @@ async def analyze_document_content(document_info: DocumentInfo) -> DocumentSumma
         Document: {document_info.file_name}
         Type: {document_info.file_type}
         Content:
-        {document_info.extracted_text}
+        {extracted_text}
 
         Please provide:
         1. A short summary (2-3 sentences)
@@ -91,6 +96,10 @@ async def generate_document_summary(file_path: str) -> DocumentSummaryWorkflowRe
     """
     Quick document summary for immediate admin UI display.
     Combines document processing + summary generation for fast user feedback.
+
+    Only for callers that need the summary alone: it extracts and analyzes the
+    document itself. Workflows that also run analyze_document_content should
+    derive the summary from that result with summary_from_analysis instead.
     """
 
     activity.logger.info(f"Generating quick summary for: {file_path}")
@@ -105,15 +114,7 @@ async def generate_document_summary(file_path: str) -> DocumentSummaryWorkflowRe
         analysis_result = await analyze_document_content(document_info)
 
         # Convert to workflow result format for UI
-        workflow_result = DocumentSummaryWorkflowResult(
-            document_name=document_info.file_name,
-            document_type=document_info.file_type,
-            summary_text=analysis_result.short_summary,
-            key_points=analysis_result.key_takeaways,
-            topics=analysis_result.main_topics,
-            processing_time=datetime.now().isoformat(),
-            success=True,
-        )
+        workflow_result = summary_from_analysis(analysis_result, datetime.now().isoformat())
 
         activity.logger.info(f"Quick summary completed for: {file_path}")
         return workflow_result
@@ -123,16 +124,7 @@ async def generate_document_summary(file_path: str) -> DocumentSummaryWorkflowRe
         activity.logger.error(error_msg)
 
         # Return error result for UI
-        return DocumentSummaryWorkflowResult(
-            document_name=Path(file_path).name,
-            document_type="unknown",
-            summary_text=f"Error: {error_msg}",
-            key_points=[],
-            topics=[],
-            processing_time=datetime.now().isoformat(),
-            success=False,
-            error_message=error_msg,
-        )
+        return failed_summary(file_path, error_msg, datetime.now().isoformat())
 
 
 @activity.defn
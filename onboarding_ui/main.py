@@ -1,10 +1,15 @@
 
+import asyncio
 import os
+import shutil
 from fastapi import FastAPI, Request, UploadFile, File
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 from temporalio.client import Client
-from workflow.document_processing_workflow import DocumentProcessingWorkflow
+from workflow.document_processing_workflow import (
+    DocumentProcessingRequest,
+    DocumentProcessingWorkflow,
+)
 
 app = FastAPI()
 templates = Jinja2Templates(directory="templates")
@@ -19,14 +24,15 @@ async def get_form(request: Request):
 async def upload_document(organization: str, user: str, file: UploadFile = File(...)):
     client = await Client.connect(os.getenv("TEMPORAL_GRPC_ENDPOINT"))
     
-    # Save file to a temporary location
+    # Save file to a temporary location, copied in blocks rather than read whole;
+    # the workflow streams it on to MinIO
     temp_file_path = f"/tmp/{file.filename}"
     with open(temp_file_path, "wb") as buffer:
-        buffer.write(await file.read())
+        await asyncio.to_thread(shutil.copyfileobj, file.file, buffer)
 
     await client.start_workflow(
         DocumentProcessingWorkflow.run,
-        {"organization": organization, "user": user, "file_path": temp_file_path},
+        DocumentProcessingRequest(file_paths=[temp_file_path], organization_name=organization),
         id=f"doc-processing-{organization}-{user}-{file.filename}",
         task_queue="main-task-queue",
     )
@@ -1,18 +1,60 @@
 """Vector store services for semantic and graph-based document retrieval."""
 
-from .compound_service import CompoundStoreConfig, CompoundVectorStore, SearchStrategy
-from .neo4j_service import Neo4jConfig, Neo4jStore
-from .ports import IHybridVectorStore, IVectorStore
-from .weaviate_service import WeaviateConfig, WeaviateStore
+from .cache_service import CachedVectorStore, QueryCacheConfig
+from .compound_service import (
+    AsyncCompoundVectorStore,
+    CompoundStoreConfig,
+    CompoundVectorStore,
+    SearchStrategy,
+)
+from .ingestion import DocumentDelta, DocumentIngestionStats, plan_document, upsert_document
+from .neo4j_service import AsyncNeo4jStore, IngestionStats, Neo4jConfig, Neo4jStore
+from .numpy_service import NumpyConfig, NumpyStore
+from .ports import (
+    IAsyncEmbeddingStore,
+    IAsyncHybridVectorStore,
+    IAsyncVectorStore,
+    IEmbeddingStore,
+    IHybridVectorStore,
+    IReindexableStore,
+    IVectorStore,
+)
+from .registry import VectorStoreRegistry, close_vector_store_registry, get_vector_store_registry
+from .reindex import FileCheckpointStore, ReindexJob, ReindexStats, reconcile_stores
+from .weaviate_service import AsyncWeaviateStore, WeaviateConfig, WeaviateStore
 
 __all__ = [
+    "AsyncCompoundVectorStore",
+    "AsyncNeo4jStore",
+    "AsyncWeaviateStore",
+    "CachedVectorStore",
     "CompoundStoreConfig",
     "CompoundVectorStore",
+    "DocumentDelta",
+    "DocumentIngestionStats",
+    "FileCheckpointStore",
+    "IAsyncEmbeddingStore",
+    "IAsyncHybridVectorStore",
+    "IAsyncVectorStore",
+    "IEmbeddingStore",
     "IHybridVectorStore",
+    "IReindexableStore",
     "IVectorStore",
+    "IngestionStats",
     "Neo4jConfig",
     "Neo4jStore",
+    "NumpyConfig",
+    "NumpyStore",
+    "QueryCacheConfig",
+    "ReindexJob",
+    "ReindexStats",
     "SearchStrategy",
+    "VectorStoreRegistry",
     "WeaviateConfig",
     "WeaviateStore",
+    "close_vector_store_registry",
+    "get_vector_store_registry",
+    "plan_document",
+    "reconcile_stores",
+    "upsert_document",
 ]
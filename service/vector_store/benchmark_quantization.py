@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Recall-vs-memory report for embedding truncation and vector quantization.
+
+Evaluates every combination of truncated dimensions and quantization method
+(none / sq / bq / pq) against exact full-precision search and writes a JSON
+report. Without --vectors it uses a synthetic corpus whose variance decays
+along the dimensions, roughly like Matryoshka-trained embeddings; pass real
+embeddings exported as .npy for numbers that reflect production.
+
+Usage:
+    python benchmark_quantization.py
+    python benchmark_quantization.py --vectors chunks.npy --queries queries.npy \\
+        --dimensions 1536 1024 512 256 --output quantization_report.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np  # noqa: E402
+
+from service.vector_store.quantization import (  # noqa: E402
+    QUANTIZATION_METHODS,
+    recall_memory_report,
+)
+
+
+def synthetic_embeddings(count: int, dimensions: int, seed: int) -> np.ndarray:
+    """Clustered vectors with decaying per-dimension variance."""
+    rng = np.random.default_rng(seed)
+    decay = 1.0 / np.sqrt(1.0 + np.arange(dimensions) / 32.0)
+    centers = rng.standard_normal((max(1, count // 50), dimensions)) * decay
+    members = centers[rng.integers(0, len(centers), count)]
+    return (members + 0.5 * rng.standard_normal((count, dimensions)) * decay).astype(np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--vectors", type=Path, help=".npy corpus embeddings")
+    parser.add_argument("--queries", type=Path, help=".npy query embeddings")
+    parser.add_argument("--corpus-size", type=int, default=5000)
+    parser.add_argument("--query-count", type=int, default=200)
+    parser.add_argument("--embedding-dimensions", type=int, default=1536)
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[1536, 1024, 512, 256])
+    parser.add_argument("--methods", nargs="+", default=list(QUANTIZATION_METHODS))
+    parser.add_argument("--pq-segments", type=int, default=None)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    args = parser.parse_args()
+
+    if args.vectors:
+        corpus = np.load(args.vectors)
+        queries = np.load(args.queries) if args.queries else corpus[: args.query_count]
+    else:
+        corpus = synthetic_embeddings(args.corpus_size, args.embedding_dimensions, args.seed)
+        # Queries are perturbed corpus members, like paraphrases of indexed text
+        rng = np.random.default_rng(args.seed + 1)
+        picks = corpus[rng.integers(0, len(corpus), args.query_count)]
+        queries = picks + 0.3 * rng.standard_normal(picks.shape).astype(np.float32)
+
+    report = {
+        "corpus_size": len(corpus),
+        "query_count": len(queries),
+        "embedding_dimensions": int(corpus.shape[1]),
+        "synthetic": args.vectors is None,
+        "settings": recall_memory_report(
+            corpus, queries, args.dimensions, tuple(args.methods), args.k, args.pq_segments
+        ),
+    }
+
+    print(f"{'dims':>6} {'quant':>6} {'recall@k':>9} {'bytes/vec':>10} {'MB':>9} {'x':>6}")
+    for row in report["settings"]:
+        print(
+            f"{row['dimensions']:>6} {row['quantization']:>6} {row['recall_at_k']:>9.4f} "
+            f"{row['bytes_per_vector']:>10} {row['corpus_megabytes']:>9.3f} "
+            f"{row['compression']:>6.1f}"
+        )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n📄 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Vector store benchmark: ingestion throughput, search latency, recall and memory.
+
+Generates a synthetic clustered corpus of configurable size, ingests it through
+CompoundVectorStore and, for every SearchStrategy, measures p50/p95/p99 search
+latency and recall@k against exact (brute-force) cosine search. The corpus is
+regenerated document by document from the seed, so ground truth for 1M chunks
+never needs the whole corpus in memory.
+
+By default two in-process NumPy stores stand in for Neo4j and Weaviate, which
+benchmarks the compound layer itself; pass --backends neo4j weaviate to measure
+real services (memory figures are then client-side only). The JSON report is
+meant to be kept per release and diffed with --compare.
+
+Usage:
+    python benchmark_vector_stores.py --corpus-size 10000
+    python benchmark_vector_stores.py --backends neo4j weaviate --corpus-size 1000000 \\
+        --embedding-dimensions 768 --output bench_v2.json --compare bench_v1.json
+"""
+
+import argparse
+from datetime import datetime
+import json
+import logging
+from pathlib import Path
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np  # noqa: E402
+
+from service.vector_store.compound_service import (  # noqa: E402
+    CompoundVectorStore,
+    SearchStrategy,
+)
+from service.vector_store.identity import chunk_ids  # noqa: E402
+
+# Metrics compared by --compare, with the direction that counts as an improvement
+COMPARED_METRICS = {
+    "p50_ms": "lower",
+    "p95_ms": "lower",
+    "p99_ms": "lower",
+    "recall_at_k": "higher",
+    "queries_per_second": "higher",
+}
+
+
+class SyntheticCorpus:
+    """Documents of topic-clustered chunks, reproducible per document from the seed."""
+
+    def __init__(self, size: int, dimensions: int, chunks_per_document: int, seed: int):
+        self.size = size
+        self.dimensions = dimensions
+        self.chunks_per_document = chunks_per_document
+        self.seed = seed
+        self.document_count = -(-size // chunks_per_document)
+        topics = max(8, self.document_count // 20)
+        self.topics = np.random.default_rng(seed).standard_normal((topics, dimensions))
+
+    def title(self, document: int) -> str:
+        return f"Synthetic Document {document:07d}"
+
+    def document(self, document: int) -> tuple[list[str], np.ndarray]:
+        """Chunk texts and normalized float32 embeddings of one document."""
+        rng = np.random.default_rng((self.seed, document))
+        start = document * self.chunks_per_document
+        count = min(self.chunks_per_document, self.size - start)
+        topic = self.topics[rng.integers(len(self.topics))]
+        # Chunks of a document share a topic and drift from it, like sections of one text
+        vectors = topic + 0.8 * rng.standard_normal((count, self.dimensions))
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        texts = [f"document {document} chunk {i} of a synthetic corpus" for i in range(count)]
+        return texts, vectors.astype(np.float32)
+
+    def queries(self, count: int, noise: float = 0.5) -> np.ndarray:
+        """Perturbed corpus chunks, like paraphrases of indexed text."""
+        rng = np.random.default_rng(self.seed + 1)
+        queries = []
+        for document in rng.integers(0, self.document_count, count):
+            _, vectors = self.document(int(document))
+            chunk = vectors[rng.integers(len(vectors))]
+            perturbation = rng.standard_normal(self.dimensions) / np.sqrt(self.dimensions)
+            queries.append(chunk + noise * perturbation)
+        queries = np.asarray(queries, dtype=np.float32)
+        return queries / np.linalg.norm(queries, axis=1, keepdims=True)
+
+
+def rss_megabytes() -> float:
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if platform.system() == "Darwin" else peak / 1024
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(samples)
+    rank = max(1, int(np.ceil(pct / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+def ingest(store, corpus: SyntheticCorpus, tenant_id: str) -> dict:
+    """Upsert every document, timing each call."""
+    latencies = []
+    started = time.perf_counter()
+    for document in range(corpus.document_count):
+        texts, vectors = corpus.document(document)
+        call_started = time.perf_counter()
+        store.upsert_chunks(tenant_id, corpus.title(document), texts, vectors.tolist())
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+
+    return {
+        "chunks": corpus.size,
+        "documents": corpus.document_count,
+        "seconds": round(elapsed, 3),
+        "chunks_per_second": round(corpus.size / elapsed, 1),
+        "document_p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "document_p95_ms": round(percentile(latencies, 95) * 1000, 3),
+    }
+
+
+def exact_neighbours(
+    corpus: SyntheticCorpus, queries: np.ndarray, k: int, tenant_id: str
+) -> list[set[str]]:
+    """Exact top-k chunk ids per query, streaming the corpus document by document."""
+    best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+    best_ids = np.full((len(queries), k), "", dtype=object)
+
+    for document in range(corpus.document_count):
+        texts, vectors = corpus.document(document)
+        ids = np.asarray(chunk_ids(tenant_id, corpus.title(document), texts), dtype=object)
+        scores = np.concatenate([best_scores, queries @ vectors.T], axis=1)
+        candidates = np.concatenate([best_ids, np.broadcast_to(ids, scores[:, k:].shape)], axis=1)
+        keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, keep, axis=1)
+        best_ids = np.take_along_axis(candidates, keep, axis=1)
+
+    return [set(row) for row in best_ids]
+
+
+def benchmark_strategy(
+    store,
+    strategy: SearchStrategy,
+    queries: np.ndarray,
+    truth: list[set[str]],
+    k: int,
+    tenant_id: str,
+    warmup: int,
+) -> dict:
+    """Latency percentiles and recall@k for one strategy."""
+    query_lists = queries.tolist()
+    for query in query_lists[:warmup]:
+        store.search(tenant_id, query, k, strategy=strategy)
+
+    latencies, hits = [], 0
+    for query, expected in zip(query_lists, truth, strict=True):
+        started = time.perf_counter()
+        results = store.search(tenant_id, query, k, strategy=strategy)
+        latencies.append(time.perf_counter() - started)
+        hits += len(expected & {result.get("id") for result in results})
+
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(float(np.mean(latencies)) * 1000, 3),
+        "queries_per_second": round(len(latencies) / sum(latencies), 1),
+        "recall_at_k": round(hits / (k * len(truth)), 4),
+    }
+
+
+def build_store(args) -> CompoundVectorStore:
+    """Compound store over NumPy stand-ins or the real Neo4j and Weaviate services."""
+    if args.backends == ["numpy"]:
+        from service.vector_store.numpy_service import NumpyConfig, NumpyStore
+
+        def config():
+            return NumpyConfig(args.embedding_dimensions, max_chunks_per_tenant=args.corpus_size)
+
+        return CompoundVectorStore(
+            neo4j_store=NumpyStore(config()),
+            weaviate_store=NumpyStore(config()),
+            rerank_oversample=args.rerank_oversample,
+        )
+
+    neo4j_store = weaviate_store = None
+    if "neo4j" in args.backends:
+        from service.vector_store.neo4j_service import Neo4jConfig, Neo4jStore
+
+        neo4j_store = Neo4jStore(
+            Neo4jConfig(
+                uri=args.neo4j_uri,
+                user=args.neo4j_user,
+                password=args.neo4j_password,
+                vector_index="benchmark_embeddings",
+                node_label="BenchmarkDoc",
+            )
+        )
+        neo4j_store.ensure_vector_index(dimensions=args.embedding_dimensions)
+    if "weaviate" in args.backends:
+        from service.vector_store.weaviate_service import WeaviateConfig, WeaviateStore
+
+        weaviate_store = WeaviateStore(
+            WeaviateConfig(
+                url=args.weaviate_url,
+                collection_name="BenchmarkDoc",
+                embedding_dimensions=args.embedding_dimensions,
+            )
+        )
+
+    return CompoundVectorStore(
+        neo4j_store=neo4j_store,
+        weaviate_store=weaviate_store,
+        rerank_oversample=args.rerank_oversample,
+    )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(report: dict, baseline: dict) -> None:
+    """Per-strategy metric deltas against an earlier report."""
+    print(f"\n📈 Compared with {baseline.get('revision') or 'baseline'}:")
+    for strategy, metrics in report["strategies"].items():
+        previous = baseline.get("strategies", {}).get(strategy)
+        if not previous:
+            continue
+        changes = []
+        for metric, better in COMPARED_METRICS.items():
+            old, new = previous.get(metric), metrics.get(metric)
+            if not old or new is None:
+                continue
+            delta = (new - old) / old * 100
+            improved = delta < 0 if better == "lower" else delta > 0
+            changes.append(f"{metric} {delta:+.1f}%{'' if improved or not delta else ' ⚠️'}")
+        print(f"  {strategy:<16} {', '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--backends", nargs="+", default=["numpy"], choices=["numpy", "neo4j", "weaviate"]
+    )
+    parser.add_argument("--corpus-size", type=int, default=10_000)
+    parser.add_argument("--chunks-per-document", type=int, default=50)
+    parser.add_argument("--embedding-dimensions", type=int, default=384)
+    parser.add_argument("--query-count", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--strategies", nargs="+", default=[s.value for s in SearchStrategy])
+    parser.add_argument("--rerank-oversample", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--neo4j-uri", default="bolt://localhost:7687")
+    parser.add_argument("--neo4j-user", default="neo4j")
+    parser.add_argument("--neo4j-password", default="testpassword")
+    parser.add_argument("--weaviate-url", default="http://localhost:8080")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON report to diff against")
+    args = parser.parse_args()
+    if "numpy" in args.backends and len(args.backends) > 1:
+        parser.error("numpy stand-ins cannot be mixed with real backends")
+
+    logging.basicConfig(level=logging.WARNING)
+    tenant_id = f"benchmark_{datetime.now():%Y%m%d%H%M%S}"
+    corpus = SyntheticCorpus(
+        args.corpus_size, args.embedding_dimensions, args.chunks_per_document, args.seed
+    )
+    store = build_store(args)
+    memory = {"baseline_rss_mb": round(rss_megabytes(), 1)}
+
+    print(f"📥 Ingesting {corpus.size} chunks ({corpus.document_count} documents)...")
+    ingestion = ingest(store, corpus, tenant_id)
+    memory["after_ingestion_rss_mb"] = round(rss_megabytes(), 1)
+    print(f"    {ingestion['chunks_per_second']:.0f} chunks/s in {ingestion['seconds']:.1f}s")
+
+    print(f"🎯 Computing exact top-{args.k} for {args.query_count} queries...")
+    queries = corpus.queries(args.query_count)
+    truth = exact_neighbours(corpus, queries, args.k, tenant_id)
+
+    strategies = {}
+    print(f"\n{'strategy':<16} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'qps':>8} {'recall':>7}")
+    for name in args.strategies:
+        result = benchmark_strategy(
+            store, SearchStrategy(name), queries, truth, args.k, tenant_id, args.warmup
+        )
+        strategies[name] = result
+        print(
+            f"{name:<16} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+            f"{result['p99_ms']:>9.2f} {result['queries_per_second']:>8.1f} "
+            f"{result['recall_at_k']:>7.4f}"
+        )
+    memory["after_search_rss_mb"] = round(rss_megabytes(), 1)
+    store.close()
+
+    report = {
+        "revision": git_revision(),
+        "created_at": datetime.utcnow().isoformat() + "Z",
+        "python": platform.python_version(),
+        "config": {
+            "backends": args.backends,
+            "corpus_size": args.corpus_size,
+            "chunks_per_document": args.chunks_per_document,
+            "embedding_dimensions": args.embedding_dimensions,
+            "query_count": args.query_count,
+            "k": args.k,
+            "rerank_oversample": args.rerank_oversample,
+            "seed": args.seed,
+        },
+        "ingestion": ingestion,
+        "memory": memory,
+        "strategies": strategies,
+    }
+
+    if args.compare:
+        print_comparison(report, json.loads(args.compare.read_text()))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"\n📄 Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""Query result cache wrapping any hybrid vector store."""
+
+from array import array
+from collections import OrderedDict
+import hashlib
+import logging
+import threading
+import time
+from typing import Any
+
+from .ports import IHybridVectorStore
+
+logger = logging.getLogger(__name__)
+
+
+def _copy_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Shallow-copy result dicts so callers can annotate them without touching the cache."""
+    return [dict(result) for result in results]
+
+
+class CachedVectorStore(IHybridVectorStore):
+    """
+    LRU + TTL result cache in front of an IHybridVectorStore (typically CompoundVectorStore).
+
+    Entries are keyed on tenant, a hash of the quantized query vector, k and any
+    search options (strategy, alpha, query text), so near-identical embeddings of
+    the same query share an entry. Every ``upsert_chunks`` invalidates the cached
+    results of that tenant only.
+
+    Each invalidation bumps the tenant's generation, and a search only caches its
+    results if the generation it read before querying is still current, so a
+    search that overlaps an upsert cannot cache pre-upsert results. Results the
+    wrapped store reports as degraded (``pop_degraded``, e.g. a CompoundVectorStore
+    backend that failed or missed its deadline) are returned but not cached.
+    Empty results are never cached either: the Neo4j and Weaviate stores log
+    errors and return ``[]``, so an empty answer may be an outage.
+    """
+
+    def __init__(self, store: IHybridVectorStore, config: "QueryCacheConfig | None" = None):
+        config = config or QueryCacheConfig()
+        self.store = store
+        self.max_entries = config.max_entries
+        self.ttl_seconds = config.ttl_seconds
+        self.vector_precision = config.vector_precision
+
+        self._entries: OrderedDict[tuple, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._tenant_keys: dict[str, set[tuple]] = {}
+        # Bumped per tenant on invalidation, and for every tenant (epoch) on clear()
+        self._generations: dict[str, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _vector_hash(self, query_vector: list[float]) -> str:
+        scale = 10**self.vector_precision
+        quantized = array("q", (round(value * scale) for value in query_vector))
+        return hashlib.blake2b(quantized.tobytes(), digest_size=16).hexdigest()
+
+    def _key(self, tenant_id: str, query_vector: list[float], k: int, **options) -> tuple:
+        normalized = tuple(
+            sorted((name, getattr(value, "value", value)) for name, value in options.items())
+        )
+        return (tenant_id, self._vector_hash(query_vector), k, normalized)
+
+    def _get(self, key: tuple) -> list[dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _copy_results(entry[1])
+
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def _generation(self, tenant_id: str) -> tuple[int, int]:
+        with self._lock:
+            return self._epoch, self._generations.get(tenant_id, 0)
+
+    def _begin_search(self, tenant_id: str) -> tuple[int, int]:
+        """Generation to cache a search's results under, read before querying the store."""
+        # Clear degraded state left on this thread by uncached calls to the store
+        self._store_degraded()
+        return self._generation(tenant_id)
+
+    def _store_degraded(self) -> bool:
+        """Whether the wrapped store reports its last searches on this thread as partial."""
+        pop_degraded = getattr(self.store, "pop_degraded", None)
+        return bool(pop_degraded and pop_degraded())
+
+    def _put(self, key: tuple, results: list[dict[str, Any]], generation: tuple[int, int]) -> None:
+        if not results:
+            # Indistinguishable from a backend error swallowed by the store
+            return
+
+        with self._lock:
+            if generation != (self._epoch, self._generations.get(key[0], 0)):
+                # Invalidated while the search ran; the results may predate the write
+                return
+
+            self._entries[key] = (time.monotonic(), _copy_results(results))
+            self._entries.move_to_end(key)
+            self._tenant_keys.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        tenant_keys = self._tenant_keys.get(key[0])
+        if tenant_keys is not None:
+            tenant_keys.discard(key)
+            if not tenant_keys:
+                del self._tenant_keys[key[0]]
+
+    def invalidate_tenant(self, tenant_id: str) -> int:
+        """Drop every cached result for a tenant; returns the number of entries removed."""
+        with self._lock:
+            keys = self._tenant_keys.pop(tenant_id, set())
+            self._generations[tenant_id] = self._generations.get(tenant_id, 0) + 1
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += 1
+            return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._tenant_keys.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters for observability."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+    def search(
+        self, tenant_id: str, query_vector: list[float], k: int = 5, **kwargs
+    ) -> list[dict[str, Any]]:
+        """Return cached results or search the wrapped store and cache them."""
+        key = self._key(tenant_id, query_vector, k, **kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._begin_search(tenant_id)
+        results = self.store.search(tenant_id, query_vector, k, **kwargs)
+        if not self._store_degraded():
+            self._put(key, results, generation)
+        return _copy_results(results)
+
+    def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5, **kwargs
+    ) -> list[list[dict[str, Any]]]:
+        """Serve cached vectors from the cache and batch the misses into one search_many."""
+        keys = [self._key(tenant_id, vector, k, **kwargs) for vector in query_vectors]
+        batches: list[list[dict[str, Any]] | None] = [self._get(key) for key in keys]
+
+        missing = [i for i, results in enumerate(batches) if results is None]
+        if missing:
+            generation = self._begin_search(tenant_id)
+            fetched = self.store.search_many(
+                tenant_id, [query_vectors[i] for i in missing], k, **kwargs
+            )
+            degraded = self._store_degraded()
+            for i, results in zip(missing, fetched, strict=True):
+                if not degraded:
+                    self._put(keys[i], results, generation)
+                batches[i] = _copy_results(results)
+
+        return batches
+
+    def hybrid_search(
+        self,
+        tenant_id: str,
+        query: str,
+        query_vector: list[float],
+        k: int = 5,
+        alpha: float = 0.7,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """Return cached hybrid results or run the hybrid search and cache them."""
+        key = self._key(tenant_id, query_vector, k, hybrid=query, alpha=alpha, **kwargs)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+
+        generation = self._begin_search(tenant_id)
+        results = self.store.hybrid_search(tenant_id, query, query_vector, k, alpha, **kwargs)
+        if not self._store_degraded():
+            self._put(key, results, generation)
+        return _copy_results(results)
+
+    def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """Write through to the wrapped store and invalidate the tenant's cached results."""
+        try:
+            return self.store.upsert_chunks(tenant_id, title, chunks, embeddings)
+        finally:
+            removed = self.invalidate_tenant(tenant_id)
+            logger.debug(f"Invalidated {removed} cached results for tenant {tenant_id}")
+
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """Pass through to the wrapped store (not cached)."""
+        return self.store.missing_chunk_ids(tenant_id, chunk_ids)
+
+    def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Pass through to the wrapped store (not cached)."""
+        return self.store.get_recent_sources(tenant_id, limit)
+
+    def close(self):
+        """Clear the cache and close the wrapped store if it supports it."""
+        self.clear()
+        if hasattr(self.store, "close"):
+            self.store.close()
+
+
+class QueryCacheConfig:
+    """Configuration for the query result cache."""
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 60.0,
+        vector_precision: int = 4,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Decimal places kept when hashing query vectors for the cache key
+        self.vector_precision = vector_precision
@@ -1,11 +1,29 @@
 """Compound vector store service combining Neo4j and Weaviate strategies."""
 
+import asyncio
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from enum import Enum
+import heapq
 import logging
+import math
+import threading
+import time
 from typing import Any
 
-from .ports import IHybridVectorStore, IVectorStore
+from .ports import (
+    IAsyncEmbeddingStore,
+    IAsyncHybridVectorStore,
+    IAsyncVectorStore,
+    IEmbeddingStore,
+    IHybridVectorStore,
+    IReindexableStore,
+    IVectorStore,
+)
+from .reindex import FileCheckpointStore, ReindexStats, reconcile_stores
+from .rerank import exact_rerank
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +56,196 @@ class SearchResult:
             self.metadata = {}
 
 
+def _fusion_key(result: dict[str, Any]) -> str:
+    """Identity used to merge the same chunk across stores."""
+    # Chunk ids are content hashes shared by every store; text is a legacy fallback
+    # for rows ingested before stable ids existed
+    return result.get("id") or result.get("text", "")[:100]
+
+
+def _reciprocal_rank_fusion(
+    neo4j_results: list[dict],
+    weaviate_results: list[dict],
+    fusion_weights: dict[str, float],
+    k: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Fuse results from multiple stores using weighted reciprocal rank fusion.
+
+    Results are merged on chunk id, and only the top ``k`` fused results are
+    selected (with a heap) and materialized; ``k=None`` returns all of them.
+    """
+    # Reciprocal Rank Fusion (RRF) algorithm
+    k_constant = 60  # RRF constant
+    rrf_scores: dict[str, float] = {}
+    first_seen: dict[str, dict[str, Any]] = {}
+
+    # Neo4j weighted for organizational context, Weaviate for semantic relevance
+    for results, weight in (
+        (neo4j_results, fusion_weights["neo4j"]),
+        (weaviate_results, fusion_weights["weaviate"]),
+    ):
+        for i, result in enumerate(results):
+            doc_id = _fusion_key(result)
+            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0) + weight / (k_constant + i + 1)
+            first_seen.setdefault(doc_id, result)
+
+    if k is None:
+        top = sorted(rrf_scores.items(), key=lambda item: item[1], reverse=True)
+    else:
+        top = heapq.nlargest(k, rrf_scores.items(), key=lambda item: item[1])
+
+    fused = []
+    for doc_id, score in top:
+        result = first_seen[doc_id]
+        result["store_origin"] = "fused"
+        result["fusion_score"] = score
+        fused.append(result)
+    return fused
+
+
+def _candidate_count(k: int, rerank_oversample: int | None) -> int:
+    """Results requested from each backend for fusion."""
+    return k * rerank_oversample if rerank_oversample else k * 2
+
+
+def _candidate_ids(candidate_lists: list[list[dict[str, Any]]]) -> list[str]:
+    """Unique chunk ids across candidate lists, for one batched embedding lookup."""
+    return list(dict.fromkeys(c["id"] for cands in candidate_lists for c in cands if c.get("id")))
+
+
+class AdaptiveRouter:
+    """
+    Rolling backend statistics behind SearchStrategy.ADAPTIVE.
+
+    Keeps the last ``window`` search latencies per backend and, for every fused
+    query, the share of the fused top-k that each backend returned on its own
+    (recall overlap). ``choose`` runs fusion while it fits the latency SLO at
+    the configured percentile, otherwise the single backend that meets the SLO
+    with the best overlap (or the fastest one if none does). Until every backend
+    has ``min_samples`` it explores with fusion, and it re-runs fusion every
+    ``explore_every`` decisions to keep the overlap figures fresh.
+    """
+
+    def __init__(
+        self,
+        latency_slo: float = 0.25,
+        latency_percentile: float = 95.0,
+        window: int = 200,
+        min_samples: int = 20,
+        explore_every: int = 20,
+    ):
+        self.latency_slo = latency_slo
+        self.latency_percentile = latency_percentile
+        self.min_samples = min_samples
+        self.explore_every = explore_every
+
+        self._latencies = {backend: deque(maxlen=window) for backend in ("neo4j", "weaviate")}
+        self._overlap = {backend: deque(maxlen=window) for backend in ("neo4j", "weaviate")}
+        self._choices: Counter = Counter()
+        self._decisions = 0
+        self._lock = threading.Lock()
+
+    def record_latency(self, backend: str, seconds: float) -> None:
+        with self._lock:
+            self._latencies[backend].append(seconds)
+
+    def record_overlap(
+        self, backend_results: dict[str, list[dict[str, Any]]], fused: list[dict[str, Any]]
+    ) -> None:
+        """Record how much of the fused top-k each backend found by itself."""
+        if not fused:
+            return
+
+        fused_ids = {_fusion_key(result) for result in fused}
+        with self._lock:
+            for backend, results in backend_results.items():
+                own_ids = {_fusion_key(result) for result in results[: len(fused)]}
+                self._overlap[backend].append(len(fused_ids & own_ids) / len(fused_ids))
+
+    def percentile(self, backend: str, pct: float | None = None) -> float | None:
+        """Nearest-rank latency percentile in seconds, or None without samples."""
+        with self._lock:
+            samples = sorted(self._latencies[backend])
+        if not samples:
+            return None
+        pct = self.latency_percentile if pct is None else pct
+        rank = max(1, math.ceil(pct / 100 * len(samples)))
+        return samples[rank - 1]
+
+    def fastest(self, backends: list[str]) -> list[str]:
+        """Backends ordered by latency percentile (those without samples keep their order first)."""
+        return sorted(backends, key=lambda backend: self.percentile(backend) or 0.0)
+
+    def mean_overlap(self, backend: str) -> float | None:
+        with self._lock:
+            samples = list(self._overlap[backend])
+        return sum(samples) / len(samples) if samples else None
+
+    def choose(self, backends: list[str]) -> SearchStrategy:
+        """Pick the strategy for the next ADAPTIVE query over the configured backends."""
+        strategy = self._choose(backends)
+        with self._lock:
+            self._decisions += 1
+            self._choices[strategy.value] += 1
+        return strategy
+
+    def _choose(self, backends: list[str]) -> SearchStrategy:
+        if not backends:
+            return SearchStrategy.PARALLEL_FUSION
+        if len(backends) == 1:
+            return _SINGLE_BACKEND_STRATEGY[backends[0]]
+
+        with self._lock:
+            warming_up = any(
+                len(self._latencies[b]) < self.min_samples or not self._overlap[b] for b in backends
+            )
+            exploring = self.explore_every and self._decisions % self.explore_every == 0
+        if warming_up or exploring:
+            return SearchStrategy.PARALLEL_FUSION
+
+        latencies = {backend: self.percentile(backend) for backend in backends}
+        # Fusion waits for the slower backend
+        if max(latencies.values()) <= self.latency_slo:
+            return SearchStrategy.PARALLEL_FUSION
+
+        within_slo = [b for b in backends if latencies[b] <= self.latency_slo]
+        if within_slo:
+            best = max(within_slo, key=lambda b: (self.mean_overlap(b) or 0.0, -latencies[b]))
+        else:
+            best = min(backends, key=lambda b: latencies[b])
+        return _SINGLE_BACKEND_STRATEGY[best]
+
+    def stats(self) -> dict[str, Any]:
+        """Per-backend latency percentiles (seconds), recall overlap and strategy choices."""
+        backends = {}
+        for backend in ("neo4j", "weaviate"):
+            with self._lock:
+                samples = len(self._latencies[backend])
+            backends[backend] = {
+                "samples": samples,
+                "p50": self.percentile(backend, 50),
+                "p95": self.percentile(backend, 95),
+                "p99": self.percentile(backend, 99),
+                "recall_overlap": self.mean_overlap(backend),
+            }
+
+        with self._lock:
+            choices = dict(self._choices)
+        return {
+            "latency_slo": self.latency_slo,
+            "latency_percentile": self.latency_percentile,
+            "backends": backends,
+            "choices": choices,
+        }
+
+
+_SINGLE_BACKEND_STRATEGY = {
+    "neo4j": SearchStrategy.NEO4J_ONLY,
+    "weaviate": SearchStrategy.WEAVIATE_ONLY,
+}
+
+
 class CompoundVectorStore(IHybridVectorStore):
     """
     Compound vector store that intelligently routes queries between
@@ -46,6 +254,12 @@ class CompoundVectorStore(IHybridVectorStore):
     Perfect for organizational twin systems where you need both:
     - Fast semantic search (Weaviate)
     - Rich relationship context (Neo4j)
+
+    An optional ``local_store`` (e.g. NumpyStore) acts as an in-process tier for
+    small tenants, so their reads never hit the network. A tenant is admitted on
+    its first upsert by copying its existing chunks from a network store, and only
+    admitted tenants are read locally, so a partial local copy never hides older
+    documents. NEO4J_ONLY and WEAVIATE_ONLY bypass it.
     """
 
     def __init__(
@@ -54,18 +268,77 @@ class CompoundVectorStore(IHybridVectorStore):
         weaviate_store: IHybridVectorStore | None = None,
         default_strategy: SearchStrategy = SearchStrategy.PARALLEL_FUSION,
         fusion_weights: dict[str, float] | None = None,
+        executor: Executor | None = None,
+        max_workers: int = 4,
+        backend_timeouts: dict[str, float] | None = None,
+        local_store: IHybridVectorStore | None = None,
+        latency_slo: float = 0.25,
+        latency_percentile: float = 95.0,
+        stats_window: int = 200,
+        adaptive_min_samples: int = 20,
+        adaptive_explore_every: int = 20,
+        rerank_oversample: int | None = None,
     ):
         self.neo4j_store = neo4j_store
         self.weaviate_store = weaviate_store
+        self.local_store = local_store
+        self.rerank_oversample = rerank_oversample
         self.default_strategy = default_strategy
         self.fusion_weights = fusion_weights or {"neo4j": 0.6, "weaviate": 0.4}
+        self.backend_timeouts = backend_timeouts or {"neo4j": 5.0, "weaviate": 5.0}
+        self.router = AdaptiveRouter(
+            latency_slo,
+            latency_percentile,
+            stats_window,
+            adaptive_min_samples,
+            adaptive_explore_every,
+        )
+        # Tenants whose last upsert reached only some backends (see reconcile_tenant)
+        self.pending_reconciliation: set[str] = set()
+        # Tenants whose local copy holds their whole corpus (see _admit_locally)
+        self._local_tenants: set[str] = set()
+        self._local_lock = threading.Lock()
+        # Per calling thread: whether a search fell back or dropped a backend (pop_degraded)
+        self._search_state = threading.local()
 
         # Validate at least one store is provided
-        if not neo4j_store and not weaviate_store:
+        if not neo4j_store and not weaviate_store and not local_store:
             raise ValueError("At least one vector store must be provided")
 
+        # Executor used to fan out PARALLEL_FUSION queries; only shut down if we created it
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="compound-search"
+        )
+
         logger.info(f"CompoundVectorStore initialized with strategy: {default_strategy}")
 
+    @classmethod
+    def from_config(
+        cls,
+        config: "CompoundStoreConfig",
+        neo4j_store: IVectorStore | None = None,
+        weaviate_store: IHybridVectorStore | None = None,
+        local_store: IHybridVectorStore | None = None,
+    ) -> "CompoundVectorStore":
+        """Create a compound store from a CompoundStoreConfig, honouring the enable flags."""
+        return cls(
+            neo4j_store=neo4j_store if config.enable_neo4j else None,
+            weaviate_store=weaviate_store if config.enable_weaviate else None,
+            local_store=local_store if config.enable_local else None,
+            default_strategy=config.default_strategy,
+            fusion_weights=config.fusion_weights,
+            executor=config.executor,
+            max_workers=config.max_workers,
+            backend_timeouts=config.backend_timeouts,
+            latency_slo=config.latency_slo,
+            latency_percentile=config.latency_percentile,
+            stats_window=config.stats_window,
+            adaptive_min_samples=config.adaptive_min_samples,
+            adaptive_explore_every=config.adaptive_explore_every,
+            rerank_oversample=config.rerank_oversample,
+        )
+
     def search(
         self,
         tenant_id: str,
@@ -86,9 +359,12 @@ class CompoundVectorStore(IHybridVectorStore):
         """
         active_strategy = strategy or self.default_strategy
 
+        if self._serves_locally(tenant_id, active_strategy):
+            return self._tag(self.local_store.search(tenant_id, query_vector, k), "local")
+
         try:
             if active_strategy == SearchStrategy.NEO4J_ONLY:
-                return self._search_neo4j_only(tenant_id, query_vector, k)
+                return self._search_neo4j_only(tenant_id, query_vector, k, graph_context=True)
 
             elif active_strategy == SearchStrategy.WEAVIATE_ONLY:
                 return self._search_weaviate_only(tenant_id, query_vector, k)
@@ -113,20 +389,215 @@ class CompoundVectorStore(IHybridVectorStore):
 
         except Exception as e:
             logger.error(f"Compound search error: {e}")
+            self._mark_degraded()
             # Fallback to any available store
             return self._fallback_search(tenant_id, query_vector, k)
 
+    def search_many(
+        self,
+        tenant_id: str,
+        query_vectors: list[list[float]],
+        k: int = 5,
+        strategy: SearchStrategy | None = None,
+        **kwargs,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search several query vectors, batching round trips to each backend.
+
+        Single-store and fusion strategies issue one ``search_many`` call per backend
+        (concurrently for fusion) and fuse per query; sequential strategies fall back
+        to one ``search`` per vector.
+
+        Args:
+            tenant_id: Tenant identifier
+            query_vectors: Query vectors
+            k: Number of results to return per query
+            strategy: Override default search strategy
+            **kwargs: Additional parameters passed to per-vector search
+        """
+        active_strategy = strategy or self.default_strategy
+
+        if self._serves_locally(tenant_id, active_strategy):
+            batches = self.local_store.search_many(tenant_id, query_vectors, k)
+            return [self._tag(results, "local") for results in batches]
+
+        if active_strategy == SearchStrategy.ADAPTIVE:
+            active_strategy = self.router.choose(self._backends())
+
+        if active_strategy == SearchStrategy.NEO4J_ONLY:
+            return self._search_many_single("neo4j", tenant_id, query_vectors, k)
+
+        if active_strategy == SearchStrategy.WEAVIATE_ONLY:
+            return self._search_many_single("weaviate", tenant_id, query_vectors, k)
+
+        if active_strategy == SearchStrategy.PARALLEL_FUSION:
+            try:
+                return self._search_many_parallel_fusion(tenant_id, query_vectors, k)
+            except Exception as e:
+                logger.error(f"Compound search_many error: {e}")
+                self._mark_degraded()
+
+        return [
+            self.search(tenant_id, query_vector, k, strategy=active_strategy, **kwargs)
+            for query_vector in query_vectors
+        ]
+
+    def _serves_locally(self, tenant_id: str, strategy: SearchStrategy) -> bool:
+        """Whether reads for this tenant should be answered by the local tier."""
+        if not self.local_store or strategy in (
+            SearchStrategy.NEO4J_ONLY,
+            SearchStrategy.WEAVIATE_ONLY,
+        ):
+            return False
+
+        try:
+            return self._local_is_authoritative(tenant_id)
+        except Exception as e:
+            logger.warning(f"Local tier check failed: {e}")
+            return False
+
+    def _local_is_authoritative(self, tenant_id: str) -> bool:
+        """Whether the local tier holds the tenant's whole corpus."""
+        if self.neo4j_store or self.weaviate_store:
+            return tenant_id in self._local_tenants
+        # Without network stores the local tier is the only copy
+        has_tenant = getattr(self.local_store, "has_tenant", None)
+        return has_tenant(tenant_id) if has_tenant else True
+
+    def _admit_locally(self, tenant_id: str, page_size: int = 500) -> bool:
+        """
+        Make the local tier authoritative for a tenant, copying its chunks from the network.
+
+        Returns False (and leaves reads on the network stores) when the tenant was
+        evicted from the local tier, does not fit, or cannot be copied.
+        """
+        if tenant_id in self._local_tenants:
+            return True
+
+        is_evicted = getattr(self.local_store, "is_evicted", None)
+        if is_evicted and is_evicted(tenant_id):
+            return False
+
+        with self._local_lock:
+            if tenant_id in self._local_tenants:
+                return True
+
+            source = self.neo4j_store or self.weaviate_store
+            if source:
+                if not (
+                    isinstance(source, IReindexableStore)
+                    and isinstance(self.local_store, IReindexableStore)
+                ):
+                    return False
+
+                drop_tenant = getattr(self.local_store, "drop_tenant", None)
+                try:
+                    # Whatever the local tier already holds may be partial; start over
+                    if drop_tenant:
+                        drop_tenant(tenant_id)
+                    cursor = None
+                    while True:
+                        page, cursor = source.iter_chunk_page(tenant_id, cursor, page_size)
+                        self.local_store.upsert_chunk_records(tenant_id, page)
+                        if cursor is None or (is_evicted and is_evicted(tenant_id)):
+                            break
+                except Exception as e:
+                    logger.warning(f"Could not copy tenant {tenant_id} to the local tier: {e}")
+                    if drop_tenant:
+                        drop_tenant(tenant_id)
+                    return False
+
+                if is_evicted and is_evicted(tenant_id):
+                    return False
+
+            self._local_tenants.add(tenant_id)
+        return True
+
+    def _mark_degraded(self) -> None:
+        self._search_state.degraded = True
+
+    def pop_degraded(self) -> bool:
+        """
+        Whether a search on this thread fell back or dropped a failed or late backend
+        since the last call, clearing the flag.
+
+        Result caches check this after a search so partial results are not kept.
+        """
+        degraded = getattr(self._search_state, "degraded", False)
+        self._search_state.degraded = False
+        return degraded
+
+    @staticmethod
+    def _tag(results: list[dict[str, Any]], origin: str) -> list[dict[str, Any]]:
+        for result in results:
+            result["store_origin"] = origin
+        return results
+
+    def _search_many_single(
+        self, backend: str, tenant_id: str, query_vectors: list[list[float]], k: int
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Batched search against one backend, tagging every result with its origin.
+
+        The batch's latency, which every query in it waited for, is fed to the
+        adaptive router like a single search's.
+        """
+        store = self.neo4j_store if backend == "neo4j" else self.weaviate_store
+        if not store:
+            return [[] for _ in query_vectors]
+
+        started = time.perf_counter()
+        batches = store.search_many(tenant_id, query_vectors, k)
+        self.router.record_latency(backend, time.perf_counter() - started)
+        for results in batches:
+            for result in results:
+                result["store_origin"] = backend
+        return batches
+
+    def _search_many_parallel_fusion(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int
+    ) -> list[list[dict[str, Any]]]:
+        """One concurrent search_many per backend, then reciprocal rank fusion per query."""
+        futures: dict[str, Future] = {}
+        candidates = _candidate_count(k, self.rerank_oversample)
+
+        if self.neo4j_store:
+            futures["neo4j"] = self.executor.submit(
+                self._search_many_single, "neo4j", tenant_id, query_vectors, candidates
+            )
+
+        if self.weaviate_store:
+            futures["weaviate"] = self.executor.submit(
+                self._search_many_single, "weaviate", tenant_id, query_vectors, candidates
+            )
+
+        backend_results = self._collect_backend_results(futures, time.monotonic())
+        empty: list[list[dict[str, Any]]] = [[] for _ in query_vectors]
+        neo4j_batches = backend_results.get("neo4j", empty)
+        weaviate_batches = backend_results.get("weaviate", empty)
+
+        fused_k = None if self.rerank_oversample else k
+        fused = [
+            self._fuse_results(neo4j_results, weaviate_results, fused_k)
+            for neo4j_results, weaviate_results in zip(neo4j_batches, weaviate_batches, strict=True)
+        ]
+        if self.rerank_oversample:
+            fused = self._exact_rerank(tenant_id, query_vectors, fused, k)
+        for i, fused_results in enumerate(fused):
+            self.router.record_overlap(
+                {backend: batches[i] for backend, batches in backend_results.items()},
+                fused_results,
+            )
+        return fused
+
     def _search_neo4j_only(
-        self, tenant_id: str, query_vector: list[float], k: int
+        self, tenant_id: str, query_vector: list[float], k: int, graph_context: bool = False
     ) -> list[dict[str, Any]]:
-        """Search using Neo4j only for graph relationship context."""
+        """Search using Neo4j only, with graph relationship context when requested."""
         if not self.neo4j_store:
             return []
 
-        results = self.neo4j_store.search(tenant_id, query_vector, k)
-        for result in results:
-            result["store_origin"] = "neo4j"
-        return results
+        return self._timed_search("neo4j", tenant_id, query_vector, k, graph_context)
 
     def _search_weaviate_only(
         self, tenant_id: str, query_vector: list[float], k: int
@@ -135,10 +606,32 @@ class CompoundVectorStore(IHybridVectorStore):
         if not self.weaviate_store:
             return []
 
-        results = self.weaviate_store.search(tenant_id, query_vector, k)
-        for result in results:
-            result["store_origin"] = "weaviate"
-        return results
+        return self._timed_search("weaviate", tenant_id, query_vector, k)
+
+    def _timed_search(
+        self,
+        backend: str,
+        tenant_id: str,
+        query_vector: list[float],
+        k: int,
+        graph_context: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Search one backend, feeding its latency to the adaptive router.
+
+        With ``graph_context`` a store that supports ``search_with_context`` (Neo4j)
+        returns each hit with its neighbouring chunks and organizations in the same
+        round trip, instead of callers looking up relationships per hit.
+        """
+        store = self.neo4j_store if backend == "neo4j" else self.weaviate_store
+        started = time.perf_counter()
+        if graph_context and hasattr(store, "search_with_context"):
+            results = store.search_with_context(tenant_id, query_vector, k)
+        else:
+            results = store.search(tenant_id, query_vector, k)
+        # Recorded even when the caller has given up on a late result
+        self.router.record_latency(backend, time.perf_counter() - started)
+        return self._tag(results, backend)
 
     def _search_semantic_first(
         self, tenant_id: str, query_vector: list[float], k: int, **kwargs
@@ -171,10 +664,9 @@ class CompoundVectorStore(IHybridVectorStore):
 
         # First try Neo4j (graph relationships)
         if self.neo4j_store:
-            neo4j_results = self.neo4j_store.search(tenant_id, query_vector, k)
-            for result in neo4j_results:
-                result["store_origin"] = "neo4j"
-            results.extend(neo4j_results)
+            results.extend(
+                self._timed_search("neo4j", tenant_id, query_vector, k, graph_context=True)
+            )
 
         # If we don't have enough results, supplement with Weaviate
         if len(results) < k and self.weaviate_store:
@@ -189,82 +681,130 @@ class CompoundVectorStore(IHybridVectorStore):
     def _search_parallel_fusion(
         self, tenant_id: str, query_vector: list[float], k: int, **kwargs
     ) -> list[dict[str, Any]]:
-        """Search both stores in parallel and fuse results using reciprocal rank fusion."""
-        results = []
+        """
+        Search both stores concurrently and fuse results using reciprocal rank fusion.
 
-        # Get results from both stores
-        neo4j_results = []
-        weaviate_results = []
+        Each backend runs on the configured executor and is bounded by its own deadline
+        from ``backend_timeouts``. A backend that errors or misses its deadline contributes
+        no results, so the fused list is built from whichever stores answered in time.
 
-        if self.neo4j_store:
-            neo4j_results = self.neo4j_store.search(tenant_id, query_vector, k * 2)
-            for result in neo4j_results:
-                result["store_origin"] = "neo4j"
+        With ``rerank_oversample`` set this is two-stage retrieval: each backend returns
+        ``k * rerank_oversample`` ANN candidates, and the fused candidates are reranked by
+        exact cosine similarity on their stored embeddings.
+        """
+        futures: dict[str, Future] = {}
+        candidates = _candidate_count(k, self.rerank_oversample)
 
-        if self.weaviate_store:
-            weaviate_results = self.weaviate_store.search(tenant_id, query_vector, k * 2)
-            for result in weaviate_results:
-                result["store_origin"] = "weaviate"
+        for backend, store in (("neo4j", self.neo4j_store), ("weaviate", self.weaviate_store)):
+            if store:
+                futures[backend] = self.executor.submit(
+                    self._timed_search, backend, tenant_id, query_vector, candidates
+                )
+
+        backend_results = self._collect_backend_results(futures, time.monotonic())
+        neo4j_results = backend_results.get("neo4j", [])
+        weaviate_results = backend_results.get("weaviate", [])
 
         # Fuse results using reciprocal rank fusion
-        fused_results = self._fuse_results(neo4j_results, weaviate_results)
+        if self.rerank_oversample:
+            fused_results = self._fuse_results(neo4j_results, weaviate_results)
+            fused_results = self._exact_rerank(tenant_id, [query_vector], [fused_results], k)[0]
+        else:
+            fused_results = self._fuse_results(neo4j_results, weaviate_results, k)
+        self.router.record_overlap(backend_results, fused_results)
+        return fused_results
+
+    def _exact_rerank(
+        self,
+        tenant_id: str,
+        query_vectors: list[list[float]],
+        candidate_lists: list[list[dict[str, Any]]],
+        k: int,
+    ) -> list[list[dict[str, Any]]]:
+        """Rerank each query's candidates on embeddings fetched in one batched lookup."""
+        ids = _candidate_ids(candidate_lists)
+        embeddings = self._fetch_embeddings(tenant_id, ids) if ids else {}
+        return [
+            exact_rerank(query_vector, candidates, embeddings, k)
+            for query_vector, candidates in zip(query_vectors, candidate_lists, strict=True)
+        ]
+
+    def _fetch_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored embeddings from the fastest backend that answers within its deadline."""
+        for backend in self.router.fastest(self._backends()):
+            store = self.neo4j_store if backend == "neo4j" else self.weaviate_store
+            if not isinstance(store, IEmbeddingStore):
+                continue
+
+            future = self.executor.submit(store.get_embeddings, tenant_id, chunk_ids)
+            try:
+                return future.result(timeout=self.backend_timeouts.get(backend))
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(f"{backend} embedding lookup exceeded its deadline")
+                self._mark_degraded()
+            except Exception as e:
+                logger.warning(f"{backend} embedding lookup failed: {e}")
+                self._mark_degraded()
+
+        logger.warning("No embeddings for exact rerank, keeping fused candidate order")
+        return {}
+
+    def _collect_backend_results(
+        self, futures: dict[str, Future], started_at: float
+    ) -> dict[str, Any]:
+        """Wait for each backend future up to its own deadline, dropping late or failed ones."""
+        results: dict[str, Any] = {}
 
-        return fused_results[:k]
+        for backend, future in futures.items():
+            deadline = self.backend_timeouts.get(backend)
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - (time.monotonic() - started_at))
+
+            try:
+                results[backend] = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                future.cancel()
+                logger.warning(
+                    f"{backend} search exceeded {deadline}s deadline, fusing partial results"
+                )
+                self._mark_degraded()
+            except Exception as e:
+                logger.warning(f"{backend} search failed, fusing partial results: {e}")
+                self._mark_degraded()
+
+        return results
 
     def _search_adaptive(
         self, tenant_id: str, query_vector: list[float], k: int, **kwargs
     ) -> list[dict[str, Any]]:
-        """Adaptively choose strategy based on query characteristics."""
-        # Simple heuristic: if we have query text, prefer semantic-first
-        # Otherwise, use parallel fusion for comprehensive results
-        query_text = kwargs.get("query", "")
-
-        if query_text and len(query_text.split()) > 5:
-            # Longer queries might benefit from semantic understanding
-            logger.debug("Using semantic-first strategy for long query")
-            return self._search_semantic_first(tenant_id, query_vector, k, **kwargs)
-        else:
-            # Short queries or no text - use parallel fusion
-            logger.debug("Using parallel fusion strategy")
-            return self._search_parallel_fusion(tenant_id, query_vector, k, **kwargs)
+        """Route to fusion or a single backend based on measured latency against the SLO."""
+        strategy = self.router.choose(self._backends())
+        logger.debug(f"Adaptive search using {strategy.value}")
+
+        if strategy == SearchStrategy.NEO4J_ONLY:
+            return self._search_neo4j_only(tenant_id, query_vector, k)
+        if strategy == SearchStrategy.WEAVIATE_ONLY:
+            return self._search_weaviate_only(tenant_id, query_vector, k)
+        return self._search_parallel_fusion(tenant_id, query_vector, k, **kwargs)
+
+    def _backends(self) -> list[str]:
+        return [
+            backend
+            for backend, store in (("neo4j", self.neo4j_store), ("weaviate", self.weaviate_store))
+            if store
+        ]
+
+    def adaptive_stats(self) -> dict[str, Any]:
+        """Rolling latency percentiles, recall overlap and ADAPTIVE choices per backend."""
+        return self.router.stats()
 
     def _fuse_results(
-        self, neo4j_results: list[dict], weaviate_results: list[dict]
+        self, neo4j_results: list[dict], weaviate_results: list[dict], k: int | None = None
     ) -> list[dict[str, Any]]:
         """Fuse results from multiple stores using reciprocal rank fusion."""
-        # Reciprocal Rank Fusion (RRF) algorithm
-        rrf_scores = {}
-        k_constant = 60  # RRF constant
-
-        # Score Neo4j results (weighted higher for organizational context)
-        for i, result in enumerate(neo4j_results):
-            doc_id = result.get("text", "")[:100]  # Use text snippet as key
-            rrf_scores[doc_id] = (
-                rrf_scores.get(doc_id, 0)
-                + (1 / (k_constant + i + 1)) * self.fusion_weights["neo4j"]
-            )
-
-        # Score Weaviate results (weighted for semantic relevance)
-        for i, result in enumerate(weaviate_results):
-            doc_id = result.get("text", "")[:100]
-            rrf_scores[doc_id] = (
-                rrf_scores.get(doc_id, 0)
-                + (1 / (k_constant + i + 1)) * self.fusion_weights["weaviate"]
-            )
-
-        # Create lookup for full results
-        all_results = {}
-        for result in neo4j_results + weaviate_results:
-            doc_id = result.get("text", "")[:100]
-            if doc_id not in all_results:
-                all_results[doc_id] = result
-                all_results[doc_id]["store_origin"] = "fused"
-                all_results[doc_id]["fusion_score"] = rrf_scores.get(doc_id, 0)
-
-        # Sort by RRF score
-        sorted_items = sorted(rrf_scores.items(), key=lambda x: x[1], reverse=True)
-
-        return [all_results[doc_id] for doc_id, _ in sorted_items]
+        return _reciprocal_rank_fusion(neo4j_results, weaviate_results, self.fusion_weights, k)
 
     def _fallback_search(
         self, tenant_id: str, query_vector: list[float], k: int
@@ -295,11 +835,14 @@ class CompoundVectorStore(IHybridVectorStore):
     ) -> str:
         """Upsert chunks to all available stores."""
         source_id = ""
+        written = []
 
         # Insert to Neo4j if available (for relationship context)
         if self.neo4j_store:
             try:
                 source_id = self.neo4j_store.upsert_chunks(tenant_id, title, chunks, embeddings)
+                if source_id:
+                    written.append("neo4j")
                 logger.info(f"Inserted to Neo4j: {source_id}")
             except Exception as e:
                 logger.error(f"Neo4j upsert failed: {e}")
@@ -310,16 +853,111 @@ class CompoundVectorStore(IHybridVectorStore):
                 weaviate_id = self.weaviate_store.upsert_chunks(
                     tenant_id, title, chunks, embeddings
                 )
+                if weaviate_id:
+                    written.append("weaviate")
                 if not source_id:  # Use Weaviate ID if Neo4j failed
                     source_id = weaviate_id
                 logger.info(f"Inserted to Weaviate: {weaviate_id}")
             except Exception as e:
                 logger.error(f"Weaviate upsert failed: {e}")
 
+        # Insert to the local tier for admitted tenants (it evicts tenants that outgrow it)
+        if self.local_store and self._admit_locally(tenant_id):
+            try:
+                local_id = self.local_store.upsert_chunks(tenant_id, title, chunks, embeddings)
+                source_id = source_id or local_id
+                is_evicted = getattr(self.local_store, "is_evicted", None)
+                if is_evicted and is_evicted(tenant_id):
+                    self._local_tenants.discard(tenant_id)
+            except Exception as e:
+                # The local copy may now be partial; send reads back to the network
+                self._local_tenants.discard(tenant_id)
+                logger.error(f"Local upsert failed: {e}")
+
+        if written and len(written) < len(self._backends()):
+            # One backend holds chunks the other is missing until a reconcile pass runs
+            self.pending_reconciliation.add(tenant_id)
+            logger.warning(f"Tenant {tenant_id} needs reconciliation (only {written[0]} written)")
+
         return source_id
 
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """
+        Chunk ids missing from any backend, i.e. the chunks that need an embedding.
+
+        Backends that cannot answer count every id as missing. The local tier is
+        only consulted for tenants it holds completely.
+        """
+        stores = [store for store in (self.neo4j_store, self.weaviate_store) if store]
+        if self.local_store and self._local_is_authoritative(tenant_id):
+            stores.append(self.local_store)
+        if not stores:
+            return set(chunk_ids)
+
+        missing: set[str] = set()
+        for store in stores:
+            if not isinstance(store, IReindexableStore):
+                return set(chunk_ids)
+            try:
+                missing |= store.missing_chunk_ids(tenant_id, chunk_ids)
+            except Exception as e:
+                logger.warning(f"Chunk lookup failed, treating all chunks as new: {e}")
+                return set(chunk_ids)
+        return missing
+
+    def reconcile_tenant(
+        self,
+        tenant_id: str,
+        checkpoints: FileCheckpointStore | None = None,
+        page_size: int = 500,
+        max_chunks_per_second: float | None = None,
+        max_pages: int | None = None,
+        stop_event: threading.Event | None = None,
+    ) -> list[ReindexStats]:
+        """
+        Copy chunks missing from either backend out of the other (see reindex.ReindexJob).
+
+        Safe to run in a background thread while the store serves traffic. The
+        tenant leaves ``pending_reconciliation`` once both directions complete.
+
+        Args:
+            tenant_id: Tenant identifier
+            checkpoints: Where to keep resumable cursors
+            page_size: Chunks read per page
+            max_chunks_per_second: Scan rate limit per direction (None is unbounded)
+            max_pages: Page budget per direction for this call
+            stop_event: Set from another thread to stop after the current page
+
+        Returns:
+            Stats for each direction
+        """
+        stores = {
+            backend: store
+            for backend, store in (("neo4j", self.neo4j_store), ("weaviate", self.weaviate_store))
+            if isinstance(store, IReindexableStore)
+        }
+        if len(stores) < 2:
+            logger.warning("Reconciliation needs two backends that support re-indexing")
+            return []
+
+        stats = reconcile_stores(
+            stores,
+            tenant_id,
+            checkpoints,
+            page_size,
+            max_chunks_per_second,
+            max_pages,
+            stop_event,
+        )
+        if all(direction.completed for direction in stats):
+            self.pending_reconciliation.discard(tenant_id)
+        return stats
+
     def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
         """Get recent sources from primary store (Neo4j preferred for relationship context)."""
+        if self._serves_locally(tenant_id, self.default_strategy):
+            return self.local_store.get_recent_sources(tenant_id, limit)
+
         if self.neo4j_store:
             try:
                 return self.neo4j_store.get_recent_sources(tenant_id, limit)
@@ -354,6 +992,10 @@ class CompoundVectorStore(IHybridVectorStore):
             alpha: Vector vs keyword weight
             strategy: Search strategy override
         """
+        if self._serves_locally(tenant_id, strategy or self.default_strategy):
+            results = self.local_store.hybrid_search(tenant_id, query, query_vector, k, alpha)
+            return self._tag(results, "local_hybrid")
+
         # Try Weaviate hybrid search first (if available)
         if self.weaviate_store and hasattr(self.weaviate_store, "hybrid_search"):
             try:
@@ -368,6 +1010,7 @@ class CompoundVectorStore(IHybridVectorStore):
                     return results
             except Exception as e:
                 logger.warning(f"Weaviate hybrid search failed: {e}")
+                self._mark_degraded()
 
         # Fallback to compound search with query text as additional parameter
         return self.search(
@@ -379,6 +1022,456 @@ class CompoundVectorStore(IHybridVectorStore):
             alpha=alpha,
         )
 
+    def close(self):
+        """Shut down the search executor if this store created it."""
+        if self._owns_executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncCompoundVectorStore(IAsyncHybridVectorStore):
+    """
+    Async compound vector store over IAsyncVectorStore backends.
+
+    Same strategies and fusion as CompoundVectorStore, but backends are awaited
+    on the caller's event loop: PARALLEL_FUSION runs both searches with
+    ``asyncio.gather`` and bounds each one with its own deadline.
+    """
+
+    def __init__(
+        self,
+        neo4j_store: IAsyncVectorStore | None = None,
+        weaviate_store: IAsyncHybridVectorStore | None = None,
+        default_strategy: SearchStrategy = SearchStrategy.PARALLEL_FUSION,
+        fusion_weights: dict[str, float] | None = None,
+        backend_timeouts: dict[str, float] | None = None,
+        latency_slo: float = 0.25,
+        latency_percentile: float = 95.0,
+        stats_window: int = 200,
+        adaptive_min_samples: int = 20,
+        adaptive_explore_every: int = 20,
+        rerank_oversample: int | None = None,
+    ):
+        self.neo4j_store = neo4j_store
+        self.weaviate_store = weaviate_store
+        self.rerank_oversample = rerank_oversample
+        self.default_strategy = default_strategy
+        self.fusion_weights = fusion_weights or {"neo4j": 0.6, "weaviate": 0.4}
+        self.backend_timeouts = backend_timeouts or {"neo4j": 5.0, "weaviate": 5.0}
+        self.router = AdaptiveRouter(
+            latency_slo,
+            latency_percentile,
+            stats_window,
+            adaptive_min_samples,
+            adaptive_explore_every,
+        )
+
+        if not neo4j_store and not weaviate_store:
+            raise ValueError("At least one vector store must be provided")
+
+        logger.info(f"AsyncCompoundVectorStore initialized with strategy: {default_strategy}")
+
+    @classmethod
+    def from_config(
+        cls,
+        config: "CompoundStoreConfig",
+        neo4j_store: IAsyncVectorStore | None = None,
+        weaviate_store: IAsyncHybridVectorStore | None = None,
+    ) -> "AsyncCompoundVectorStore":
+        """Create an async compound store from a CompoundStoreConfig."""
+        return cls(
+            neo4j_store=neo4j_store if config.enable_neo4j else None,
+            weaviate_store=weaviate_store if config.enable_weaviate else None,
+            default_strategy=config.default_strategy,
+            fusion_weights=config.fusion_weights,
+            backend_timeouts=config.backend_timeouts,
+            latency_slo=config.latency_slo,
+            latency_percentile=config.latency_percentile,
+            stats_window=config.stats_window,
+            adaptive_min_samples=config.adaptive_min_samples,
+            adaptive_explore_every=config.adaptive_explore_every,
+            rerank_oversample=config.rerank_oversample,
+        )
+
+    async def search(
+        self,
+        tenant_id: str,
+        query_vector: list[float],
+        k: int = 5,
+        strategy: SearchStrategy | None = None,
+        **kwargs,
+    ) -> list[dict[str, Any]]:
+        """
+        Search using specified strategy.
+
+        Args:
+            tenant_id: Tenant identifier
+            query_vector: Query vector
+            k: Number of results to return
+            strategy: Override default search strategy
+            **kwargs: Additional parameters (query text for hybrid search, etc.)
+        """
+        active_strategy = strategy or self.default_strategy
+
+        try:
+            if active_strategy == SearchStrategy.NEO4J_ONLY:
+                return await self._search_store(
+                    "neo4j", tenant_id, query_vector, k, graph_context=True
+                )
+
+            elif active_strategy == SearchStrategy.WEAVIATE_ONLY:
+                return await self._search_store("weaviate", tenant_id, query_vector, k)
+
+            elif active_strategy == SearchStrategy.SEMANTIC_FIRST:
+                return await self._search_sequential(
+                    ("weaviate", "neo4j"), tenant_id, query_vector, k
+                )
+
+            elif active_strategy == SearchStrategy.GRAPH_FIRST:
+                return await self._search_sequential(
+                    ("neo4j", "weaviate"), tenant_id, query_vector, k, graph_context=True
+                )
+
+            elif active_strategy == SearchStrategy.ADAPTIVE:
+                adaptive_strategy = self.router.choose(self._backends())
+                if adaptive_strategy == SearchStrategy.NEO4J_ONLY:
+                    return await self._search_store("neo4j", tenant_id, query_vector, k)
+                if adaptive_strategy == SearchStrategy.WEAVIATE_ONLY:
+                    return await self._search_store("weaviate", tenant_id, query_vector, k)
+                return await self._search_parallel_fusion(tenant_id, query_vector, k)
+
+            else:
+                return await self._search_parallel_fusion(tenant_id, query_vector, k)
+
+        except Exception as e:
+            logger.error(f"Async compound search error: {e}")
+            return await self._fallback_search(tenant_id, query_vector, k)
+
+    def _store(self, backend: str) -> IAsyncVectorStore | None:
+        return self.neo4j_store if backend == "neo4j" else self.weaviate_store
+
+    def _backends(self) -> list[str]:
+        return [backend for backend in ("neo4j", "weaviate") if self._store(backend)]
+
+    def adaptive_stats(self) -> dict[str, Any]:
+        """Rolling latency percentiles, recall overlap and ADAPTIVE choices per backend."""
+        return self.router.stats()
+
+    async def _search_store(
+        self,
+        backend: str,
+        tenant_id: str,
+        query_vector: list[float],
+        k: int,
+        graph_context: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Search a single backend, tag results with their origin and record its latency.
+
+        With ``graph_context`` the search is expanded over the graph where the store
+        supports it (see CompoundVectorStore._timed_search).
+        """
+        store = self._store(backend)
+        if not store:
+            return []
+
+        started = time.perf_counter()
+        try:
+            if graph_context and hasattr(store, "search_with_context"):
+                results = await store.search_with_context(tenant_id, query_vector, k)
+            else:
+                results = await store.search(tenant_id, query_vector, k)
+        except asyncio.CancelledError:
+            # A search cut off by its deadline still counts as (at least) that slow
+            self.router.record_latency(backend, time.perf_counter() - started)
+            raise
+        self.router.record_latency(backend, time.perf_counter() - started)
+
+        for result in results:
+            result["store_origin"] = backend
+        return results
+
+    async def _search_sequential(
+        self,
+        order: tuple[str, str],
+        tenant_id: str,
+        query_vector: list[float],
+        k: int,
+        graph_context: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Search the first backend, supplementing from the second if short of k results."""
+        results = await self._search_store(order[0], tenant_id, query_vector, k, graph_context)
+
+        if len(results) < k:
+            remaining = k - len(results)
+            results.extend(await self._search_store(order[1], tenant_id, query_vector, remaining))
+
+        return results[:k]
+
+    async def _with_deadline(self, backend: str, awaitable, default: Any) -> Any:
+        """Await a backend call, returning ``default`` if it errors or misses its deadline."""
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.backend_timeouts.get(backend))
+        except TimeoutError:
+            logger.warning(
+                f"{backend} search exceeded {self.backend_timeouts.get(backend)}s deadline, "
+                "fusing partial results"
+            )
+        except Exception as e:
+            logger.warning(f"{backend} search failed, fusing partial results: {e}")
+        return default
+
+    async def _exact_rerank(
+        self,
+        tenant_id: str,
+        query_vectors: list[list[float]],
+        candidate_lists: list[list[dict[str, Any]]],
+        k: int,
+    ) -> list[list[dict[str, Any]]]:
+        """Rerank each query's candidates on embeddings fetched in one batched lookup."""
+        ids = _candidate_ids(candidate_lists)
+        embeddings = await self._fetch_embeddings(tenant_id, ids) if ids else {}
+        return [
+            exact_rerank(query_vector, candidates, embeddings, k)
+            for query_vector, candidates in zip(query_vectors, candidate_lists, strict=True)
+        ]
+
+    async def _fetch_embeddings(
+        self, tenant_id: str, chunk_ids: list[str]
+    ) -> dict[str, list[float]]:
+        """Stored embeddings from the fastest backend that answers within its deadline."""
+        for backend in self.router.fastest(self._backends()):
+            store = self._store(backend)
+            if not isinstance(store, IAsyncEmbeddingStore):
+                continue
+
+            try:
+                return await asyncio.wait_for(
+                    store.get_embeddings(tenant_id, chunk_ids),
+                    timeout=self.backend_timeouts.get(backend),
+                )
+            except TimeoutError:
+                logger.warning(f"{backend} embedding lookup exceeded its deadline")
+            except Exception as e:
+                logger.warning(f"{backend} embedding lookup failed: {e}")
+
+        logger.warning("No embeddings for exact rerank, keeping fused candidate order")
+        return {}
+
+    async def _search_parallel_fusion(
+        self, tenant_id: str, query_vector: list[float], k: int
+    ) -> list[dict[str, Any]]:
+        """
+        Search both stores concurrently and fuse results using reciprocal rank fusion,
+        reranking the fused candidates exactly when ``rerank_oversample`` is set.
+        """
+        candidates = _candidate_count(k, self.rerank_oversample)
+        neo4j_results, weaviate_results = await asyncio.gather(
+            self._with_deadline(
+                "neo4j", self._search_store("neo4j", tenant_id, query_vector, candidates), []
+            ),
+            self._with_deadline(
+                "weaviate",
+                self._search_store("weaviate", tenant_id, query_vector, candidates),
+                [],
+            ),
+        )
+
+        if self.rerank_oversample:
+            fused_results = _reciprocal_rank_fusion(
+                neo4j_results, weaviate_results, self.fusion_weights
+            )
+            fused_results = (
+                await self._exact_rerank(tenant_id, [query_vector], [fused_results], k)
+            )[0]
+        else:
+            fused_results = _reciprocal_rank_fusion(
+                neo4j_results, weaviate_results, self.fusion_weights, k
+            )
+        self.router.record_overlap(
+            {
+                backend: results
+                for backend, results in (("neo4j", neo4j_results), ("weaviate", weaviate_results))
+                if self._store(backend)
+            },
+            fused_results,
+        )
+        return fused_results
+
+    async def search_many(
+        self,
+        tenant_id: str,
+        query_vectors: list[list[float]],
+        k: int = 5,
+        strategy: SearchStrategy | None = None,
+        **kwargs,
+    ) -> list[list[dict[str, Any]]]:
+        """Search several query vectors, batching round trips to each backend."""
+        active_strategy = strategy or self.default_strategy
+
+        if active_strategy == SearchStrategy.ADAPTIVE:
+            active_strategy = self.router.choose(self._backends())
+
+        if active_strategy == SearchStrategy.NEO4J_ONLY:
+            return await self._search_many_single("neo4j", tenant_id, query_vectors, k)
+
+        if active_strategy == SearchStrategy.WEAVIATE_ONLY:
+            return await self._search_many_single("weaviate", tenant_id, query_vectors, k)
+
+        if active_strategy == SearchStrategy.PARALLEL_FUSION:
+            empty: list[list[dict[str, Any]]] = [[] for _ in query_vectors]
+            candidates = _candidate_count(k, self.rerank_oversample)
+            neo4j_batches, weaviate_batches = await asyncio.gather(
+                self._with_deadline(
+                    "neo4j",
+                    self._search_many_single("neo4j", tenant_id, query_vectors, candidates),
+                    empty,
+                ),
+                self._with_deadline(
+                    "weaviate",
+                    self._search_many_single("weaviate", tenant_id, query_vectors, candidates),
+                    empty,
+                ),
+            )
+            fused_k = None if self.rerank_oversample else k
+            fused = [
+                _reciprocal_rank_fusion(
+                    neo4j_results, weaviate_results, self.fusion_weights, fused_k
+                )
+                for neo4j_results, weaviate_results in zip(
+                    neo4j_batches, weaviate_batches, strict=True
+                )
+            ]
+            if self.rerank_oversample:
+                fused = await self._exact_rerank(tenant_id, query_vectors, fused, k)
+            for fused_results, neo4j_results, weaviate_results in zip(
+                fused, neo4j_batches, weaviate_batches, strict=True
+            ):
+                self.router.record_overlap(
+                    {
+                        backend: results
+                        for backend, results in (
+                            ("neo4j", neo4j_results),
+                            ("weaviate", weaviate_results),
+                        )
+                        if self._store(backend)
+                    },
+                    fused_results,
+                )
+            return fused
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search(tenant_id, query_vector, k, strategy=active_strategy, **kwargs)
+                    for query_vector in query_vectors
+                )
+            )
+        )
+
+    async def _search_many_single(
+        self, backend: str, tenant_id: str, query_vectors: list[list[float]], k: int
+    ) -> list[list[dict[str, Any]]]:
+        """Batched search against one backend, tagging results and recording its latency."""
+        store = self._store(backend)
+        if not store:
+            return [[] for _ in query_vectors]
+
+        started = time.perf_counter()
+        try:
+            batches = await store.search_many(tenant_id, query_vectors, k)
+        except asyncio.CancelledError:
+            self.router.record_latency(backend, time.perf_counter() - started)
+            raise
+        self.router.record_latency(backend, time.perf_counter() - started)
+        for results in batches:
+            for result in results:
+                result["store_origin"] = backend
+        return batches
+
+    async def _fallback_search(
+        self, tenant_id: str, query_vector: list[float], k: int
+    ) -> list[dict[str, Any]]:
+        """Fallback search when primary strategy fails."""
+        for backend in ("neo4j", "weaviate"):
+            store = self._store(backend)
+            if not store:
+                continue
+            try:
+                results = await store.search(tenant_id, query_vector, k)
+                for result in results:
+                    result["store_origin"] = f"{backend}_fallback"
+                return results
+            except Exception:
+                pass
+
+        return []
+
+    async def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """Upsert chunks to all available stores concurrently."""
+        backends = [b for b in ("neo4j", "weaviate") if self._store(b)]
+        outcomes = await asyncio.gather(
+            *(self._store(b).upsert_chunks(tenant_id, title, chunks, embeddings) for b in backends),
+            return_exceptions=True,
+        )
+
+        source_id = ""
+        for backend, outcome in zip(backends, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(f"{backend} upsert failed: {outcome}")
+                continue
+            logger.info(f"Inserted to {backend}: {outcome}")
+            # Prefer the Neo4j source id, fall back to Weaviate's
+            source_id = source_id or outcome
+
+        return source_id
+
+    async def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Get recent sources from primary store (Neo4j preferred for relationship context)."""
+        for backend in ("neo4j", "weaviate"):
+            store = self._store(backend)
+            if not store:
+                continue
+            try:
+                return await store.get_recent_sources(tenant_id, limit)
+            except Exception as e:
+                logger.error(f"{backend} get_recent_sources failed: {e}")
+
+        return []
+
+    async def hybrid_search(
+        self,
+        tenant_id: str,
+        query: str,
+        query_vector: list[float],
+        k: int = 5,
+        alpha: float = 0.7,
+        strategy: SearchStrategy | None = None,
+    ) -> list[dict[str, Any]]:
+        """Perform hybrid search, preferring Weaviate and falling back to compound search."""
+        if self.weaviate_store and hasattr(self.weaviate_store, "hybrid_search"):
+            try:
+                results = await self.weaviate_store.hybrid_search(
+                    tenant_id, query, query_vector, k, alpha
+                )
+                for result in results:
+                    result["store_origin"] = "weaviate_hybrid"
+
+                if results:
+                    return results
+            except Exception as e:
+                logger.warning(f"Weaviate hybrid search failed: {e}")
+
+        return await self.search(
+            tenant_id=tenant_id,
+            query_vector=query_vector,
+            k=k,
+            strategy=strategy,
+            query=query,
+            alpha=alpha,
+        )
+
 
 class CompoundStoreConfig:
     """Configuration for compound vector store."""
@@ -389,8 +1482,35 @@ class CompoundStoreConfig:
         enable_weaviate: bool = True,
         default_strategy: SearchStrategy = SearchStrategy.PARALLEL_FUSION,
         fusion_weights: dict[str, float] | None = None,
+        executor: Executor | None = None,
+        max_workers: int = 4,
+        backend_timeouts: dict[str, float] | None = None,
+        enable_local: bool = True,
+        latency_slo: float = 0.25,
+        latency_percentile: float = 95.0,
+        stats_window: int = 200,
+        adaptive_min_samples: int = 20,
+        adaptive_explore_every: int = 20,
+        rerank_oversample: int | None = None,
     ):
         self.enable_neo4j = enable_neo4j
         self.enable_weaviate = enable_weaviate
+        # Use the in-process local tier when one is passed to from_config
+        self.enable_local = enable_local
         self.default_strategy = default_strategy
         self.fusion_weights = fusion_weights or {"neo4j": 0.6, "weaviate": 0.4}
+        # Shared executor for parallel fan-out; a private thread pool is created when None
+        self.executor = executor
+        self.max_workers = max_workers
+        # Per-backend search deadlines in seconds (None disables the deadline)
+        self.backend_timeouts = backend_timeouts or {"neo4j": 5.0, "weaviate": 5.0}
+        # ADAPTIVE routing: latency target (seconds) at this percentile of recent searches
+        self.latency_slo = latency_slo
+        self.latency_percentile = latency_percentile
+        # Rolling sample window per backend, warm-up size and fusion re-check interval
+        self.stats_window = stats_window
+        self.adaptive_min_samples = adaptive_min_samples
+        self.adaptive_explore_every = adaptive_explore_every
+        # Two-stage fusion: fetch k * rerank_oversample ANN candidates per backend, then
+        # rerank by exact cosine on stored embeddings (None keeps plain fusion of k * 2)
+        self.rerank_oversample = rerank_oversample
@@ -0,0 +1,32 @@
+"""Deterministic chunk identity shared by all vector store implementations."""
+
+from collections import Counter
+import uuid
+
+# Fixed namespace so every store derives the same id for the same chunk
+CHUNK_NAMESPACE = uuid.UUID("6f1c2a4e-8d3b-5e7f-9a0c-1b2d3e4f5a6b")
+
+
+def chunk_id(tenant_id: str, source: str, text: str, occurrence: int = 0) -> str:
+    """
+    Content-hash id for a chunk (UUIDv5, so Weaviate accepts it as an object id).
+
+    ``occurrence`` distinguishes identical text repeated within one document
+    (e.g. page boilerplate) without tying the id to the chunk's position.
+    """
+    return str(uuid.uuid5(CHUNK_NAMESPACE, f"{tenant_id}\x1f{source}\x1f{occurrence}\x1f{text}"))
+
+
+def chunk_ids(tenant_id: str, source: str, chunks: list[str]) -> list[str]:
+    """Ids for a document's chunks, in order."""
+    seen: Counter = Counter()
+    ids = []
+    for text in chunks:
+        ids.append(chunk_id(tenant_id, source, text, seen[text]))
+        seen[text] += 1
+    return ids
+
+
+def document_source_id(tenant_id: str, title: str) -> str:
+    """Id for a document, so re-uploads of the same title update one source."""
+    return str(uuid.uuid5(CHUNK_NAMESPACE, f"{tenant_id}\x1f{title}"))
@@ -0,0 +1,108 @@
+"""Incremental, content-addressed document ingestion: only new chunks are embedded."""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import logging
+import time
+
+from .identity import chunk_ids, document_source_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DocumentDelta:
+    """Which chunks of an upload are not stored yet."""
+
+    source_id: str
+    chunk_ids: list[str]
+    # Positions (in the uploaded chunk list) of chunks that need an embedding
+    new_indexes: list[int] = field(default_factory=list)
+
+    @property
+    def reused_count(self) -> int:
+        return len(self.chunk_ids) - len(self.new_indexes)
+
+
+@dataclass
+class DocumentIngestionStats:
+    """Outcome of an incremental document upsert."""
+
+    source_id: str  # "" when the store write failed
+    chunk_count: int
+    embedded_count: int
+    elapsed_seconds: float
+
+    @property
+    def reused_count(self) -> int:
+        return self.chunk_count - self.embedded_count
+
+
+def plan_document(store, tenant_id: str, title: str, chunks: list[str]) -> DocumentDelta:
+    """
+    Work out which chunks of a document the store does not hold yet.
+
+    Args:
+        store: Any store with ``missing_chunk_ids`` (IReindexableStore, CompoundVectorStore,
+            CachedVectorStore)
+        tenant_id: Tenant identifier
+        title: Document title/source
+        chunks: The document's text chunks, in order
+
+    Returns:
+        DocumentDelta listing the chunks to embed (all of them if the lookup fails)
+    """
+    ids = chunk_ids(tenant_id, title, chunks)
+    try:
+        missing = store.missing_chunk_ids(tenant_id, ids)
+    except Exception as e:
+        logger.warning(f"Chunk lookup failed for {title}, embedding every chunk: {e}")
+        missing = set(ids)
+
+    new_indexes = [i for i, chunk_id in enumerate(ids) if chunk_id in missing]
+    return DocumentDelta(document_source_id(tenant_id, title), ids, new_indexes)
+
+
+def upsert_document(
+    store,
+    tenant_id: str,
+    title: str,
+    chunks: list[str],
+    embed: Callable[[list[str]], list[list[float]]],
+) -> DocumentIngestionStats:
+    """
+    Upsert a document, embedding only the chunks the store does not hold.
+
+    Chunk ids are content hashes, so unchanged chunks of a re-upload are found
+    by id and keep their stored vectors; ``embed`` only sees new or edited text.
+    The store then deletes chunks that the previous version of the document had
+    and this one lacks.
+
+    Args:
+        store: Vector store to write to (see plan_document)
+        tenant_id: Tenant identifier
+        title: Document title/source
+        chunks: The document's text chunks, in order
+        embed: Embeds a list of texts (e.g. one embeddings API call)
+
+    Returns:
+        DocumentIngestionStats with the source id and how many chunks were embedded
+    """
+    started = time.perf_counter()
+    delta = plan_document(store, tenant_id, title, chunks)
+
+    embeddings: list[list[float] | None] = [None] * len(chunks)
+    if delta.new_indexes:
+        vectors = embed([chunks[i] for i in delta.new_indexes])
+        for i, vector in zip(delta.new_indexes, vectors, strict=True):
+            embeddings[i] = vector
+
+    source_id = store.upsert_chunks(tenant_id, title, chunks, embeddings)
+    stats = DocumentIngestionStats(
+        source_id, len(chunks), len(delta.new_indexes), time.perf_counter() - started
+    )
+    logger.info(
+        f"Upserted {title}: embedded {stats.embedded_count} of {stats.chunk_count} chunks, "
+        f"reused {stats.reused_count}"
+    )
+    return stats
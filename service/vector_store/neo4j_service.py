@@ -1,38 +1,388 @@
 """Neo4j vector store service for graph-based document retrieval with relationships."""
 
+from dataclasses import dataclass
 from datetime import datetime
 import logging
+import time
 from typing import Any
-import uuid
 
 try:
-    from neo4j import GraphDatabase
+    from neo4j import AsyncGraphDatabase, GraphDatabase
 
     NEO4J_AVAILABLE = True
 except ImportError:
     NEO4J_AVAILABLE = False
     GraphDatabase = None
-
-from .ports import IVectorStore
+    AsyncGraphDatabase = None
+
+from .identity import chunk_ids, document_source_id
+from .ports import (
+    IAsyncEmbeddingStore,
+    IAsyncVectorStore,
+    IEmbeddingStore,
+    IReindexableStore,
+    IVectorStore,
+)
+from .quantization import truncate_embedding, truncate_embeddings
 
 logger = logging.getLogger(__name__)
 
+_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes($index, $k, $vec) YIELD node, score
+WHERE coalesce(node.tenantId, 'demo') = $tenant
+RETURN node as n, score
+ORDER BY score DESC
+"""
+
+_SEARCH_MANY_QUERY = """
+UNWIND range(0, size($vecs) - 1) AS qi
+CALL db.index.vector.queryNodes($index, $k, $vecs[qi]) YIELD node, score
+WITH qi, node, score
+WHERE coalesce(node.tenantId, 'demo') = $tenant
+RETURN qi, node as n, score
+ORDER BY qi, score DESC
+"""
+
+_SOURCE_UPSERT_QUERY = """
+MERGE (s:Source {id: $sid})
+SET s.title = $title,
+    s.tenantId = $tenantId,
+    s.createdAt = $now,
+    s.chunkCount = $chunkCount
+"""
+
+_RECENT_SOURCES_QUERY = """
+MATCH (s:Source)
+WHERE coalesce(s.tenantId, 'demo') = $tenant
+OPTIONAL MATCH (s)-[:HAS_CHUNK]->(d:Document)
+WITH s, count(d) as chunk_count
+RETURN s.id as id, s.title as title, s.createdAt as created_at,
+       chunk_count, 'document' as type
+ORDER BY s.createdAt DESC
+LIMIT $limit
+"""
+
+
+def _graph_search_query(node_label: str) -> str:
+    """Vector search returning each hit's neighbouring chunks and organizations."""
+    return f"""
+    CALL db.index.vector.queryNodes($index, $k, $vec) YIELD node, score
+    WITH node, score
+    WHERE coalesce(node.tenantId, 'demo') = $tenant
+    OPTIONAL MATCH (src:Source)-[:HAS_CHUNK]->(node)
+    // Re-uploads of a document share chunk ids; one source per hit keeps hits unique
+    WITH node, score, collect(src)[0] AS s
+    WITH node, score, s,
+         CASE WHEN s IS NULL THEN [] ELSE [
+             (s)-[:HAS_CHUNK]->(nb:{node_label})
+             WHERE nb <> node
+               AND abs(coalesce(nb.chunkIndex, 0) - coalesce(node.chunkIndex, 0)) <= $window
+             | nb {{.id, .text, .chunkIndex}}
+         ] END AS neighbours,
+         [(node)-[:BELONGS_TO]->(org:Organization) | org]
+         + CASE WHEN s IS NULL THEN [] ELSE [(s)-[:BELONGS_TO]->(org:Organization) | org] END
+             AS orgs
+    RETURN node AS n, score, s.id AS source_id, neighbours,
+           [org IN orgs WHERE coalesce(org.tenantId, $tenant) = $tenant
+            | org {{.name, .type, .industry, .size}}] AS organizations
+    ORDER BY score DESC
+    """
+
+
+def _chunk_batch_upsert_query(node_label: str, embedding_property: str) -> str:
+    """Build the UNWIND statement that merges a batch of chunk rows under one source."""
+    return f"""
+    MATCH (s:Source {{id: $sid}})
+    UNWIND $rows AS row
+    MERGE (d:{node_label} {{id: row.id}})
+    SET d.text = row.text,
+        d.source = $title,
+        d.{embedding_property} = coalesce(row.embedding, d.{embedding_property}),
+        d.tenantId = $tenantId,
+        d.createdAt = coalesce(d.createdAt, $now),
+        d.chunkIndex = row.chunkIndex
+    MERGE (s)-[:HAS_CHUNK]->(d)
+    """
+
+
+def _stale_chunks_delete_query(node_label: str) -> str:
+    """Delete chunks an earlier version of the document had and the new one lacks."""
+    return f"""
+    MATCH (:Source {{tenantId: $tenantId, title: $title}})-[:HAS_CHUNK]->(d:{node_label})
+    WHERE NOT d.id IN $ids
+    WITH DISTINCT d
+    DETACH DELETE d
+    RETURN count(*) AS removed
+    """
+
+
+def _chunk_page_query(node_label: str, embedding_property: str) -> str:
+    """Keyset-paginated export of a tenant's chunks (with their source) in id order."""
+    return f"""
+    MATCH (d:{node_label})
+    WHERE coalesce(d.tenantId, 'demo') = $tenant AND ($after IS NULL OR d.id > $after)
+    WITH d ORDER BY d.id LIMIT $limit
+    OPTIONAL MATCH (s:Source)-[:HAS_CHUNK]->(d)
+    RETURN d.id AS id, d.text AS text, d.source AS source, d.chunkIndex AS chunk_index,
+           d.createdAt AS created_at, d.{embedding_property} AS embedding,
+           s.id AS source_id, s.chunkCount AS source_chunk_count
+    ORDER BY id
+    """
+
+
+def _missing_chunks_query(node_label: str) -> str:
+    return f"""
+    UNWIND $ids AS id
+    OPTIONAL MATCH (d:{node_label} {{id: id}})
+    WITH id, d
+    WHERE d IS NULL
+    RETURN id
+    """
+
+
+def _embeddings_query(node_label: str, embedding_property: str) -> str:
+    return f"""
+    MATCH (d:{node_label})
+    WHERE d.id IN $ids AND coalesce(d.tenantId, 'demo') = $tenant
+    RETURN d.id AS id, d.{embedding_property} AS embedding
+    """
+
+
+def _chunk_record_upsert_query(node_label: str, embedding_property: str) -> str:
+    """UNWIND statement that loads exported chunk records, creating missing sources."""
+    return f"""
+    UNWIND $rows AS row
+    MERGE (s:Source {{id: row.sourceId}})
+    ON CREATE SET s.title = row.source,
+                  s.tenantId = $tenantId,
+                  s.createdAt = row.createdAt,
+                  s.chunkCount = row.sourceChunkCount
+    MERGE (d:{node_label} {{id: row.id}})
+    SET d.text = row.text,
+        d.source = row.source,
+        d.{embedding_property} = row.embedding,
+        d.tenantId = $tenantId,
+        d.createdAt = row.createdAt,
+        d.chunkIndex = row.chunkIndex
+    MERGE (s)-[:HAS_CHUNK]->(d)
+    """
+
+
+def _record_rows(records: list[dict[str, Any]], dimensions: int | None) -> list[dict[str, Any]]:
+    """UNWIND rows for exported chunk records."""
+    return [
+        {
+            "id": record["id"],
+            "text": record["text"],
+            "source": record["source"],
+            "sourceId": record["source_id"],
+            "sourceChunkCount": record.get("source_chunk_count"),
+            "createdAt": record["created_at"],
+            "chunkIndex": record["chunk_index"],
+            "embedding": truncate_embedding(record["embedding"], dimensions),
+        }
+        for record in records
+    ]
+
+
+def _page_records(result, tenant_id: str, limit: int) -> tuple[list[dict[str, Any]], str | None]:
+    """Chunk records from an export page (one per chunk) and the next cursor."""
+    records: dict[str, dict[str, Any]] = {}
+    for row in result:
+        # A chunk merged under several uploads comes back once per source
+        records.setdefault(
+            row["id"],
+            {
+                "id": row["id"],
+                "text": row["text"],
+                "source": row["source"],
+                "source_id": row["source_id"],
+                "source_chunk_count": row["source_chunk_count"],
+                "created_at": row["created_at"],
+                "chunk_index": row["chunk_index"],
+                "tenant_id": tenant_id,
+                "embedding": list(row["embedding"] or []),
+            },
+        )
+
+    page = list(records.values())
+    cursor = page[-1]["id"] if len(page) == limit else None
+    return page, cursor
+
+
+def _chunk_rows(
+    tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+) -> list[dict[str, Any]]:
+    """Build UNWIND rows (id, text, embedding, chunkIndex) for a document's chunks."""
+    ids = chunk_ids(tenant_id, title, chunks)
+    return [
+        {"id": ids[i], "text": chunk, "embedding": embedding, "chunkIndex": i}
+        for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False))
+    ]
+
+
+def _batched(rows: list[dict[str, Any]], batch_size: int) -> list[list[dict[str, Any]]]:
+    """Split rows into consecutive batches of at most batch_size."""
+    batch_size = max(1, batch_size)
+    return [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+
+
+def _schema_statements(node_label: str) -> list[str]:
+    """Constraint and index statements required by the chunk/source graph."""
+    return [
+        # Unique constraints
+        f"CREATE CONSTRAINT IF NOT EXISTS FOR (d:{node_label}) REQUIRE d.id IS UNIQUE",
+        "CREATE CONSTRAINT IF NOT EXISTS FOR (s:Source) REQUIRE s.id IS UNIQUE",
+        # Indexes for better performance
+        f"CREATE INDEX IF NOT EXISTS FOR (d:{node_label}) ON (d.tenantId)",
+        f"CREATE INDEX IF NOT EXISTS FOR (d:{node_label}) ON (d.source)",
+        "CREATE INDEX IF NOT EXISTS FOR (s:Source) ON (s.tenantId)",
+    ]
+
+
+def _vector_index_query(
+    vector_index: str,
+    node_label: str,
+    embedding_property: str,
+    dimensions: int,
+    similarity: str,
+    quantization: bool = False,
+) -> str:
+    """Build the CREATE VECTOR INDEX statement."""
+    # Scalar (int8) quantization of the index needs Neo4j 5.23+, so only emit it when asked
+    quantization_option = ""
+    if quantization:
+        quantization_option = ",\n            `vector.quantization.enabled`: true"
+    return f"""
+    CREATE VECTOR INDEX {vector_index} IF NOT EXISTS
+    FOR (n:{node_label}) ON (n.{embedding_property})
+    OPTIONS {{
+        indexConfig: {{
+            `vector.dimensions`: {dimensions},
+            `vector.similarity_function`: '{similarity}'{quantization_option}
+        }}
+    }}
+    """
+
 
-class Neo4jStore(IVectorStore):
+@dataclass
+class IngestionStats:
+    """Throughput metrics for a bulk chunk upsert."""
+
+    source_id: str
+    chunk_count: int
+    batch_count: int
+    batch_size: int
+    elapsed_seconds: float
+    # Chunks deleted because the new version of the document no longer has them
+    removed_count: int = 0
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.chunk_count / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def _record_to_search_result(record) -> dict[str, Any]:
+    """Convert a vector search record into the common search result shape."""
+    node = record["n"]
+    return {
+        "id": node.get("id") or node.element_id,
+        "text": node.get("text", ""),
+        "source": node.get("source", ""),
+        "score": record["score"],
+        "created_at": node.get("createdAt", ""),
+        "chunk_index": node.get("chunkIndex", 0),
+        "tenant_id": node.get("tenantId", ""),
+    }
+
+
+def _record_to_context_result(record) -> dict[str, Any]:
+    """Search result plus neighbouring chunks (in document order) and organization context."""
+    result = _record_to_search_result(record)
+    neighbours = sorted(
+        (
+            {"id": nb["id"], "text": nb["text"] or "", "chunk_index": nb["chunkIndex"] or 0}
+            for nb in record["neighbours"]
+        ),
+        key=lambda nb: nb["chunk_index"],
+    )
+    window = sorted([*neighbours, result], key=lambda chunk: chunk["chunk_index"])
+    organizations = {org["name"]: dict(org) for org in record["organizations"]}
+
+    result.update(
+        {
+            "source_id": record["source_id"],
+            "neighbours": neighbours,
+            "context_text": "\n".join(chunk["text"] for chunk in window),
+            "organizations": list(organizations.values()),
+        }
+    )
+    return result
+
+
+def _group_by_query(records, query_count: int) -> list[list[dict[str, Any]]]:
+    """Split search_many records back into one result list per query index."""
+    grouped: list[list[dict[str, Any]]] = [[] for _ in range(query_count)]
+    for record in records:
+        grouped[record["qi"]].append(_record_to_search_result(record))
+    return grouped
+
+
+def _record_to_source(record) -> dict[str, Any]:
+    """Convert a recent-sources record into the common source shape."""
+    return {
+        "id": record["id"],
+        "title": record["title"],
+        "created_at": record["created_at"],
+        "chunk_count": record["chunk_count"],
+        "type": record["type"],
+    }
+
+
+def _driver_options(config) -> dict[str, Any]:
+    """Pool settings passed to GraphDatabase.driver / AsyncGraphDatabase.driver."""
+    return {
+        "max_connection_pool_size": getattr(config, "max_connection_pool_size", 100),
+        "connection_timeout": getattr(config, "connection_timeout", 30.0),
+    }
+
+
+def create_driver(config):
+    """Pooled synchronous Neo4j driver for a Neo4jConfig."""
+    return GraphDatabase.driver(
+        config.uri, auth=(config.user, config.password), **_driver_options(config)
+    )
+
+
+def create_async_driver(config):
+    """Pooled async Neo4j driver for a Neo4jConfig."""
+    return AsyncGraphDatabase.driver(
+        config.uri, auth=(config.user, config.password), **_driver_options(config)
+    )
+
+
+class Neo4jStore(IVectorStore, IReindexableStore, IEmbeddingStore):
     """
     Neo4j implementation of vector store with graph relationship capabilities.
     Provides semantic search with organizational relationship context.
+
+    Pass a shared ``driver`` (see VectorStoreRegistry) to reuse one connection
+    pool across stores; a shared driver is left open by ``close``.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, driver=None):
         if not NEO4J_AVAILABLE:
             raise ImportError("Neo4j driver is not installed. Install with: pip install neo4j")
 
-        self.driver = GraphDatabase.driver(config.uri, auth=(config.user, config.password))
+        self._owns_driver = driver is None
+        self.driver = driver or create_driver(config)
         self.database = config.database
         self.vector_index = config.vector_index
         self.node_label = getattr(config, "node_label", "Document")
         self.embedding_property = getattr(config, "embedding_property", "embedding")
+        self.upsert_batch_size = getattr(config, "upsert_batch_size", 500)
+        self.truncate_dimensions = getattr(config, "truncate_dimensions", None)
+        self.vector_quantization = getattr(config, "vector_quantization", False)
 
         logger.info(f"Connected to Neo4j at {config.uri}")
         self._ensure_constraints_and_indexes()
@@ -41,16 +391,8 @@ class Neo4jStore(IVectorStore):
         """Ensure necessary constraints and indexes exist."""
         try:
             with self.driver.session(database=self.database) as session:
-                # Create unique constraints
-                session.run(
-                    f"CREATE CONSTRAINT IF NOT EXISTS FOR (d:{self.node_label}) REQUIRE d.id IS UNIQUE"
-                )
-                session.run("CREATE CONSTRAINT IF NOT EXISTS FOR (s:Source) REQUIRE s.id IS UNIQUE")
-
-                # Create indexes for better performance
-                session.run(f"CREATE INDEX IF NOT EXISTS FOR (d:{self.node_label}) ON (d.tenantId)")
-                session.run(f"CREATE INDEX IF NOT EXISTS FOR (d:{self.node_label}) ON (d.source)")
-                session.run("CREATE INDEX IF NOT EXISTS FOR (s:Source) ON (s.tenantId)")
+                for statement in _schema_statements(self.node_label):
+                    session.run(statement)
 
                 logger.info("Neo4j constraints and indexes ensured")
         except Exception as e:
@@ -58,57 +400,122 @@ class Neo4jStore(IVectorStore):
 
     def search(self, tenant_id: str, query_vector: list[float], k: int = 5) -> list[dict[str, Any]]:
         """Search for similar vectors using Neo4j vector index."""
-        query = """
-        CALL db.index.vector.queryNodes($index, $k, $vec) YIELD node, score
-        WHERE coalesce(node.tenantId, 'demo') = $tenant
-        RETURN node as n, score
-        ORDER BY score DESC
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(
+                    _SEARCH_QUERY,
+                    index=self.vector_index,
+                    k=k,
+                    vec=truncate_embedding(query_vector, self.truncate_dimensions),
+                    tenant=tenant_id,
+                )
+                return [_record_to_search_result(record) for record in result]
+
+        except Exception as e:
+            logger.error(f"Neo4j search error: {e}")
+            return []
+
+    def search_with_context(
+        self, tenant_id: str, query_vector: list[float], k: int = 5, window: int = 1
+    ) -> list[dict[str, Any]]:
         """
+        Vector search expanded over the graph in a single Cypher round trip.
 
+        Each hit also carries ``neighbours`` (chunks of the same Source within
+        ``window`` positions, in document order), ``context_text`` (the hit with
+        its neighbours joined) and ``organizations`` linked by BELONGS_TO to the
+        chunk or its Source, so callers need no per-hit get_document_relationships.
+
+        Args:
+            tenant_id: Tenant identifier
+            query_vector: Query vector
+            k: Number of hits to return
+            window: Neighbouring chunks to include on each side of a hit (0 for none)
+
+        Returns:
+            Search results with graph context
+        """
         try:
             with self.driver.session(database=self.database) as session:
                 result = session.run(
-                    query, index=self.vector_index, k=k, vec=query_vector, tenant=tenant_id
+                    _graph_search_query(self.node_label),
+                    index=self.vector_index,
+                    k=k,
+                    vec=truncate_embedding(query_vector, self.truncate_dimensions),
+                    tenant=tenant_id,
+                    window=window,
                 )
-
-                results = []
-                for record in result:
-                    node = record["n"]
-                    results.append(
-                        {
-                            "id": node.element_id,
-                            "text": node.get("text", ""),
-                            "source": node.get("source", ""),
-                            "score": record["score"],
-                            "created_at": node.get("createdAt", ""),
-                            "chunk_index": node.get("chunkIndex", 0),
-                            "tenant_id": node.get("tenantId", ""),
-                        }
-                    )
-
-                return results
+                return [_record_to_context_result(record) for record in result]
 
         except Exception as e:
-            logger.error(f"Neo4j search error: {e}")
+            logger.error(f"Neo4j search_with_context error: {e}")
+            return []
+
+    def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """Search several query vectors in one session and one UNWIND round trip."""
+        if not query_vectors:
             return []
 
+        try:
+            with self.driver.session(database=self.database) as session:
+                result = session.run(
+                    _SEARCH_MANY_QUERY,
+                    index=self.vector_index,
+                    k=k,
+                    vecs=truncate_embeddings(query_vectors, self.truncate_dimensions),
+                    tenant=tenant_id,
+                )
+                return _group_by_query(result, len(query_vectors))
+
+        except Exception as e:
+            logger.error(f"Neo4j search_many error: {e}")
+            return [[] for _ in query_vectors]
+
     def upsert_chunks(
         self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
     ) -> str:
         """Insert document chunks with embeddings into Neo4j graph."""
-        source_id = str(uuid.uuid4())
+        return self.bulk_upsert_chunks(tenant_id, title, chunks, embeddings).source_id
+
+    def bulk_upsert_chunks(
+        self,
+        tenant_id: str,
+        title: str,
+        chunks: list[str],
+        embeddings: list[list[float]],
+        batch_size: int | None = None,
+    ) -> IngestionStats:
+        """
+        Insert document chunks in UNWIND batches and report ingestion throughput.
+
+        All batches run in a single write transaction, so the document is stored
+        atomically while only needing one round trip per ``batch_size`` chunks.
+
+        Args:
+            tenant_id: Tenant identifier
+            title: Document title/source
+            chunks: Text chunks to store
+            embeddings: Corresponding embedding vectors
+            batch_size: Rows per UNWIND statement (defaults to the configured size)
+
+        Returns:
+            IngestionStats with the source id ("" on failure) and chunks/sec
+        """
+        source_id = document_source_id(tenant_id, title)
         now = datetime.utcnow().isoformat() + "Z"
+        batch_size = batch_size or self.upsert_batch_size
+        embeddings = truncate_embeddings(embeddings, self.truncate_dimensions)
+        rows = _chunk_rows(tenant_id, title, chunks, embeddings)
+        batches = _batched(rows, batch_size)
+        chunk_query = _chunk_batch_upsert_query(self.node_label, self.embedding_property)
+        stale_query = _stale_chunks_delete_query(self.node_label)
 
         def _transaction(tx):
             # Create or update source node
             tx.run(
-                """
-                MERGE (s:Source {id: $sid})
-                SET s.title = $title,
-                    s.tenantId = $tenantId,
-                    s.createdAt = $now,
-                    s.chunkCount = $chunkCount
-            """,
+                _SOURCE_UPSERT_QUERY,
                 sid=source_id,
                 title=title,
                 tenantId=tenant_id,
@@ -116,59 +523,63 @@ class Neo4jStore(IVectorStore):
                 chunkCount=len(chunks),
             )
 
-            # Create document chunks with relationships
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False)):
-                chunk_id = str(uuid.uuid4())
+            # Create document chunks with relationships, one round trip per batch
+            for batch in batches:
                 tx.run(
-                    f"""
-                    MERGE (d:{self.node_label} {{id: $id}})
-                    SET d.text = $text,
-                        d.source = $title,
-                        d.{self.embedding_property} = $emb,
-                        d.tenantId = $tenantId,
-                        d.createdAt = $now,
-                        d.chunkIndex = $chunkIndex
-                    WITH d
-                    MATCH (s:Source {{id: $sid}})
-                    MERGE (s)-[:HAS_CHUNK]->(d)
-                """,
-                    id=chunk_id,
-                    text=chunk,
-                    emb=embedding,
-                    tenantId=tenant_id,
-                    now=now,
-                    title=title,
-                    sid=source_id,
-                    chunkIndex=i,
+                    chunk_query, rows=batch, sid=source_id, title=title, tenantId=tenant_id, now=now
                 )
 
+            # Drop chunks that the previous version of this document had
+            result = tx.run(
+                stale_query, ids=[row["id"] for row in rows], title=title, tenantId=tenant_id
+            )
+            return result.single()["removed"]
+
+        started = time.perf_counter()
         try:
             with self.driver.session(database=self.database) as session:
-                session.execute_write(_transaction)
-            logger.info(f"Inserted {len(chunks)} chunks for source {title}")
-            return source_id
+                removed = session.execute_write(_transaction)
+            stats = IngestionStats(
+                source_id,
+                len(chunks),
+                len(batches),
+                batch_size,
+                time.perf_counter() - started,
+                removed,
+            )
+            logger.info(
+                f"Inserted {len(chunks)} chunks for source {title} in {len(batches)} batches "
+                f"({stats.chunks_per_second:.0f} chunks/s, {removed} stale chunks removed)"
+            )
+            return stats
 
         except Exception as e:
             logger.error(f"Neo4j upsert error: {e}")
-            return ""
+            return IngestionStats("", 0, 0, batch_size, time.perf_counter() - started)
 
     def ensure_vector_index(
         self,
         dimensions: int = 1536,
         similarity: str = "cosine",
     ) -> None:
-        """Ensure the vector index exists with the expected dimensions and similarity function."""
+        """
+        Ensure the vector index exists with the expected dimensions and similarity function.
+
+        With ``truncate_dimensions`` configured the index is sized for the truncated
+        vectors, and ``vector_quantization`` enables int8 quantization of the index.
+        """
+        if self.truncate_dimensions:
+            dimensions = min(dimensions, self.truncate_dimensions)
+
         try:
-            cypher = f"""
-            CREATE VECTOR INDEX {self.vector_index} IF NOT EXISTS
-            FOR (n:{self.node_label}) ON (n.{self.embedding_property})
-            OPTIONS {{
-                indexConfig: {{
-                    `vector.dimensions`: {dimensions},
-                    `vector.similarity_function`: '{similarity}'
-                }}
-            }}
-            """
+            cypher = _vector_index_query(
+                self.vector_index,
+                self.node_label,
+                self.embedding_property,
+                dimensions,
+                similarity,
+                self.vector_quantization,
+            )
 
             with self.driver.session(database=self.database) as session:
                 session.run(cypher)
@@ -177,34 +588,63 @@ class Neo4jStore(IVectorStore):
         except Exception as e:
             logger.error(f"Error ensuring vector index: {e}")
 
+    def iter_chunk_page(
+        self, tenant_id: str, after: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Read one page of the tenant's chunks in chunk id order, with embeddings."""
+        with self.driver.session(database=self.database) as session:
+            result = session.run(
+                _chunk_page_query(self.node_label, self.embedding_property),
+                tenant=tenant_id,
+                after=after,
+                limit=limit,
+            )
+            return _page_records(result, tenant_id, limit)
+
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """Return the chunk ids with no chunk node."""
+        if not chunk_ids:
+            return set()
+
+        with self.driver.session(database=self.database) as session:
+            result = session.run(_missing_chunks_query(self.node_label), ids=chunk_ids)
+            return {record["id"] for record in result}
+
+    def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored embeddings of the given chunks, in one indexed lookup by id."""
+        if not chunk_ids:
+            return {}
+
+        with self.driver.session(database=self.database) as session:
+            result = session.run(
+                _embeddings_query(self.node_label, self.embedding_property),
+                ids=chunk_ids,
+                tenant=tenant_id,
+            )
+            return {record["id"]: record["embedding"] for record in result if record["embedding"]}
+
+    def upsert_chunk_records(self, tenant_id: str, records: list[dict[str, Any]]) -> int:
+        """Load exported chunk records in UNWIND batches within one write transaction."""
+        if not records:
+            return 0
+
+        query = _chunk_record_upsert_query(self.node_label, self.embedding_property)
+        batches = _batched(_record_rows(records, self.truncate_dimensions), self.upsert_batch_size)
+
+        def _transaction(tx):
+            for rows in batches:
+                tx.run(query, rows=rows, tenantId=tenant_id)
+
+        with self.driver.session(database=self.database) as session:
+            session.execute_write(_transaction)
+        return len(records)
+
     def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
         """Get recently ingested sources for a tenant."""
-        query = """
-        MATCH (s:Source)
-        WHERE coalesce(s.tenantId, 'demo') = $tenant
-        OPTIONAL MATCH (s)-[:HAS_CHUNK]->(d:Document)
-        WITH s, count(d) as chunk_count
-        RETURN s.id as id, s.title as title, s.createdAt as created_at,
-               chunk_count, 'document' as type
-        ORDER BY s.createdAt DESC
-        LIMIT $limit
-        """
-
         try:
             with self.driver.session(database=self.database) as session:
-                result = session.run(query, tenant=tenant_id, limit=limit)
-                sources = []
-                for record in result:
-                    sources.append(
-                        {
-                            "id": record["id"],
-                            "title": record["title"],
-                            "created_at": record["created_at"],
-                            "chunk_count": record["chunk_count"],
-                            "type": record["type"],
-                        }
-                    )
-                return sources
+                result = session.run(_RECENT_SOURCES_QUERY, tenant=tenant_id, limit=limit)
+                return [_record_to_source(record) for record in result]
 
         except Exception as e:
             logger.error(f"Neo4j get_recent_sources error: {e}")
@@ -244,10 +684,17 @@ class Neo4jStore(IVectorStore):
     def create_organizational_relationships(
         self, tenant_id: str, document_id: str, organization_data: dict[str, Any]
     ) -> bool:
-        """Create organizational relationships for document context (Neo4j specific)."""
-        query = """
-        MATCH (d:Document {id: $doc_id, tenantId: $tenant})
-        MERGE (org:Organization {name: $org_name, tenantId: $tenant})
+        """
+        Create organizational relationships for document context (Neo4j specific).
+
+        ``document_id`` may be a source id (as returned by upsert_chunks) or a chunk id.
+        """
+        query = f"""
+        OPTIONAL MATCH (s:Source {{id: $doc_id, tenantId: $tenant}})
+        OPTIONAL MATCH (c:{self.node_label} {{id: $doc_id, tenantId: $tenant}})
+        WITH coalesce(s, c) AS d
+        WHERE d IS NOT NULL
+        MERGE (org:Organization {{name: $org_name, tenantId: $tenant}})
         SET org.type = $org_type,
             org.industry = $industry,
             org.size = $size
@@ -273,11 +720,237 @@ class Neo4jStore(IVectorStore):
             return False
 
     def close(self):
-        """Close the Neo4j connection."""
-        if hasattr(self, "driver"):
+        """Close the Neo4j connection unless the driver is shared."""
+        if hasattr(self, "driver") and self._owns_driver:
             self.driver.close()
 
 
+class AsyncNeo4jStore(IAsyncVectorStore, IAsyncEmbeddingStore):
+    """
+    Async Neo4j vector store built on the Neo4j async driver.
+
+    Mirrors Neo4jStore but never blocks the event loop, so a single activity
+    worker can keep many graph-backed retrievals in flight. Call ``connect()``
+    once before use to verify connectivity and ensure constraints.
+    """
+
+    def __init__(self, config, driver=None):
+        if not NEO4J_AVAILABLE:
+            raise ImportError("Neo4j driver is not installed. Install with: pip install neo4j")
+
+        self.uri = config.uri
+        self._owns_driver = driver is None
+        self.driver = driver or create_async_driver(config)
+        self.database = config.database
+        self.vector_index = config.vector_index
+        self.node_label = getattr(config, "node_label", "Document")
+        self.embedding_property = getattr(config, "embedding_property", "embedding")
+        self.upsert_batch_size = getattr(config, "upsert_batch_size", 500)
+        self.truncate_dimensions = getattr(config, "truncate_dimensions", None)
+        self.vector_quantization = getattr(config, "vector_quantization", False)
+
+    async def connect(self) -> None:
+        """Verify connectivity and ensure constraints and indexes exist."""
+        await self.driver.verify_connectivity()
+        logger.info(f"Connected to Neo4j (async) at {self.uri}")
+
+        try:
+            async with self.driver.session(database=self.database) as session:
+                for statement in _schema_statements(self.node_label):
+                    await session.run(statement)
+            logger.info("Neo4j constraints and indexes ensured")
+        except Exception as e:
+            logger.warning(f"Error ensuring constraints/indexes: {e}")
+
+    async def search(
+        self, tenant_id: str, query_vector: list[float], k: int = 5
+    ) -> list[dict[str, Any]]:
+        """Search for similar vectors using Neo4j vector index."""
+        try:
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(
+                    _SEARCH_QUERY,
+                    index=self.vector_index,
+                    k=k,
+                    vec=truncate_embedding(query_vector, self.truncate_dimensions),
+                    tenant=tenant_id,
+                )
+                return [_record_to_search_result(record) async for record in result]
+
+        except Exception as e:
+            logger.error(f"Neo4j async search error: {e}")
+            return []
+
+    async def search_with_context(
+        self, tenant_id: str, query_vector: list[float], k: int = 5, window: int = 1
+    ) -> list[dict[str, Any]]:
+        """Vector search with neighbouring chunks and organizations (see Neo4jStore)."""
+        try:
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(
+                    _graph_search_query(self.node_label),
+                    index=self.vector_index,
+                    k=k,
+                    vec=truncate_embedding(query_vector, self.truncate_dimensions),
+                    tenant=tenant_id,
+                    window=window,
+                )
+                return [_record_to_context_result(record) async for record in result]
+
+        except Exception as e:
+            logger.error(f"Neo4j async search_with_context error: {e}")
+            return []
+
+    async def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """Search several query vectors in one session and one UNWIND round trip."""
+        if not query_vectors:
+            return []
+
+        try:
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(
+                    _SEARCH_MANY_QUERY,
+                    index=self.vector_index,
+                    k=k,
+                    vecs=truncate_embeddings(query_vectors, self.truncate_dimensions),
+                    tenant=tenant_id,
+                )
+                return _group_by_query([record async for record in result], len(query_vectors))
+
+        except Exception as e:
+            logger.error(f"Neo4j async search_many error: {e}")
+            return [[] for _ in query_vectors]
+
+    async def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored embeddings of the given chunks, in one indexed lookup by id."""
+        if not chunk_ids:
+            return {}
+
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(
+                _embeddings_query(self.node_label, self.embedding_property),
+                ids=chunk_ids,
+                tenant=tenant_id,
+            )
+            return {
+                record["id"]: record["embedding"] async for record in result if record["embedding"]
+            }
+
+    async def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """Insert document chunks with embeddings into Neo4j graph."""
+        return (await self.bulk_upsert_chunks(tenant_id, title, chunks, embeddings)).source_id
+
+    async def bulk_upsert_chunks(
+        self,
+        tenant_id: str,
+        title: str,
+        chunks: list[str],
+        embeddings: list[list[float]],
+        batch_size: int | None = None,
+    ) -> IngestionStats:
+        """Insert document chunks in UNWIND batches and report ingestion throughput."""
+        source_id = document_source_id(tenant_id, title)
+        now = datetime.utcnow().isoformat() + "Z"
+        batch_size = batch_size or self.upsert_batch_size
+        embeddings = truncate_embeddings(embeddings, self.truncate_dimensions)
+        rows = _chunk_rows(tenant_id, title, chunks, embeddings)
+        batches = _batched(rows, batch_size)
+        chunk_query = _chunk_batch_upsert_query(self.node_label, self.embedding_property)
+        stale_query = _stale_chunks_delete_query(self.node_label)
+
+        async def _transaction(tx):
+            await tx.run(
+                _SOURCE_UPSERT_QUERY,
+                sid=source_id,
+                title=title,
+                tenantId=tenant_id,
+                now=now,
+                chunkCount=len(chunks),
+            )
+
+            for batch in batches:
+                await tx.run(
+                    chunk_query, rows=batch, sid=source_id, title=title, tenantId=tenant_id, now=now
+                )
+
+            result = await tx.run(
+                stale_query, ids=[row["id"] for row in rows], title=title, tenantId=tenant_id
+            )
+            return (await result.single())["removed"]
+
+        started = time.perf_counter()
+        try:
+            async with self.driver.session(database=self.database) as session:
+                removed = await session.execute_write(_transaction)
+            stats = IngestionStats(
+                source_id,
+                len(chunks),
+                len(batches),
+                batch_size,
+                time.perf_counter() - started,
+                removed,
+            )
+            logger.info(
+                f"Inserted {len(chunks)} chunks for source {title} in {len(batches)} batches "
+                f"({stats.chunks_per_second:.0f} chunks/s, {removed} stale chunks removed)"
+            )
+            return stats
+
+        except Exception as e:
+            logger.error(f"Neo4j async upsert error: {e}")
+            return IngestionStats("", 0, 0, batch_size, time.perf_counter() - started)
+
+    async def ensure_vector_index(
+        self,
+        dimensions: int = 1536,
+        similarity: str = "cosine",
+    ) -> None:
+        """
+        Ensure the vector index exists with the expected dimensions and similarity function.
+
+        With ``truncate_dimensions`` configured the index is sized for the truncated
+        vectors, and ``vector_quantization`` enables int8 quantization of the index.
+        """
+        if self.truncate_dimensions:
+            dimensions = min(dimensions, self.truncate_dimensions)
+
+        try:
+            cypher = _vector_index_query(
+                self.vector_index,
+                self.node_label,
+                self.embedding_property,
+                dimensions,
+                similarity,
+                self.vector_quantization,
+            )
+            async with self.driver.session(database=self.database) as session:
+                await session.run(cypher)
+            logger.info(f"Vector index {self.vector_index} ensured")
+
+        except Exception as e:
+            logger.error(f"Error ensuring vector index: {e}")
+
+    async def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Get recently ingested sources for a tenant."""
+        try:
+            async with self.driver.session(database=self.database) as session:
+                result = await session.run(_RECENT_SOURCES_QUERY, tenant=tenant_id, limit=limit)
+                return [_record_to_source(record) async for record in result]
+
+        except Exception as e:
+            logger.error(f"Neo4j async get_recent_sources error: {e}")
+            return []
+
+    async def close(self):
+        """Close the Neo4j connection unless the driver is shared."""
+        if self._owns_driver:
+            await self.driver.close()
+
+
 class Neo4jConfig:
     """Configuration for Neo4j store."""
 
@@ -290,6 +963,11 @@ class Neo4jConfig:
         vector_index: str = "document_embeddings",
         node_label: str = "Document",
         embedding_property: str = "embedding",
+        upsert_batch_size: int = 500,
+        truncate_dimensions: int | None = None,
+        vector_quantization: bool = False,
+        max_connection_pool_size: int = 100,
+        connection_timeout: float = 30.0,
     ):
         self.uri = uri
         self.user = user
@@ -298,3 +976,12 @@ class Neo4jConfig:
         self.vector_index = vector_index
         self.node_label = node_label
         self.embedding_property = embedding_property
+        # Chunks per UNWIND statement during ingestion; larger batches mean fewer round trips
+        self.upsert_batch_size = upsert_batch_size
+        # Matryoshka-style truncation applied to stored and query embeddings (None keeps all)
+        self.truncate_dimensions = truncate_dimensions
+        # int8-quantized vector index (Neo4j 5.23+), roughly 4x less index memory
+        self.vector_quantization = vector_quantization
+        # Driver connection pool (DatabaseConfig.neo4j_pool_max_size in the registry)
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_timeout = connection_timeout
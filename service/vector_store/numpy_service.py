@@ -0,0 +1,509 @@
+"""In-process NumPy vector store for small tenants and network-free testing."""
+
+from collections import Counter
+from datetime import datetime
+import json
+import logging
+import math
+import os
+from pathlib import Path
+import re
+import tempfile
+import threading
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+from .identity import chunk_ids, document_source_id
+from .ports import IEmbeddingStore, IHybridVectorStore, IReindexableStore
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> list[str]:
+    """Lowercase word tokenization used for BM25 scoring."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _normalize_rows(matrix):
+    """L2-normalize rows so a dot product equals cosine similarity."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _top_k(scores, k: int):
+    """Indices of the k highest scores, best first, without sorting every candidate."""
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.size:
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(scores.size)
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _min_max(scores):
+    """Scale scores into [0, 1] for relative score fusion."""
+    if scores.size == 0:
+        return scores
+    low, high = float(scores.min()), float(scores.max())
+    if high - low < 1e-12:
+        return np.ones_like(scores) if high > 0 else np.zeros_like(scores)
+    return (scores - low) / (high - low)
+
+
+class _TenantIndex:
+    """Contiguous float32 matrix of normalized embeddings plus chunk records and BM25 stats."""
+
+    def __init__(self, dimensions: int, vectors=None, records: list[dict[str, Any]] | None = None):
+        self.dimensions = dimensions
+        self.records: list[dict[str, Any]] = records or []
+        self.size = len(self.records)
+        # Rows beyond ``size`` are spare capacity so appends amortize to O(1)
+        self.vectors = (
+            vectors if vectors is not None else np.empty((0, dimensions), dtype=np.float32)
+        )
+
+        self.term_freqs: list[Counter] = []
+        self.doc_lengths: list[int] = []
+        self.doc_freqs: Counter = Counter()
+        self.total_length = 0
+        for record in self.records:
+            self._index_terms(record["text"])
+
+    def _index_terms(self, text: str) -> None:
+        terms = Counter(_tokenize(text))
+        length = sum(terms.values())
+        self.term_freqs.append(terms)
+        self.doc_lengths.append(length)
+        self.doc_freqs.update(terms.keys())
+        self.total_length += length
+
+    def matrix(self):
+        """View of the populated rows."""
+        return self.vectors[: self.size]
+
+    def append(self, embeddings, records: list[dict[str, Any]]) -> None:
+        """Append normalized embeddings and their records, growing capacity geometrically."""
+        needed = self.size + len(records)
+        if needed > self.vectors.shape[0] or not self.vectors.flags.writeable:
+            capacity = max(needed, 2 * self.vectors.shape[0], 64)
+            grown = np.empty((capacity, self.dimensions), dtype=np.float32)
+            grown[: self.size] = self.vectors[: self.size]
+            self.vectors = grown
+
+        self.vectors[self.size : needed] = embeddings
+        self.size = needed
+        self.records.extend(records)
+        for record in records:
+            self._index_terms(record["text"])
+
+    def subset(self, rows: list[int]) -> "_TenantIndex":
+        """New index holding only the given rows, in order (BM25 statistics rebuilt)."""
+        return _TenantIndex(self.dimensions, self.vectors[rows], [self.records[i] for i in rows])
+
+    def bm25_scores(self, query: str, k1: float, b: float):
+        """Okapi BM25 score of every chunk for the query."""
+        scores = np.zeros(self.size, dtype=np.float32)
+        if not self.size:
+            return scores
+
+        avg_length = self.total_length / self.size or 1.0
+        for term in set(_tokenize(query)):
+            doc_freq = self.doc_freqs.get(term, 0)
+            if not doc_freq:
+                continue
+            idf = math.log(1 + (self.size - doc_freq + 0.5) / (doc_freq + 0.5))
+            for i, terms in enumerate(self.term_freqs):
+                tf = terms.get(term, 0)
+                if tf:
+                    norm = 1 - b + b * self.doc_lengths[i] / avg_length
+                    scores[i] += idf * tf * (k1 + 1) / (tf + k1 * norm)
+        return scores
+
+
+class NumpyStore(IHybridVectorStore, IReindexableStore, IEmbeddingStore):
+    """
+    In-process vector store backed by one contiguous float32 NumPy matrix per tenant.
+
+    Search is exact cosine similarity (one matrix-vector product plus ``argpartition``
+    top-k), and ``hybrid_search`` fuses it with BM25 keyword scores. Suitable for
+    tenants with a few thousand chunks, as a local tier in CompoundVectorStore, and
+    as a network-free stand-in for Neo4j/Weaviate in tests.
+
+    With ``persist_dir`` set, each tenant is saved as ``<tenant>.npy`` plus a JSON
+    record file and reloaded memory-mapped on first access.
+    """
+
+    def __init__(self, config):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed. Install with: pip install numpy")
+
+        self.embedding_dimensions = config.embedding_dimensions
+        self.persist_dir = Path(config.persist_dir) if config.persist_dir else None
+        self.max_chunks_per_tenant = config.max_chunks_per_tenant
+        self.bm25_k1 = config.bm25_k1
+        self.bm25_b = config.bm25_b
+
+        self._tenants: dict[str, _TenantIndex] = {}
+        # Tenants dropped for outgrowing the store; they are never re-admitted
+        self._evicted: set[str] = set()
+        # Tenants changed since they were last written to ``persist_dir``
+        self._dirty: set[str] = set()
+        self._lock = threading.RLock()
+
+        if self.persist_dir:
+            self.persist_dir.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"NumpyStore initialized (persist_dir={self.persist_dir})")
+
+    def _tenant_paths(self, tenant_id: str) -> tuple[Path, Path]:
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", tenant_id)
+        return self.persist_dir / f"{safe_name}.npy", self.persist_dir / f"{safe_name}.json"
+
+    def _get_tenant(self, tenant_id: str) -> _TenantIndex | None:
+        """Return the tenant index, loading it memory-mapped from disk if persisted."""
+        index = self._tenants.get(tenant_id)
+        if index is not None or not self.persist_dir:
+            return index
+
+        vectors_path, records_path = self._tenant_paths(tenant_id)
+        if not vectors_path.exists() or not records_path.exists():
+            return None
+
+        with records_path.open(encoding="utf-8") as f:
+            records = json.load(f)
+        vectors = np.load(vectors_path, mmap_mode="r")
+        index = _TenantIndex(self.embedding_dimensions, vectors, records)
+        self._tenants[tenant_id] = index
+        logger.info(f"Loaded {index.size} chunks for tenant {tenant_id} from {vectors_path}")
+        return index
+
+    def _persist(self, tenant_id: str, index: _TenantIndex) -> None:
+        # Write beside the originals and swap them in: the index may still be a
+        # memory map of the .npy being replaced, so it must not be written in place
+        vectors_path, records_path = self._tenant_paths(tenant_id)
+        fd, tmp_path = tempfile.mkstemp(dir=self.persist_dir, suffix=".npy.tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, index.matrix())
+        Path(tmp_path).replace(vectors_path)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.persist_dir, suffix=".json.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(index.records, f)
+        Path(tmp_path).replace(records_path)
+        self._dirty.discard(tenant_id)
+
+    def has_tenant(self, tenant_id: str) -> bool:
+        """Whether this store holds any chunks for the tenant."""
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            return index is not None and index.size > 0
+
+    def drop_tenant(self, tenant_id: str) -> None:
+        """Forget a tenant, including any persisted files."""
+        with self._lock:
+            self._tenants.pop(tenant_id, None)
+            self._dirty.discard(tenant_id)
+            if self.persist_dir:
+                for path in self._tenant_paths(tenant_id):
+                    path.unlink(missing_ok=True)
+
+    def is_evicted(self, tenant_id: str) -> bool:
+        """Whether the tenant was dropped for exceeding ``max_chunks_per_tenant``."""
+        with self._lock:
+            return tenant_id in self._evicted
+
+    def _evict(self, tenant_id: str) -> None:
+        # The tenant outgrew the local tier; later writes are refused so it never
+        # comes back holding only part of its corpus
+        logger.warning(
+            f"Tenant {tenant_id} would exceed {self.max_chunks_per_tenant} local chunks, "
+            "dropping it from the local store"
+        )
+        self.drop_tenant(tenant_id)
+        self._evicted.add(tenant_id)
+
+    def _to_result(self, record: dict[str, Any], score: float) -> dict[str, Any]:
+        return {
+            "id": record["id"],
+            "text": record["text"],
+            "source": record["source"],
+            "score": score,
+            "created_at": record["created_at"],
+            "chunk_index": record["chunk_index"],
+            "tenant_id": record["tenant_id"],
+        }
+
+    def search(self, tenant_id: str, query_vector: list[float], k: int = 5) -> list[dict[str, Any]]:
+        """Exact cosine similarity search over the tenant matrix."""
+        return self.search_many(tenant_id, [query_vector], k)[0]
+
+    def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """Score all query vectors with a single matrix multiply."""
+        if not query_vectors:
+            return []
+
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            if index is None or not index.size:
+                return [[] for _ in query_vectors]
+
+            queries = _normalize_rows(np.asarray(query_vectors, dtype=np.float32))
+            scores = index.matrix() @ queries.T
+
+            return [
+                [
+                    self._to_result(index.records[i], float(scores[i, q]))
+                    for i in _top_k(scores[:, q], k)
+                ]
+                for q in range(len(query_vectors))
+            ]
+
+    def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """Append document chunks to the tenant matrix (and persist if configured)."""
+        if not chunks:
+            return ""
+
+        source_id = document_source_id(tenant_id, title)
+        now = datetime.utcnow().isoformat() + "Z"
+        ids = chunk_ids(tenant_id, title, chunks)
+        positions = {chunk_id: i for i, chunk_id in enumerate(ids)}
+
+        with self._lock:
+            if tenant_id in self._evicted:
+                return ""
+
+            index = self._get_tenant(tenant_id)
+            stored = {record["id"] for record in index.records} if index else set()
+            new = [
+                i
+                for i, embedding in enumerate(embeddings[: len(chunks)])
+                if embedding is not None and ids[i] not in stored
+            ]
+            current_size = index.size if index else 0
+            if current_size + len(new) > self.max_chunks_per_tenant:
+                self._evict(tenant_id)
+                return ""
+
+            if index is None:
+                index = _TenantIndex(self.embedding_dimensions)
+                self._tenants[tenant_id] = index
+
+            # Drop chunks that the previous version of this document had
+            rows = [
+                i
+                for i, record in enumerate(index.records)
+                if record["source"] != title or record["id"] in positions
+            ]
+            removed = index.size - len(rows)
+            if removed:
+                index = index.subset(rows)
+                self._tenants[tenant_id] = index
+
+            # Chunks kept from the previous version may have moved within the document
+            moved = 0
+            for record in index.records:
+                if record["id"] in positions and record["chunk_index"] != positions[record["id"]]:
+                    record["chunk_index"] = positions[record["id"]]
+                    record["source_id"] = source_id
+                    moved += 1
+
+            records = [
+                {
+                    "id": ids[i],
+                    "text": chunks[i],
+                    "source": title,
+                    "source_id": source_id,
+                    "created_at": now,
+                    "chunk_index": i,
+                    "tenant_id": tenant_id,
+                }
+                for i in new
+            ]
+            if records:
+                vectors = np.asarray([embeddings[i] for i in new], dtype=np.float32)
+                index.append(_normalize_rows(vectors), records)
+
+            if records or removed or moved:
+                self._dirty.add(tenant_id)
+            if self.persist_dir and tenant_id in self._dirty:
+                self._persist(tenant_id, index)
+
+        logger.info(
+            f"Inserted {len(records)} new chunks for source {title}, removed {removed} stale chunks"
+        )
+        return source_id
+
+    def iter_chunk_page(
+        self, tenant_id: str, after: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Read one page of the tenant's chunks in chunk id order, with stored embeddings."""
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            if index is None:
+                return [], None
+
+            order = sorted(
+                (record["id"], i)
+                for i, record in enumerate(index.records)
+                if after is None or record["id"] > after
+            )
+            page = [
+                {**index.records[i], "embedding": index.vectors[i].tolist()}
+                for _, i in order[:limit]
+            ]
+
+        cursor = page[-1]["id"] if len(order) > limit else None
+        return page, cursor
+
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """Return the chunk ids the tenant does not hold."""
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            stored = {record["id"] for record in index.records} if index else set()
+        return set(chunk_ids) - stored
+
+    def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored embeddings of the given chunks."""
+        wanted = set(chunk_ids)
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            if index is None:
+                return {}
+            return {
+                record["id"]: index.vectors[i].tolist()
+                for i, record in enumerate(index.records)
+                if record["id"] in wanted
+            }
+
+    def upsert_chunk_records(self, tenant_id: str, records: list[dict[str, Any]]) -> int:
+        """Append exported chunk records that are not stored yet, keeping their ids."""
+        with self._lock:
+            if tenant_id in self._evicted:
+                return 0
+
+            new_ids = sorted(
+                self.missing_chunk_ids(tenant_id, [record["id"] for record in records])
+            )
+            if not new_ids:
+                return 0
+
+            by_id = {record["id"]: record for record in records}
+            index = self._get_tenant(tenant_id)
+            if (index.size if index else 0) + len(new_ids) > self.max_chunks_per_tenant:
+                self._evict(tenant_id)
+                return 0
+
+            if index is None:
+                index = _TenantIndex(self.embedding_dimensions)
+                self._tenants[tenant_id] = index
+
+            stored = [
+                {
+                    "id": chunk_id,
+                    "text": by_id[chunk_id]["text"],
+                    "source": by_id[chunk_id]["source"],
+                    "source_id": by_id[chunk_id]["source_id"],
+                    "created_at": by_id[chunk_id]["created_at"],
+                    "chunk_index": by_id[chunk_id]["chunk_index"],
+                    "tenant_id": tenant_id,
+                }
+                for chunk_id in new_ids
+            ]
+            embeddings = [by_id[chunk_id]["embedding"] for chunk_id in new_ids]
+            index.append(_normalize_rows(np.asarray(embeddings, dtype=np.float32)), stored)
+
+            self._dirty.add(tenant_id)
+            if self.persist_dir:
+                self._persist(tenant_id, index)
+
+        return len(stored)
+
+    def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Get recently ingested sources for a tenant."""
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            if index is None:
+                return []
+
+            sources: dict[str, dict[str, Any]] = {}
+            for record in index.records:
+                source = sources.setdefault(
+                    record["source_id"],
+                    {
+                        "id": record["source_id"],
+                        "title": record["source"],
+                        "created_at": record["created_at"],
+                        "chunk_count": 0,
+                        "type": "document",
+                    },
+                )
+                source["chunk_count"] += 1
+
+        return sorted(sources.values(), key=lambda s: s["created_at"], reverse=True)[:limit]
+
+    def hybrid_search(
+        self, tenant_id: str, query: str, query_vector: list[float], k: int = 5, alpha: float = 0.7
+    ) -> list[dict[str, Any]]:
+        """
+        Fuse cosine similarity with BM25 keyword scores.
+
+        Both score vectors are min-max scaled to [0, 1] and combined as
+        ``alpha * vector + (1 - alpha) * keyword``.
+        """
+        with self._lock:
+            index = self._get_tenant(tenant_id)
+            if index is None or not index.size:
+                return []
+
+            query_matrix = _normalize_rows(np.asarray([query_vector], dtype=np.float32))
+            vector_scores = (index.matrix() @ query_matrix.T)[:, 0]
+            keyword_scores = index.bm25_scores(query, self.bm25_k1, self.bm25_b)
+            combined = alpha * _min_max(vector_scores) + (1 - alpha) * _min_max(keyword_scores)
+
+            return [
+                self._to_result(index.records[i], float(combined[i])) for i in _top_k(combined, k)
+            ]
+
+    def close(self):
+        """Flush persisted tenants and release in-memory matrices."""
+        with self._lock:
+            if self.persist_dir:
+                for tenant_id in self._dirty & self._tenants.keys():
+                    self._persist(tenant_id, self._tenants[tenant_id])
+            self._tenants.clear()
+            self._dirty.clear()
+
+
+class NumpyConfig:
+    """Configuration for the in-process NumPy store."""
+
+    def __init__(
+        self,
+        embedding_dimensions: int = 1536,
+        persist_dir: str | None = None,
+        max_chunks_per_tenant: int = 50_000,
+        bm25_k1: float = 1.2,
+        bm25_b: float = 0.75,
+    ):
+        self.embedding_dimensions = embedding_dimensions
+        # Directory for memory-mapped tenant matrices; None keeps everything in memory
+        self.persist_dir = persist_dir
+        # Tenants larger than this are left to the network stores
+        self.max_chunks_per_tenant = max_chunks_per_tenant
+        self.bm25_k1 = bm25_k1
+        self.bm25_b = bm25_b
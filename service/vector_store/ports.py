@@ -1,6 +1,7 @@
 """Vector store port interfaces for pluggable vector database implementations."""
 
 from abc import ABC, abstractmethod
+import asyncio
 from typing import Any
 
 
@@ -27,6 +28,25 @@ class IVectorStore(ABC):
         """
         pass
 
+    def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several query vectors at once.
+
+        The default implementation issues one ``search`` per vector; stores that can
+        answer many queries in a single round trip should override it.
+
+        Args:
+            tenant_id: Tenant identifier for multi-tenancy
+            query_vectors: Query vectors for similarity search
+            k: Number of results to return per query
+
+        Returns:
+            One result list per query vector, in the same order
+        """
+        return [self.search(tenant_id, query_vector, k) for query_vector in query_vectors]
+
     @abstractmethod
     def upsert_chunks(
         self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
@@ -34,11 +54,17 @@ class IVectorStore(ABC):
         """
         Insert or update document chunks with embeddings.
 
+        Documents are content-addressed: the source id derives from tenant and
+        title, and chunk ids from the chunk text (see ``identity``). Re-uploading a
+        title updates that document in place, and chunks it no longer contains are
+        deleted. An embedding may be None for a chunk that is already stored; the
+        stored vector is kept (see ``ingestion.upsert_document``).
+
         Args:
             tenant_id: Tenant identifier
             title: Document title/source
             chunks: Text chunks to store
-            embeddings: Corresponding embedding vectors
+            embeddings: Corresponding embedding vectors (None for stored chunks)
 
         Returns:
             Source identifier for the inserted document
@@ -83,3 +109,207 @@ class IHybridVectorStore(IVectorStore):
             List of hybrid search results
         """
         pass
+
+
+class IAsyncVectorStore(ABC):
+    """
+    Async counterpart of IVectorStore.
+
+    Implementations use non-blocking drivers so that callers running on an
+    asyncio event loop (e.g. Temporal activities) can keep many retrievals
+    in flight without stalling the loop.
+    """
+
+    @abstractmethod
+    async def search(
+        self, tenant_id: str, query_vector: list[float], k: int = 5
+    ) -> list[dict[str, Any]]:
+        """
+        Search for similar vectors.
+
+        Args:
+            tenant_id: Tenant identifier for multi-tenancy
+            query_vector: Query vector for similarity search
+            k: Number of results to return
+
+        Returns:
+            List of search results with metadata
+        """
+        pass
+
+    async def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several query vectors at once.
+
+        The default implementation runs one ``search`` per vector concurrently;
+        stores that can answer many queries in a single round trip should override it.
+
+        Args:
+            tenant_id: Tenant identifier for multi-tenancy
+            query_vectors: Query vectors for similarity search
+            k: Number of results to return per query
+
+        Returns:
+            One result list per query vector, in the same order
+        """
+        return list(
+            await asyncio.gather(
+                *(self.search(tenant_id, query_vector, k) for query_vector in query_vectors)
+            )
+        )
+
+    @abstractmethod
+    async def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """
+        Insert or update document chunks with embeddings.
+
+        Documents are content-addressed: the source id derives from tenant and
+        title, and chunk ids from the chunk text (see ``identity``). Re-uploading a
+        title updates that document in place, and chunks it no longer contains are
+        deleted. An embedding may be None for a chunk that is already stored; the
+        stored vector is kept (see ``ingestion.upsert_document``).
+
+        Args:
+            tenant_id: Tenant identifier
+            title: Document title/source
+            chunks: Text chunks to store
+            embeddings: Corresponding embedding vectors (None for stored chunks)
+
+        Returns:
+            Source identifier for the inserted document
+        """
+        pass
+
+    @abstractmethod
+    async def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """
+        Get recently ingested sources for a tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            limit: Maximum number of sources to return
+
+        Returns:
+            List of recent sources with metadata
+        """
+        pass
+
+
+class IAsyncHybridVectorStore(IAsyncVectorStore):
+    """
+    Async extended interface for hybrid search combining vector and keyword search.
+    """
+
+    @abstractmethod
+    async def hybrid_search(
+        self, tenant_id: str, query: str, query_vector: list[float], k: int = 5, alpha: float = 0.7
+    ) -> list[dict[str, Any]]:
+        """
+        Perform hybrid search combining vector similarity and keyword matching.
+
+        Args:
+            tenant_id: Tenant identifier
+            query: Text query for keyword search
+            query_vector: Vector for semantic search
+            k: Number of results to return
+            alpha: Weight for vector vs keyword search (0.0 = keyword only, 1.0 = vector only)
+
+        Returns:
+            List of hybrid search results
+        """
+        pass
+
+
+class IReindexableStore(ABC):
+    """
+    Chunk export/import used to reconcile and re-index stores against each other.
+
+    Chunk records carry the stored data needed to rebuild a chunk elsewhere:
+    ``id`` (the content-hash chunk id), ``text``, ``source``, ``source_id``,
+    ``chunk_index``, ``created_at``, ``tenant_id`` and ``embedding``.
+    """
+
+    @abstractmethod
+    def iter_chunk_page(
+        self, tenant_id: str, after: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """
+        Read one page of a tenant's chunks in stable id order.
+
+        Args:
+            tenant_id: Tenant identifier
+            after: Cursor returned by the previous page (None starts from the beginning)
+            limit: Maximum number of chunks to scan
+
+        Returns:
+            The chunk records and the cursor for the next page (None when exhausted)
+        """
+        pass
+
+    @abstractmethod
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """
+        Return the subset of chunk ids not stored for the tenant.
+
+        Args:
+            tenant_id: Tenant identifier
+            chunk_ids: Chunk ids to look up
+
+        Returns:
+            Ids with no stored chunk
+        """
+        pass
+
+    @abstractmethod
+    def upsert_chunk_records(self, tenant_id: str, records: list[dict[str, Any]]) -> int:
+        """
+        Bulk-load exported chunk records, keeping their ids and embeddings.
+
+        Args:
+            tenant_id: Tenant identifier
+            records: Chunk records as returned by ``iter_chunk_page``
+
+        Returns:
+            Number of chunks written
+        """
+        pass
+
+
+class IEmbeddingStore(ABC):
+    """Batch lookup of stored embeddings, used to rerank ANN candidates exactly."""
+
+    @abstractmethod
+    def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """
+        Fetch the stored embeddings of several chunks in one round trip.
+
+        Args:
+            tenant_id: Tenant identifier
+            chunk_ids: Chunk ids to look up
+
+        Returns:
+            Embedding by chunk id; ids that are not stored are omitted
+        """
+        pass
+
+
+class IAsyncEmbeddingStore(ABC):
+    """Async counterpart of IEmbeddingStore."""
+
+    @abstractmethod
+    async def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """
+        Fetch the stored embeddings of several chunks in one round trip.
+
+        Args:
+            tenant_id: Tenant identifier
+            chunk_ids: Chunk ids to look up
+
+        Returns:
+            Embedding by chunk id; ids that are not stored are omitted
+        """
+        pass
@@ -0,0 +1,175 @@
+"""Reduced-dimension embeddings and recall-vs-memory estimates for vector quantization."""
+
+import math
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+QUANTIZATION_METHODS = ("none", "sq", "bq", "pq")
+
+
+def truncate_embedding(vector: list[float], dimensions: int | None) -> list[float]:
+    """
+    Matryoshka-style truncation: keep the first ``dimensions`` values and re-normalize.
+
+    Matryoshka-trained models (e.g. text-embedding-3-*) front-load information, so
+    a prefix of the vector is itself a usable embedding. Returns the vector
+    unchanged when ``dimensions`` is None or not smaller than its length.
+    """
+    if not dimensions or dimensions >= len(vector):
+        return vector
+
+    prefix = vector[:dimensions]
+    norm = math.sqrt(sum(value * value for value in prefix))
+    return [value / norm for value in prefix] if norm else prefix
+
+
+def truncate_embeddings(vectors: list[list[float]], dimensions: int | None) -> list[list[float]]:
+    """Apply truncate_embedding to every vector (None entries are passed through)."""
+    if not dimensions:
+        return vectors
+    return [vector and truncate_embedding(vector, dimensions) for vector in vectors]
+
+
+def bytes_per_vector(dimensions: int, method: str = "none", pq_segments: int | None = None) -> int:
+    """
+    Approximate in-memory size of one indexed vector (graph links excluded).
+
+    float32 for "none", int8 for scalar ("sq"), one bit per dimension for binary
+    ("bq") and one byte code per segment for product quantization ("pq").
+    """
+    if method == "sq":
+        return dimensions
+    if method == "bq":
+        return math.ceil(dimensions / 8)
+    if method == "pq":
+        return pq_segments or _default_pq_segments(dimensions)
+    return dimensions * 4
+
+
+def _default_pq_segments(dimensions: int) -> int:
+    # Weaviate's default: one segment per 4-6 dimensions, must divide the dimension count
+    for width in (4, 5, 6, 3, 2, 1):
+        if dimensions % width == 0:
+            return dimensions // width
+    return dimensions
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _quantize(matrix, method: str, pq_segments: int | None, seed: int = 0):
+    """Round-trip a (normalized) matrix through a quantizer, returning what search sees."""
+    if method == "sq":
+        # Per-dimension int8 buckets between observed min and max
+        low, high = matrix.min(axis=0), matrix.max(axis=0)
+        scale = np.where(high > low, (high - low) / 255.0, 1.0)
+        codes = np.round((matrix - low) / scale)
+        return codes * scale + low
+    if method == "bq":
+        return np.where(matrix >= 0, 1.0, -1.0).astype(np.float32)
+    if method == "pq":
+        return _product_quantize(matrix, pq_segments or _default_pq_segments(matrix.shape[1]), seed)
+    return matrix
+
+
+def _product_quantize(matrix, segments: int, seed: int, centroids: int = 256, iterations: int = 8):
+    """Per-segment k-means codebooks (a small stand-in for Weaviate's PQ training)."""
+    rng = np.random.default_rng(seed)
+    rows, dims = matrix.shape
+    centroids = min(centroids, rows)
+    reconstructed = np.empty_like(matrix)
+
+    for segment in np.array_split(np.arange(dims), segments):
+        sub = matrix[:, segment]
+        codebook = sub[rng.choice(rows, centroids, replace=False)]
+        for _ in range(iterations):
+            distances = (sub**2).sum(1)[:, None] - 2 * sub @ codebook.T + (codebook**2).sum(1)
+            assignment = distances.argmin(axis=1)
+            counts = np.bincount(assignment, minlength=centroids)
+            sums = np.zeros_like(codebook)
+            np.add.at(sums, assignment, sub)
+            filled = counts > 0
+            codebook[filled] = sums[filled] / counts[filled, None]
+        reconstructed[:, segment] = codebook[assignment]
+
+    return reconstructed
+
+
+def _top_k(corpus, queries, k: int):
+    scores = queries @ corpus.T
+    top = np.argpartition(-scores, min(k, scores.shape[1] - 1), axis=1)[:, :k]
+    return [set(row) for row in top]
+
+
+def recall_memory_report(
+    corpus: list[list[float]],
+    queries: list[list[float]],
+    dimension_options: list[int | None],
+    methods: tuple[str, ...] = QUANTIZATION_METHODS,
+    k: int = 10,
+    pq_segments: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Recall@k and memory per (truncated dimensions, quantization) setting.
+
+    Ground truth is exact cosine search over the full-precision, full-dimension
+    corpus; each setting runs exact search over the truncated and quantized
+    vectors, so the figures isolate compression loss from HNSW approximation.
+
+    Args:
+        corpus: Embeddings of the indexed chunks
+        queries: Query embeddings
+        dimension_options: Truncated sizes to evaluate (None keeps full dimensions)
+        methods: Quantization methods ("none", "sq", "bq", "pq")
+        k: Cut-off for recall
+        pq_segments: PQ segment count (defaults to Weaviate's rule of thumb)
+
+    Returns:
+        One dict per setting with dimensions, quantization, recall_at_k,
+        bytes_per_vector, corpus_megabytes and compression (vs float32 full size)
+    """
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy is required for the quantization report. Install with: pip install numpy"
+        )
+
+    full_corpus = _normalize_rows(np.asarray(corpus, dtype=np.float32))
+    full_queries = _normalize_rows(np.asarray(queries, dtype=np.float32))
+    full_dimensions = full_corpus.shape[1]
+    truth = _top_k(full_corpus, full_queries, k)
+    full_bytes = bytes_per_vector(full_dimensions)
+
+    report = []
+    for dimensions in dimension_options:
+        dimensions = min(dimensions or full_dimensions, full_dimensions)
+        reduced_corpus = _normalize_rows(full_corpus[:, :dimensions])
+        reduced_queries = _normalize_rows(full_queries[:, :dimensions])
+
+        for method in methods:
+            # Queries stay full precision, as in Weaviate's asymmetric distance
+            found = _top_k(_quantize(reduced_corpus, method, pq_segments), reduced_queries, k)
+            recall = sum(len(t & f) for t, f in zip(truth, found, strict=True)) / (k * len(truth))
+            size = bytes_per_vector(dimensions, method, pq_segments)
+            report.append(
+                {
+                    "dimensions": dimensions,
+                    "quantization": method,
+                    "recall_at_k": round(recall, 4),
+                    "k": k,
+                    "bytes_per_vector": size,
+                    "corpus_megabytes": round(size * len(full_corpus) / 1_000_000, 3),
+                    "compression": round(full_bytes / size, 1),
+                }
+            )
+
+    return report
@@ -0,0 +1,384 @@
+"""Process-wide registry of pooled vector store drivers and the stores built on them."""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any
+
+from .compound_service import AsyncCompoundVectorStore, CompoundStoreConfig, CompoundVectorStore
+from .neo4j_service import (
+    AsyncNeo4jStore,
+    Neo4jConfig,
+    Neo4jStore,
+    create_async_driver,
+    create_driver,
+)
+from .weaviate_service import (
+    AsyncWeaviateStore,
+    WeaviateConfig,
+    WeaviateStore,
+    async_client,
+    connect_client,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _config_key(kind: str, config) -> tuple:
+    return (kind, *sorted(vars(config).items()))
+
+
+class VectorStoreRegistry:
+    """
+    Owns pooled Neo4j drivers and Weaviate clients and hands out stores that share them.
+
+    Activities ask the registry for a store instead of constructing one, so
+    connection pools and schema checks are paid once per process rather than
+    once per call. Drivers are keyed by server and credentials, stores by their
+    full config. ``health_check`` pings every open connection and drops broken
+    ones so the next access reconnects; ``close``/``aclose`` release everything
+    on worker shutdown.
+
+    Async drivers are bound to the event loop that first uses them, so use the
+    async accessors from one loop (the worker's). Concurrent tasks on that loop
+    asking for the same async store share one connect.
+    """
+
+    def __init__(
+        self,
+        neo4j_config: Neo4jConfig | None = None,
+        weaviate_config: WeaviateConfig | None = None,
+        compound_config: CompoundStoreConfig | None = None,
+    ):
+        self.neo4j_config = neo4j_config
+        self.weaviate_config = weaviate_config
+        self.compound_config = compound_config or CompoundStoreConfig()
+
+        self._connections: dict[tuple, Any] = {}
+        self._stores: dict[tuple, Any] = {}
+        self._lock = threading.RLock()
+        # Per async store key, held while it connects (see _async_store)
+        self._async_locks: dict[tuple, asyncio.Lock] = {}
+        self._closed = False
+
+    @classmethod
+    def from_database_config(
+        cls,
+        database_config: "DatabaseConfig",  # noqa: F821 - shared.config.DatabaseConfig
+        weaviate_config: WeaviateConfig | None = None,
+        compound_config: CompoundStoreConfig | None = None,
+        **neo4j_options,
+    ) -> "VectorStoreRegistry":
+        """
+        Build a registry whose Neo4j pool follows DatabaseConfig.
+
+        Args:
+            database_config: Application database settings (neo4j_* fields are used)
+            weaviate_config: Weaviate settings (None disables Weaviate)
+            compound_config: Strategy and fusion settings for compound_store()
+            **neo4j_options: Further Neo4jConfig options (vector_index, node_label, ...)
+        """
+        neo4j_config = Neo4jConfig(
+            uri=database_config.neo4j_uri,
+            user=database_config.neo4j_user,
+            password=database_config.neo4j_password,
+            database=database_config.neo4j_database,
+            max_connection_pool_size=database_config.neo4j_pool_max_size,
+            connection_timeout=database_config.neo4j_connection_timeout_seconds,
+            **neo4j_options,
+        )
+        return cls(neo4j_config, weaviate_config, compound_config)
+
+    # Connections
+
+    def _connection(self, key: tuple, factory) -> Any:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("VectorStoreRegistry is closed")
+            if key not in self._connections:
+                self._connections[key] = factory()
+                logger.info(f"Opened pooled {key[0]} connection to {key[1]}")
+            return self._connections[key]
+
+    def neo4j_driver(self, config: Neo4jConfig | None = None):
+        """Shared synchronous driver for the config's server and user."""
+        config = config or self.neo4j_config
+        return self._connection(("neo4j", config.uri, config.user), lambda: create_driver(config))
+
+    def weaviate_client(self, config: WeaviateConfig | None = None):
+        """Shared synchronous client for the config's cluster."""
+        config = config or self.weaviate_config
+        return self._connection(
+            ("weaviate", config.url, config.api_key), lambda: connect_client(config)
+        )
+
+    def async_neo4j_driver(self, config: Neo4jConfig | None = None):
+        """Shared async driver for the config's server and user."""
+        config = config or self.neo4j_config
+        return self._connection(
+            ("async_neo4j", config.uri, config.user), lambda: create_async_driver(config)
+        )
+
+    def async_weaviate_client(self, config: WeaviateConfig | None = None):
+        """Shared async client for the config's cluster (connected by the first store)."""
+        config = config or self.weaviate_config
+        return self._connection(
+            ("async_weaviate", config.url, config.api_key), lambda: async_client(config)
+        )
+
+    # Stores
+
+    def _store(self, key: tuple, factory) -> Any:
+        with self._lock:
+            if key not in self._stores:
+                self._stores[key] = factory()
+            return self._stores[key]
+
+    def neo4j_store(self, config: Neo4jConfig | None = None) -> Neo4jStore:
+        """Neo4jStore on the shared driver (constraints are ensured once per config)."""
+        config = config or self.neo4j_config
+        return self._store(
+            _config_key("neo4j", config), lambda: Neo4jStore(config, self.neo4j_driver(config))
+        )
+
+    def weaviate_store(self, config: WeaviateConfig | None = None) -> WeaviateStore:
+        """WeaviateStore on the shared client (schema is ensured once per config)."""
+        config = config or self.weaviate_config
+        return self._store(
+            _config_key("weaviate", config),
+            lambda: WeaviateStore(config, self.weaviate_client(config)),
+        )
+
+    def compound_store(self) -> CompoundVectorStore:
+        """CompoundVectorStore over whichever configured backends can be reached."""
+        return self._store(("compound",), self._build_compound)
+
+    def _build_compound(self) -> CompoundVectorStore:
+        neo4j_store = weaviate_store = None
+        if self.neo4j_config:
+            try:
+                neo4j_store = self.neo4j_store()
+            except Exception as e:
+                logger.warning(f"Neo4j store unavailable, compound store runs without it: {e}")
+        if self.weaviate_config:
+            try:
+                weaviate_store = self.weaviate_store()
+            except Exception as e:
+                logger.warning(f"Weaviate store unavailable, compound store runs without it: {e}")
+        return CompoundVectorStore.from_config(self.compound_config, neo4j_store, weaviate_store)
+
+    async def _async_store(self, key: tuple, factory) -> Any:
+        """Async counterpart of _store: ``factory`` is awaited once per key, even concurrently."""
+        with self._lock:
+            store = self._stores.get(key)
+            lock = self._async_locks.setdefault(key, asyncio.Lock())
+        if store is not None:
+            return store
+
+        async with lock:
+            with self._lock:
+                store = self._stores.get(key)
+            if store is None:
+                store = await factory()
+                with self._lock:
+                    self._stores[key] = store
+        return store
+
+    async def async_neo4j_store(self, config: Neo4jConfig | None = None) -> AsyncNeo4jStore:
+        """Connected AsyncNeo4jStore on the shared async driver."""
+        config = config or self.neo4j_config
+
+        async def connect() -> AsyncNeo4jStore:
+            store = AsyncNeo4jStore(config, self.async_neo4j_driver(config))
+            await store.connect()
+            return store
+
+        return await self._async_store(_config_key("async_neo4j", config), connect)
+
+    async def async_weaviate_store(
+        self, config: WeaviateConfig | None = None
+    ) -> AsyncWeaviateStore:
+        """Connected AsyncWeaviateStore on the shared async client."""
+        config = config or self.weaviate_config
+
+        async def connect() -> AsyncWeaviateStore:
+            store = AsyncWeaviateStore(config, self.async_weaviate_client(config))
+            await store.connect()
+            return store
+
+        return await self._async_store(_config_key("async_weaviate", config), connect)
+
+    async def async_compound_store(self) -> AsyncCompoundVectorStore:
+        """AsyncCompoundVectorStore over whichever configured backends can be reached."""
+        return await self._async_store(("async_compound",), self._build_async_compound)
+
+    async def _build_async_compound(self) -> AsyncCompoundVectorStore:
+        neo4j_store = weaviate_store = None
+        if self.neo4j_config:
+            try:
+                neo4j_store = await self.async_neo4j_store()
+            except Exception as e:
+                logger.warning(f"Neo4j store unavailable, compound store runs without it: {e}")
+        if self.weaviate_config:
+            try:
+                weaviate_store = await self.async_weaviate_store()
+            except Exception as e:
+                logger.warning(f"Weaviate store unavailable, compound store runs without it: {e}")
+        return AsyncCompoundVectorStore.from_config(
+            self.compound_config, neo4j_store, weaviate_store
+        )
+
+    # Health and lifecycle
+
+    def _drop(self, key: tuple) -> Any:
+        """
+        Forget a connection and close every store built on it (caller holds the lock).
+
+        Synchronous stores are closed here, which shuts down the compound store's
+        search executor; the async stores hold nothing beyond the shared connection.
+        """
+        connection = self._connections.pop(key)
+        compound = "async_compound" if key[0].startswith("async") else "compound"
+        for store_key in [k for k in self._stores if k[0] in (key[0], compound)]:
+            store = self._stores.pop(store_key)
+            if not store_key[0].startswith("async"):
+                _close_quietly(store.close)
+        return connection
+
+    def health_check(self) -> dict[str, dict[str, Any]]:
+        """
+        Ping every open synchronous connection.
+
+        Broken connections are closed and forgotten together with their stores,
+        so the next store request reconnects.
+
+        Returns:
+            Per connection: healthy, latency_ms and error
+        """
+        report = {}
+        with self._lock:
+            connections = [(k, c) for k, c in self._connections.items() if "async" not in k[0]]
+
+        for key, connection in connections:
+            started = time.perf_counter()
+            try:
+                if key[0] == "neo4j":
+                    connection.verify_connectivity()
+                elif not connection.is_ready():
+                    raise ConnectionError("Weaviate is not ready")
+                report[f"{key[0]}:{key[1]}"] = _health(True, started)
+            except Exception as e:
+                report[f"{key[0]}:{key[1]}"] = _health(False, started, e)
+                logger.warning(f"{key[0]} connection to {key[1]} unhealthy, reconnecting: {e}")
+                with self._lock:
+                    self._drop(key)
+                _close_quietly(connection.close)
+        return report
+
+    async def ahealth_check(self) -> dict[str, dict[str, Any]]:
+        """Async counterpart of health_check for the async connections."""
+        report = {}
+        with self._lock:
+            connections = [(k, c) for k, c in self._connections.items() if "async" in k[0]]
+
+        for key, connection in connections:
+            started = time.perf_counter()
+            try:
+                if key[0] == "async_neo4j":
+                    await connection.verify_connectivity()
+                elif not await connection.is_ready():
+                    raise ConnectionError("Weaviate is not ready")
+                report[f"{key[0]}:{key[1]}"] = _health(True, started)
+            except Exception as e:
+                report[f"{key[0]}:{key[1]}"] = _health(False, started, e)
+                logger.warning(f"{key[0]} connection to {key[1]} unhealthy, reconnecting: {e}")
+                with self._lock:
+                    self._drop(key)
+                try:
+                    await connection.close()
+                except Exception as close_error:
+                    logger.debug(f"Closing {key[0]} connection failed: {close_error}")
+        return report
+
+    def close(self) -> None:
+        """Close every synchronous store and connection."""
+        with self._lock:
+            for key in [k for k in self._stores if "async" not in k[0]]:
+                _close_quietly(self._stores.pop(key).close)
+            for key in [k for k in self._connections if "async" not in k[0]]:
+                _close_quietly(self._connections.pop(key).close)
+        logger.info("Vector store registry closed synchronous connections")
+
+    async def aclose(self) -> None:
+        """Close every store and connection, async ones included; the registry is then unusable."""
+        with self._lock:
+            stores = [(k, self._stores.pop(k)) for k in list(self._stores) if "async" in k[0]]
+            connections = [
+                (k, self._connections.pop(k)) for k in list(self._connections) if "async" in k[0]
+            ]
+        for key, store in stores:
+            if key[0] != "async_compound":
+                await store.close()
+        for key, connection in connections:
+            try:
+                await connection.close()
+            except Exception as e:
+                logger.debug(f"Closing {key[0]} connection failed: {e}")
+        self.close()
+        self._closed = True
+
+
+def _health(healthy: bool, started: float, error: Exception | None = None) -> dict[str, Any]:
+    return {
+        "healthy": healthy,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+        "error": str(error) if error else None,
+    }
+
+
+def _close_quietly(close) -> None:
+    try:
+        close()
+    except Exception as e:
+        logger.debug(f"Error while closing vector store resource: {e}")
+
+
+_registry: VectorStoreRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_vector_store_registry() -> VectorStoreRegistry:
+    """
+    Process-wide registry, created on first use from the application settings.
+
+    Neo4j follows ``get_settings().database``; Weaviate is enabled by the
+    WEAVIATE_URL environment variable (with optional WEAVIATE_API_KEY).
+    """
+    global _registry
+
+    with _registry_lock:
+        if _registry is None:
+            from shared.config import get_settings
+
+            weaviate_url = os.getenv("WEAVIATE_URL")
+            weaviate_config = (
+                WeaviateConfig(url=weaviate_url, api_key=os.getenv("WEAVIATE_API_KEY"))
+                if weaviate_url
+                else None
+            )
+            _registry = VectorStoreRegistry.from_database_config(
+                get_settings().database, weaviate_config
+            )
+        return _registry
+
+
+async def close_vector_store_registry() -> None:
+    """Close the process-wide registry (call on worker shutdown); no-op if never used."""
+    global _registry
+
+    with _registry_lock:
+        registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
@@ -0,0 +1,230 @@
+"""Streaming, resumable reconciliation of chunks between vector stores."""
+
+from dataclasses import dataclass
+from datetime import datetime
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any
+
+from .identity import document_source_id
+from .ports import IReindexableStore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReindexStats:
+    """Progress of one reindex run (one direction, one tenant)."""
+
+    job: str
+    tenant_id: str
+    scanned: int = 0
+    copied: int = 0
+    pages: int = 0
+    elapsed_seconds: float = 0.0
+    completed: bool = False
+    cursor: str | None = None
+
+    @property
+    def chunks_per_second(self) -> float:
+        return self.scanned / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class FileCheckpointStore:
+    """Reindex checkpoints in a JSON file, keyed by job and tenant."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, Any]:
+        if not self.path.exists():
+            return {}
+        with open(self.path) as f:
+            return json.load(f)
+
+    def load(self, key: str) -> dict[str, Any]:
+        with self._lock:
+            return self._read().get(key, {})
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        with self._lock:
+            checkpoints = self._read()
+            checkpoints[key] = state
+            # Write-then-rename so a crash never leaves a truncated checkpoint file
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(checkpoints, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class ReindexJob:
+    """
+    Copy chunks missing from ``target`` out of ``source`` for one tenant.
+
+    Chunks are streamed from the source in pages (text, metadata and embedding),
+    checked against the target by chunk id and bulk-loaded when missing. The
+    cursor is checkpointed after every page, so an interrupted run resumes where
+    it stopped; a finished run resets the cursor so the next one rescans.
+
+    ``max_chunks_per_second`` throttles scanning so the job can run alongside
+    production traffic.
+    """
+
+    def __init__(
+        self,
+        source: IReindexableStore,
+        target: IReindexableStore,
+        tenant_id: str,
+        checkpoints: FileCheckpointStore | None = None,
+        name: str = "reindex",
+        page_size: int = 500,
+        max_chunks_per_second: float | None = None,
+    ):
+        self.source = source
+        self.target = target
+        self.tenant_id = tenant_id
+        self.checkpoints = checkpoints
+        self.name = name
+        self.page_size = page_size
+        self.max_chunks_per_second = max_chunks_per_second
+
+    @property
+    def checkpoint_key(self) -> str:
+        return f"{self.name}:{self.tenant_id}"
+
+    def run(
+        self, max_pages: int | None = None, stop_event: threading.Event | None = None
+    ) -> ReindexStats:
+        """
+        Stream pages until the source is exhausted, ``max_pages`` is reached or
+        ``stop_event`` is set.
+
+        Args:
+            max_pages: Pages to process in this run (None runs to the end)
+            stop_event: Set from another thread to stop after the current page
+
+        Returns:
+            ReindexStats for this run; ``completed`` is False if it stopped early or failed
+        """
+        state = self.checkpoints.load(self.checkpoint_key) if self.checkpoints else {}
+        stats = ReindexStats(self.name, self.tenant_id, cursor=state.get("cursor"))
+        started = time.perf_counter()
+
+        try:
+            while not (stop_event and stop_event.is_set()):
+                if max_pages is not None and stats.pages >= max_pages:
+                    break
+
+                records, next_cursor = self.source.iter_chunk_page(
+                    self.tenant_id, stats.cursor, self.page_size
+                )
+                stats.scanned += len(records)
+                stats.copied += self._copy_missing(records)
+                stats.pages += 1
+                stats.cursor = next_cursor
+                stats.completed = next_cursor is None
+                self._save_checkpoint(state, stats)
+
+                if stats.completed:
+                    break
+                self._throttle(stats.scanned, started, stop_event)
+
+        except Exception as e:
+            logger.error(f"Reindex {self.checkpoint_key} failed at cursor {stats.cursor}: {e}")
+
+        stats.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Reindex {self.checkpoint_key}: scanned {stats.scanned}, copied {stats.copied} "
+            f"in {stats.pages} pages ({stats.chunks_per_second:.0f} chunks/s)"
+            + (" - complete" if stats.completed else f" - paused at {stats.cursor}")
+        )
+        return stats
+
+    def _copy_missing(self, records: list[dict[str, Any]]) -> int:
+        records = [record for record in records if record.get("embedding")]
+        if not records:
+            return 0
+
+        missing = self.target.missing_chunk_ids(self.tenant_id, [r["id"] for r in records])
+        to_copy = [self._complete(record) for record in records if record["id"] in missing]
+        return self.target.upsert_chunk_records(self.tenant_id, to_copy) if to_copy else 0
+
+    def _complete(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Fill in a source id for chunks whose store did not record one."""
+        if record.get("source_id"):
+            return record
+        return {**record, "source_id": document_source_id(self.tenant_id, record["source"])}
+
+    def _save_checkpoint(self, state: dict[str, Any], stats: ReindexStats) -> None:
+        if not self.checkpoints:
+            return
+        now = datetime.utcnow().isoformat() + "Z"
+        self.checkpoints.save(
+            self.checkpoint_key,
+            {
+                # A completed pass resets the cursor so the next run rescans from the start
+                "cursor": stats.cursor,
+                "scanned": state.get("scanned", 0) + stats.scanned,
+                "copied": state.get("copied", 0) + stats.copied,
+                "updated_at": now,
+                "completed_at": now if stats.completed else state.get("completed_at"),
+            },
+        )
+
+    def _throttle(self, scanned: int, started: float, stop_event: threading.Event | None) -> None:
+        if not self.max_chunks_per_second:
+            return
+        delay = scanned / self.max_chunks_per_second - (time.perf_counter() - started)
+        if delay > 0:
+            if stop_event:
+                stop_event.wait(delay)
+            else:
+                time.sleep(delay)
+
+
+def reconcile_stores(
+    stores: dict[str, IReindexableStore],
+    tenant_id: str,
+    checkpoints: FileCheckpointStore | None = None,
+    page_size: int = 500,
+    max_chunks_per_second: float | None = None,
+    max_pages: int | None = None,
+    stop_event: threading.Event | None = None,
+) -> list[ReindexStats]:
+    """
+    Make every store hold every chunk of a tenant, one ReindexJob per direction.
+
+    Args:
+        stores: Stores by name, e.g. {"neo4j": neo4j_store, "weaviate": weaviate_store}
+        tenant_id: Tenant identifier
+        checkpoints: Where to keep resumable cursors (None always starts from scratch)
+        page_size: Chunks read per page
+        max_chunks_per_second: Scan rate limit per direction (None is unbounded)
+        max_pages: Page budget per direction for this call
+        stop_event: Set from another thread to stop after the current page
+
+    Returns:
+        Stats for each direction
+    """
+    results = []
+    for source_name, source in stores.items():
+        for target_name, target in stores.items():
+            if source is target:
+                continue
+            job = ReindexJob(
+                source,
+                target,
+                tenant_id,
+                checkpoints,
+                name=f"{source_name}->{target_name}",
+                page_size=page_size,
+                max_chunks_per_second=max_chunks_per_second,
+            )
+            results.append(job.run(max_pages, stop_event))
+    return results
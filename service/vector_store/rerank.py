@@ -0,0 +1,66 @@
+"""Exact cosine rerank of approximate (ANN) search candidates."""
+
+import heapq
+import math
+from typing import Any
+
+from .quantization import truncate_embedding
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None
+
+
+def _cosine_scores(query_vector: list[float], embeddings: list[list[float]]) -> list[float]:
+    """Cosine similarity of the query against each embedding (query truncated to match)."""
+    dimensions = {len(embedding) for embedding in embeddings}
+    if NUMPY_AVAILABLE and len(dimensions) == 1:
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        query = np.asarray(truncate_embedding(query_vector, matrix.shape[1]), dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        norms[norms == 0] = 1.0
+        return (matrix @ query / norms).tolist()
+
+    scores = []
+    for embedding in embeddings:
+        query = truncate_embedding(query_vector, len(embedding))
+        dot = sum(q * e for q, e in zip(query, embedding, strict=False))
+        norm = math.sqrt(sum(q * q for q in query)) * math.sqrt(sum(e * e for e in embedding))
+        scores.append(dot / norm if norm else 0.0)
+    return scores
+
+
+def exact_rerank(
+    query_vector: list[float],
+    candidates: list[dict[str, Any]],
+    embeddings: dict[str, list[float]],
+    k: int,
+) -> list[dict[str, Any]]:
+    """
+    Re-score ANN candidates by exact cosine similarity and keep the top ``k``.
+
+    ``score`` becomes the exact cosine similarity and the store's own score is
+    kept as ``ann_score``. Candidates without a stored embedding keep their
+    order and follow the reranked ones.
+
+    Args:
+        query_vector: Full-precision query vector
+        candidates: Oversampled candidates from the ANN stage (need an ``id``)
+        embeddings: Stored embedding by chunk id (see IEmbeddingStore.get_embeddings)
+        k: Number of results to return
+    """
+    scored = [candidate for candidate in candidates if candidate.get("id") in embeddings]
+    unscored = [candidate for candidate in candidates if candidate.get("id") not in embeddings]
+
+    if scored:
+        exact = _cosine_scores(query_vector, [embeddings[c["id"]] for c in scored])
+        for candidate, score in zip(scored, exact, strict=True):
+            candidate["ann_score"] = candidate.get("score")
+            candidate["score"] = score
+
+    top = heapq.nlargest(k, scored, key=lambda candidate: candidate["score"])
+    return top + unscored[: k - len(top)]
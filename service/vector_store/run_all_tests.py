@@ -212,6 +212,7 @@ async def main():
         ("test_weaviate_isolated.py", "Weaviate Service Test"),
         ("test_neo4j_isolated.py", "Neo4j Service Test"),
         ("test_compound_isolated.py", "Compound Service Test"),
+        ("test_numpy_isolated.py", "NumPy Store Test"),
     ]
 
     for script, description in tests:
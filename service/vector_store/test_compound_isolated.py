@@ -215,6 +215,11 @@ async def test_compound_service():
                         score_display += f" (Fusion: {fusion_score:.4f})"
 
                     print(f"        {i + 1}. [{origin.upper()}] {source} - {score_display}")
+                    # Graph strategies return Neo4j hits with their context attached
+                    if "organizations" in result:
+                        org_names = [org["name"] for org in result["organizations"]]
+                        neighbours = len(result["neighbours"])
+                        print(f"           {neighbours} neighbours, orgs {org_names}")
 
         print("\n📊 Strategy Performance Comparison...")
 
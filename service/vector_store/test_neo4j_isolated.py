@@ -214,6 +214,20 @@ async def test_neo4j_service():
                 related_labels = rel.get("related_labels", [])
                 print(f"      🔗 {rel_type} -> {related_title} ({', '.join(related_labels)})")
 
+        print("\n🧩 Testing graph-expanded search (neighbours + organizations)...")
+
+        context_results = store.search_with_context(
+            tenant_id=tenant_id, query_vector=mock_embedding(test_queries[0]), k=3, window=1
+        )
+        print(f"  📊 Found {len(context_results)} results with graph context")
+        for result in context_results:
+            neighbour_indexes = [nb["chunk_index"] for nb in result["neighbours"]]
+            org_names = [org["name"] for org in result["organizations"]]
+            print(
+                f"    📄 [{result['source']}] chunk {result['chunk_index']} "
+                f"neighbours {neighbour_indexes} orgs {org_names}"
+            )
+
         print("\n📋 Testing recent sources retrieval...")
 
         # Test getting recent sources
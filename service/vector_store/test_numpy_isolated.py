@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Isolated test for the in-process NumPy vector store.
+
+Needs no running services, so it doubles as a network-free stand-in for the
+Neo4j/Weaviate isolated tests. Run this to test the NumPy store and the
+compound store on top of it:
+    python test_numpy_isolated.py
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+
+# Mock embeddings for testing (replace with real embeddings in production)
+def mock_embedding(text: str, dimensions: int = 1536) -> list[float]:
+    """Generate a mock embedding vector for testing."""
+    # Create a pseudo-random but consistent embedding based on text
+    random.seed(hash(text) % (2**32))
+    return [random.uniform(-1, 1) for _ in range(dimensions)]
+
+
+def mock_embeddings(texts: list[str], dimensions: int = 1536) -> list[list[float]]:
+    """Generate mock embeddings for a list of texts."""
+    return [mock_embedding(text, dimensions) for text in texts]
+
+
+# Test data
+SAMPLE_DOCUMENTS = {
+    "Strategic Plan 2024": [
+        "Our strategic vision for 2024 focuses on digital transformation and market expansion.",
+        "Key initiatives include cloud migration, AI integration, and customer experience.",
+        "We aim to increase market share by 25% through innovative product development.",
+    ],
+    "Q3 Financial Report": [
+        "Revenue for Q3 2024 exceeded expectations with 15% growth over the previous quarter.",
+        "Operating expenses decreased by 8% due to efficiency improvements.",
+        "Cash flow remains strong with improved working capital management.",
+    ],
+    "Team Restructuring Memo": [
+        "We are implementing a new organizational structure effective immediately.",
+        "Three new cross-functional teams will be established to improve collaboration.",
+        "Marketing and Sales teams will be consolidated under Revenue Operations.",
+    ],
+}
+
+
+async def test_numpy_service():
+    """Test the NumPy store directly and as a stand-in behind the compound store."""
+
+    print("🧪 NUMPY VECTOR STORE ISOLATED TEST")
+    print("=" * 50)
+
+    try:
+        from service.vector_store.compound_service import CompoundVectorStore, SearchStrategy
+        from service.vector_store.numpy_service import NumpyConfig, NumpyStore
+
+        print("✅ Successfully imported NumPy store")
+    except ImportError as e:
+        print(f"❌ Failed to import NumPy store: {e}")
+        print("💡 Make sure to install: pip install numpy")
+        return False
+
+    persist_dir = tempfile.mkdtemp(prefix="numpy_store_")
+    tenant_id = "test_org_numpy_001"
+
+    try:
+        store = NumpyStore(NumpyConfig(persist_dir=persist_dir))
+
+        print(f"\n📝 Inserting documents for tenant: {tenant_id}")
+        for title, chunks in SAMPLE_DOCUMENTS.items():
+            start_time = time.time()
+            source_id = store.upsert_chunks(tenant_id, title, chunks, mock_embeddings(chunks))
+            insert_time = time.time() - start_time
+            if not source_id:
+                print(f"    ❌ Failed to insert {title}")
+                return False
+            print(f"  📄 {title}: {source_id[:8]}... in {insert_time:.4f}s")
+
+        print("\n🔍 Testing exact vector search...")
+        probe = SAMPLE_DOCUMENTS["Q3 Financial Report"][0]
+        results = store.search(tenant_id, mock_embedding(probe), k=3)
+        if not results or results[0]["text"] != probe:
+            print("    ❌ Exact match was not ranked first")
+            return False
+        print(f"    ✅ Top hit is the probe chunk (score {results[0]['score']:.4f})")
+
+        print("\n🔀 Testing BM25 hybrid search...")
+        hybrid_results = store.hybrid_search(
+            tenant_id, "revenue growth", mock_embedding("unrelated"), k=3, alpha=0.0
+        )
+        if not hybrid_results or "Revenue" not in hybrid_results[0]["text"]:
+            print("    ❌ Keyword-only hybrid search did not favour the revenue chunk")
+            return False
+        print(f"    ✅ Keyword search top hit: {hybrid_results[0]['text'][:60]}...")
+
+        print("\n📋 Testing recent sources...")
+        sources = store.get_recent_sources(tenant_id)
+        if len(sources) != len(SAMPLE_DOCUMENTS):
+            print(f"    ❌ Expected {len(SAMPLE_DOCUMENTS)} sources, got {len(sources)}")
+            return False
+        print(f"    ✅ Found {len(sources)} sources")
+
+        print("\n💾 Testing memory-mapped reload...")
+        reloaded = NumpyStore(NumpyConfig(persist_dir=persist_dir))
+        reloaded_results = reloaded.search(tenant_id, mock_embedding(probe), k=1)
+        if not reloaded_results or reloaded_results[0]["text"] != probe:
+            print("    ❌ Reloaded store did not return the probe chunk")
+            return False
+        print("    ✅ Reloaded tenant answers queries from disk")
+
+        print("\n💽 Testing close and re-upload over a memory-mapped tenant...")
+        # Both write the tenant back while its vectors are still mapped from that file
+        title, chunks = next(iter(SAMPLE_DOCUMENTS.items()))
+        reloaded.upsert_chunks(tenant_id, title, chunks, [None] * len(chunks))
+        reloaded.close()
+        remapped = NumpyStore(NumpyConfig(persist_dir=persist_dir))
+        remapped.search(tenant_id, mock_embedding(probe), k=1)
+        remapped.upsert_chunks(tenant_id, "Mapped Doc", [probe], [mock_embedding(probe)])
+        remapped.close()
+        final = NumpyStore(NumpyConfig(persist_dir=persist_dir)).search(
+            tenant_id, mock_embedding(probe), k=2
+        )
+        if [r["text"] for r in final] != [probe, probe]:
+            print("    ❌ Tenant vectors were lost after closing a memory-mapped store")
+            return False
+        print("    ✅ Memory-mapped tenant survives close and re-upload")
+
+        print("\n🧭 Testing compound strategies with NumPy stand-ins...")
+        compound_store = CompoundVectorStore(
+            neo4j_store=NumpyStore(NumpyConfig()),
+            weaviate_store=NumpyStore(NumpyConfig()),
+        )
+        for title, chunks in SAMPLE_DOCUMENTS.items():
+            compound_store.upsert_chunks(tenant_id, title, chunks, mock_embeddings(chunks))
+
+        for strategy in SearchStrategy:
+            strategy_results = compound_store.search(
+                tenant_id, mock_embedding(probe), k=3, strategy=strategy
+            )
+            if not strategy_results:
+                print(f"    ❌ {strategy.value} returned no results")
+                return False
+            print(f"    ✅ {strategy.value:<16} {len(strategy_results)} results")
+
+        # Batched searches train the adaptive router like single ones
+        before = compound_store.adaptive_stats()["backends"]["weaviate"]["samples"]
+        compound_store.search_many(
+            tenant_id, [mock_embedding(probe)] * 2, k=3, strategy=SearchStrategy.PARALLEL_FUSION
+        )
+        batched_stats = compound_store.adaptive_stats()["backends"]
+        if batched_stats["weaviate"]["samples"] != before + 1:
+            print("    ❌ Batched fusion did not record backend latency")
+            return False
+        print("    ✅ Batched fusion trains the adaptive router")
+        compound_store.close()
+
+        print("\n🕸️ Testing graph context on graph-oriented strategies...")
+
+        class GraphStore(NumpyStore):
+            def search_with_context(self, tenant_id, query_vector, k=5, window=1):
+                return [
+                    {**result, "neighbours": [], "organizations": []}
+                    for result in self.search(tenant_id, query_vector, k)
+                ]
+
+        graph_compound = CompoundVectorStore(
+            neo4j_store=GraphStore(NumpyConfig()), weaviate_store=NumpyStore(NumpyConfig())
+        )
+        for title, chunks in SAMPLE_DOCUMENTS.items():
+            graph_compound.upsert_chunks(tenant_id, title, chunks, mock_embeddings(chunks))
+        for strategy in (SearchStrategy.GRAPH_FIRST, SearchStrategy.NEO4J_ONLY):
+            graph_results = graph_compound.search(
+                tenant_id, mock_embedding(probe), k=3, strategy=strategy
+            )
+            if not graph_results or "organizations" not in graph_results[0]:
+                print(f"    ❌ {strategy.value} did not return graph context")
+                return False
+        print("    ✅ Graph strategies return hits with their graph context")
+        graph_compound.close()
+
+        print("\n🗃️  Testing the query cache over the NumPy store...")
+        from service.vector_store.cache_service import CachedVectorStore
+
+        cached = CachedVectorStore(store)
+        cached.search(tenant_id, mock_embedding(probe), k=1)
+        cached.search(tenant_id, mock_embedding(probe), k=1)
+        # An empty answer may be a swallowed backend error, so it is never cached
+        cached.search("unknown_tenant", mock_embedding(probe), k=1)
+        cached.search("unknown_tenant", mock_embedding(probe), k=1)
+        cache_stats = cached.stats()
+        if cache_stats["hits"] != 1 or cache_stats["entries"] != 1:
+            print(f"    ❌ Unexpected cache behaviour: {cache_stats}")
+            return False
+        print("    ✅ Results were cached, empty results were not")
+
+        print("\n🎯 Testing two-stage retrieval with exact rerank...")
+        two_stage = CompoundVectorStore(
+            neo4j_store=NumpyStore(NumpyConfig()),
+            weaviate_store=NumpyStore(NumpyConfig()),
+            rerank_oversample=3,
+        )
+        for title, chunks in SAMPLE_DOCUMENTS.items():
+            two_stage.upsert_chunks(tenant_id, title, chunks, mock_embeddings(chunks))
+        reranked = two_stage.search(tenant_id, mock_embedding(probe), k=3)
+        batched = two_stage.search_many(tenant_id, [mock_embedding(probe)], k=3)[0]
+        if len(reranked) != 3 or reranked[0]["text"] != probe or "ann_score" not in reranked[0]:
+            print("    ❌ Exact rerank did not put the probe chunk first")
+            return False
+        if [r["id"] for r in batched] != [r["id"] for r in reranked]:
+            print("    ❌ Batched two-stage search disagrees with single search")
+            return False
+        print(f"    ✅ Reranked top hit has exact cosine {reranked[0]['score']:.4f}")
+        two_stage.close()
+
+        print("\n🏠 Testing local tier in front of compound store...")
+        local_compound = CompoundVectorStore(local_store=NumpyStore(NumpyConfig()))
+        local_compound.upsert_chunks(tenant_id, "Local Doc", [probe], [mock_embedding(probe)])
+        local_results = local_compound.search(tenant_id, mock_embedding(probe), k=1)
+        if not local_results or local_results[0]["store_origin"] != "local":
+            print("    ❌ Local tier did not answer the query")
+            return False
+        print("    ✅ Local tier answered without network stores")
+        local_compound.close()
+
+        print("\n🧩 Testing local tier admission over existing network data...")
+        network = NumpyStore(NumpyConfig())
+        old_chunks = SAMPLE_DOCUMENTS["Strategic Plan 2024"]
+        network.upsert_chunks(tenant_id, "Old Doc", old_chunks, mock_embeddings(old_chunks))
+        tiered = CompoundVectorStore(neo4j_store=network, local_store=NumpyStore(NumpyConfig()))
+        tiered.upsert_chunks(tenant_id, "New Doc", [probe], [mock_embedding(probe)])
+        old_hit = tiered.search(tenant_id, mock_embedding(old_chunks[0]), k=1)
+        titles = {source["title"] for source in tiered.get_recent_sources(tenant_id)}
+        if not old_hit or old_hit[0]["source"] != "Old Doc" or titles != {"Old Doc", "New Doc"}:
+            print(f"    ❌ Local tier hid earlier network documents: {old_hit}, {titles}")
+            return False
+        print(f"    ✅ Admitted tenant serves {sorted(titles)} locally")
+        tiered.close()
+
+        small_local = NumpyStore(NumpyConfig(max_chunks_per_tenant=2))
+        evicting = CompoundVectorStore(
+            neo4j_store=NumpyStore(NumpyConfig()), local_store=small_local
+        )
+        evicting.upsert_chunks(tenant_id, "Big Doc", old_chunks, mock_embeddings(old_chunks))
+        evicting.upsert_chunks(tenant_id, "Small Doc", [probe], [mock_embedding(probe)])
+        big_hit = evicting.search(tenant_id, mock_embedding(old_chunks[0]), k=1)
+        if small_local.has_tenant(tenant_id) or not big_hit or big_hit[0]["source"] != "Big Doc":
+            print("    ❌ Evicted tenant was re-admitted to the local tier")
+            return False
+        print("    ✅ Evicted tenant stays on the network stores")
+        evicting.close()
+
+        print("\n🔁 Testing resumable reconciliation between stores...")
+        from service.vector_store.reindex import FileCheckpointStore
+
+        class FailingStore(NumpyStore):
+            def upsert_chunks(self, *args, **kwargs):
+                raise ConnectionError("backend unavailable")
+
+        lagging = FailingStore(NumpyConfig())
+        diverged = CompoundVectorStore(
+            neo4j_store=NumpyStore(NumpyConfig()), weaviate_store=lagging
+        )
+        for title, chunks in SAMPLE_DOCUMENTS.items():
+            diverged.upsert_chunks(tenant_id, title, chunks, mock_embeddings(chunks))
+        if tenant_id not in diverged.pending_reconciliation:
+            print("    ❌ Partial upsert was not flagged for reconciliation")
+            return False
+
+        checkpoints = FileCheckpointStore(Path(persist_dir) / "reindex_checkpoints.json")
+        first_pass = diverged.reconcile_tenant(tenant_id, checkpoints, page_size=2, max_pages=1)
+        resumed = diverged.reconcile_tenant(tenant_id, checkpoints, page_size=2)
+        copied = sum(stats.copied for stats in first_pass + resumed)
+        total_chunks = sum(len(chunks) for chunks in SAMPLE_DOCUMENTS.values())
+        if copied != total_chunks or tenant_id in diverged.pending_reconciliation:
+            print(f"    ❌ Expected {total_chunks} chunks copied, got {copied}")
+            return False
+        lagging_results = lagging.search(tenant_id, mock_embedding(probe), k=1)
+        if not lagging_results or lagging_results[0]["text"] != probe:
+            print("    ❌ Reconciled store did not return the probe chunk")
+            return False
+        if len(lagging.get_recent_sources(tenant_id)) != len(SAMPLE_DOCUMENTS):
+            print("    ❌ Reconciled store is missing sources")
+            return False
+        print(f"    ✅ Copied {copied} chunks across two resumable passes")
+        diverged.close()
+
+        print("\n♻️  Testing incremental re-upload...")
+        from service.vector_store.ingestion import upsert_document
+
+        incremental = CompoundVectorStore(
+            neo4j_store=NumpyStore(NumpyConfig()), weaviate_store=NumpyStore(NumpyConfig())
+        )
+        title = "Q3 Financial Report"
+        chunks = SAMPLE_DOCUMENTS[title]
+        first = upsert_document(incremental, tenant_id, title, chunks, mock_embeddings)
+        again = upsert_document(incremental, tenant_id, title, chunks, mock_embeddings)
+        if again.embedded_count or again.source_id != first.source_id:
+            print("    ❌ Identical re-upload was embedded again or got a new source id")
+            return False
+
+        revised = [chunks[0], "Q3 revenue was restated after the audit.", chunks[2]]
+        edited = upsert_document(incremental, tenant_id, title, revised, mock_embeddings)
+        stored = incremental.neo4j_store.get_recent_sources(tenant_id)
+        texts = {r["text"] for r in incremental.weaviate_store.search(tenant_id, [1.0] * 1536, 10)}
+        if edited.embedded_count != 1 or len(stored) != 1 or texts != set(revised):
+            print(f"    ❌ Edit embedded {edited.embedded_count} chunks, stored {sorted(texts)}")
+            return False
+        print("    ✅ Re-upload embedded nothing; an edit embedded 1 chunk and pruned the old one")
+        incremental.close()
+
+        print("\n✅ All NumPy store tests completed successfully!")
+        return True
+
+    except Exception as e:
+        print(f"❌ NumPy store test failed: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+
+async def main():
+    """Main test runner."""
+    print("🚀 Starting NumPy Vector Store Isolation Test")
+    print("=" * 60)
+
+    success = await test_numpy_service()
+
+    if success:
+        print("\n🎉 All tests passed! NumPy vector store is working correctly.")
+    else:
+        print("\n💥 Some tests failed. Check the output above for details.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Setup logging
+    logging.basicConfig(level=logging.INFO)
+
+    # Run tests
+    asyncio.run(main())
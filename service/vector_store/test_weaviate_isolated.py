@@ -188,6 +188,55 @@ async def test_weaviate_service():
             doc_type = source.get("document_type", "")
             print(f"    📄 {title} - {chunk_count} chunks ({doc_type}) - {created_at}")
 
+        print("\n✂️  Testing re-upload pruning with overlapping titles...")
+        from service.vector_store.identity import chunk_ids
+
+        # "Report" shares a word with "Q3 Financial Report"; pruning must not touch it
+        report_chunks = ["A short standalone report."]
+        store.upsert_chunks(tenant_id, "Report", report_chunks, mock_embeddings(report_chunks))
+        store.upsert_chunks(tenant_id, "Report", ["Revised report."], mock_embeddings(["r"]))
+        q3_title = "Q3 Financial Report"
+        q3_ids = chunk_ids(tenant_id, q3_title, SAMPLE_DOCUMENTS[q3_title])
+        if store.missing_chunk_ids(tenant_id, q3_ids):
+            print("    ❌ Re-uploading 'Report' deleted chunks of 'Q3 Financial Report'")
+            return False
+        if not store.missing_chunk_ids(tenant_id, chunk_ids(tenant_id, "Report", report_chunks)):
+            print("    ❌ Stale chunk of 'Report' was not pruned")
+            return False
+        print("    ✅ Only the re-uploaded document's stale chunk was pruned")
+
+        # A kept chunk that moves gets its new position without being re-embedded
+        revised = ["Preface.", "Revised report."]
+        embeddings = [mock_embedding(revised[0]), None]
+        store.upsert_chunks(tenant_id, "Report", revised, embeddings)
+        moved_id = chunk_ids(tenant_id, "Report", revised)[1]
+        page, _ = store.iter_chunk_page(tenant_id, limit=1000)
+        moved = next(record for record in page if record["id"] == moved_id)
+        if moved["chunk_index"] != 1 or moved["source_chunk_count"] != 2:
+            print(f"    ❌ Moved chunk kept its old position: {moved['chunk_index']}")
+            return False
+        print("    ✅ Moved chunk was updated in place")
+
+        print("\n💤 Testing idle tenant deactivation across processes...")
+
+        # A second store stands in for another worker; it never touched the tenant itself
+        other_worker = WeaviateStore(config)
+        if other_worker.deactivate_idle_tenants(idle_seconds=600):
+            print("    ❌ Another worker deactivated tenants this one just used")
+            return False
+        time.sleep(1)
+        deactivated = other_worker.deactivate_idle_tenants(idle_seconds=0.5)
+        if tenant_id not in deactivated:
+            print("    ❌ Tenant idle on every worker was not deactivated")
+            return False
+        print(f"    📊 Deactivated {len(deactivated)} tenants idle for 0.5s")
+        # This worker still believes the tenant is active; Weaviate reactivates it on access
+        if not store.search(tenant_id=tenant_id, query_vector=mock_embedding("strategy"), k=1):
+            print("    ❌ Deactivated tenant was not reactivated on use")
+            return False
+        other_worker.close()
+        print("    ✅ Idleness is shared between workers and tenants wake up on use")
+
         print("\n🧪 Testing multi-tenant isolation...")
 
         # Test with different tenant
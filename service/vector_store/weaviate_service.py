@@ -1,32 +1,486 @@
 """Weaviate vector store service for semantic search and hybrid retrieval."""
 
-from datetime import datetime
+from datetime import UTC, datetime
+import json
 import logging
+import re
+import threading
+import time
 from typing import Any
 import uuid
 
 try:
     import weaviate
-    from weaviate.classes.config import Configure, DataType, Property, VectorDistances
-    from weaviate.classes.query import Filter, MetadataQuery
+    from weaviate.classes.config import (
+        Configure,
+        DataType,
+        Property,
+        Reconfigure,
+        VectorDistances,
+    )
+    from weaviate.classes.query import Filter, MetadataQuery, Sort
+    from weaviate.classes.tenants import Tenant, TenantActivityStatus
 
     WEAVIATE_AVAILABLE = True
 except ImportError:
     WEAVIATE_AVAILABLE = False
     weaviate = None
 
-from .ports import IHybridVectorStore
+from .identity import chunk_ids, document_source_id
+from .ports import (
+    IAsyncEmbeddingStore,
+    IAsyncHybridVectorStore,
+    IEmbeddingStore,
+    IHybridVectorStore,
+    IReindexableStore,
+)
+from .quantization import truncate_embedding, truncate_embeddings
 
 logger = logging.getLogger(__name__)
 
+# Weaviate's default QUERY_MAXIMUM_RESULTS; stale chunks past it are not pruned on re-upload
+_MAX_DOCUMENT_CHUNKS = 10_000
 
-class WeaviateStore(IHybridVectorStore):
+
+def _parse_local_url(url: str) -> tuple[str, int]:
+    """Extract host and port from a URL like http://localhost:8081 (port defaults to 8080)."""
+    url_match = re.match(r"https?://([^:/]+):?(\d+)?", url)
+    if url_match:
+        host = url_match.group(1)
+        port = int(url_match.group(2)) if url_match.group(2) else 8080
+        return host, port
+
+    # Fallback to simple parsing
+    host = url.replace("http://", "").replace("https://", "").split(":")[0]
+    return host, 8080
+
+
+def connect_client(config):
+    """Open a synchronous Weaviate client for a WeaviateConfig (cloud when it has an api_key)."""
+    api_key = getattr(config, "api_key", None)
+    if api_key:
+        return weaviate.connect_to_wcs(
+            cluster_url=config.url, auth_credentials=weaviate.auth.AuthApiKey(api_key)
+        )
+    host, port = _parse_local_url(config.url)
+    return weaviate.connect_to_local(host=host, port=port)
+
+
+def async_client(config):
+    """Create (without connecting) an async Weaviate client for a WeaviateConfig."""
+    api_key = getattr(config, "api_key", None)
+    if api_key:
+        return weaviate.use_async_with_weaviate_cloud(
+            cluster_url=config.url, auth_credentials=weaviate.auth.AuthApiKey(api_key)
+        )
+    host, port = _parse_local_url(config.url)
+    return weaviate.use_async_with_local(host=host, port=port)
+
+
+def _tenant_name(tenant_id: str) -> str:
+    """Map a tenant id onto a valid Weaviate tenant name ([A-Za-z0-9_-], at most 64 chars)."""
+    name = re.sub(r"[^A-Za-z0-9_-]", "_", tenant_id)
+    if len(name) > 64 or name != tenant_id:
+        # Keep names unique when sanitizing or truncating
+        digest = uuid.uuid5(uuid.NAMESPACE_URL, tenant_id).hex[:12]
+        name = f"{name[:51]}-{digest}"
+    return name
+
+
+def _idle_tenants(
+    active: list[str], last_used: dict[str, datetime], idle_seconds: float, now: datetime
+) -> list[str]:
+    """Active tenant names whose shared last use is at least idle_seconds old."""
+    return [
+        name
+        for name in active
+        if name in last_used and (now - last_used[name]).total_seconds() >= idle_seconds
+    ]
+
+
+def _usage_collection_schema(collection_name: str) -> dict[str, Any]:
+    """Keyword arguments for the vectorless collection holding each tenant's last use."""
+    return {
+        "name": collection_name,
+        "properties": [
+            Property(name="tenant", data_type=DataType.TEXT),
+            Property(name="lastUsed", data_type=DataType.DATE),
+        ],
+        "vectorizer_config": Configure.Vectorizer.none(),
+        "vector_index_config": Configure.VectorIndex.hnsw(skip=True),
+    }
+
+
+def _usage_object(name: str, used_at: datetime) -> Any:
+    """Usage DataObject for a tenant; the fixed id makes each write replace the last one."""
+    from weaviate.classes.data import DataObject
+
+    return DataObject(
+        uuid=uuid.uuid5(uuid.NAMESPACE_URL, f"tenant-usage:{name}"),
+        properties={"tenant": name, "lastUsed": used_at},
+    )
+
+
+def _quantizer(quantization: str | None, pq_segments: int | None = None, reconfigure=False):
+    """
+    HNSW quantizer config for "pq", "bq" or "sq" (None keeps full-precision vectors).
+
+    With ``reconfigure`` the equivalent Reconfigure object is returned, for
+    enabling compression on an existing collection.
+    """
+    if not quantization:
+        return None
+
+    quantizers = (Reconfigure if reconfigure else Configure).VectorIndex.Quantizer
+    if quantization == "pq":
+        return quantizers.pq(segments=pq_segments)
+    if quantization == "bq":
+        return quantizers.bq()
+    if quantization == "sq":
+        return quantizers.sq()
+    raise ValueError(f"Unknown quantization {quantization!r}, expected 'pq', 'bq' or 'sq'")
+
+
+def _collection_schema(
+    collection_name: str,
+    multi_tenancy: bool = True,
+    quantization: str | None = None,
+    pq_segments: int | None = None,
+    ef: int = 64,
+) -> dict[str, Any]:
+    """Keyword arguments for creating the chunk collection with custom embeddings and HNSW."""
+    return {
+        "name": collection_name,
+        # One shard per tenant; tenants are created on first write and woken up on access
+        "multi_tenancy_config": Configure.multi_tenancy(
+            enabled=multi_tenancy, auto_tenant_creation=True, auto_tenant_activation=True
+        ),
+        "properties": [
+            Property(name="text", data_type=DataType.TEXT),
+            Property(name="source", data_type=DataType.TEXT),
+            Property(name="tenantId", data_type=DataType.TEXT),
+            Property(name="createdAt", data_type=DataType.TEXT),
+            Property(name="chunkIndex", data_type=DataType.INT, skip_vectorization=True),
+            Property(name="documentType", data_type=DataType.TEXT),
+            Property(name="metadata", data_type=DataType.TEXT),
+        ],
+        "vectorizer_config": Configure.Vectorizer.none(),  # Use custom embeddings
+        "vector_index_config": Configure.VectorIndex.hnsw(
+            distance_metric=VectorDistances.COSINE,
+            ef_construction=128,
+            ef=ef,
+            max_connections=16,
+            dynamic_ef_min=100,
+            dynamic_ef_max=500,
+            dynamic_ef_factor=4,
+            quantizer=_quantizer(quantization, pq_segments),
+        ),
+    }
+
+
+def _index_updates(
+    index_config, quantization: str | None, pq_segments: int | None, ef: int
+) -> dict[str, Any]:
+    """Reconfigure.VectorIndex.hnsw arguments that bring an existing collection up to config."""
+    updates: dict[str, Any] = {}
+    if quantization and index_config.quantizer is None:
+        # PQ/SQ train on the vectors already stored; the index compresses in place
+        updates["quantizer"] = _quantizer(quantization, pq_segments, True)
+    if index_config.ef != ef:
+        updates["ef"] = ef
+    return updates
+
+
+def _source_collection_schema(collection_name: str, multi_tenancy: bool = True) -> dict[str, Any]:
+    """Keyword arguments for the vectorless per-upload Source collection."""
+    return {
+        "name": collection_name,
+        "multi_tenancy_config": Configure.multi_tenancy(
+            enabled=multi_tenancy, auto_tenant_creation=True, auto_tenant_activation=True
+        ),
+        "properties": [
+            Property(name="title", data_type=DataType.TEXT),
+            Property(name="tenantId", data_type=DataType.TEXT),
+            Property(name="createdAt", data_type=DataType.TEXT),
+            Property(name="chunkCount", data_type=DataType.INT),
+            Property(name="documentType", data_type=DataType.TEXT),
+        ],
+        "vectorizer_config": Configure.Vectorizer.none(),
+        # Sources are only listed, never searched by vector
+        "vector_index_config": Configure.VectorIndex.hnsw(skip=True),
+    }
+
+
+def _build_source_object(
+    tenant_id: str, title: str, chunk_count: int, source_id: str, created_at: str | None = None
+) -> Any:
+    """Build the Source DataObject recorded for one upload."""
+    from weaviate.classes.data import DataObject
+
+    return DataObject(
+        uuid=source_id,
+        properties={
+            "title": title,
+            "tenantId": tenant_id,
+            "createdAt": created_at or datetime.utcnow().isoformat() + "Z",
+            "chunkCount": chunk_count,
+            "documentType": "organizational_document",
+        },
+    )
+
+
+def _source_object_to_source(obj) -> dict[str, Any]:
+    """Convert a Source object into the common source shape."""
+    return {
+        "id": str(obj.uuid),
+        "title": obj.properties.get("title", ""),
+        "created_at": obj.properties.get("createdAt", ""),
+        "chunk_count": obj.properties.get("chunkCount", 0),
+        "type": "document",
+        "document_type": obj.properties.get("documentType", ""),
+    }
+
+
+def _chunk_metadata(source_id: str, total_chunks: int) -> str:
+    return f'{{"source_id": "{source_id}", "total_chunks": {total_chunks}}}'
+
+
+def _build_data_objects(
+    tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]], source_id: str
+) -> list[Any]:
+    """Build DataObjects for a batch insert of a document's new chunks (embedding not None)."""
+    from weaviate.classes.data import DataObject
+
+    now = datetime.utcnow().isoformat() + "Z"
+    ids = chunk_ids(tenant_id, title, chunks)
+    objects = []
+    for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False)):
+        if embedding is None:
+            # Already stored; re-inserting would only churn the HNSW graph
+            continue
+        obj = DataObject(
+            uuid=ids[i],
+            properties={
+                "text": chunk,
+                "source": title,
+                "tenantId": tenant_id,
+                "createdAt": now,
+                "chunkIndex": i,
+                "documentType": "organizational_document",
+                "metadata": _chunk_metadata(source_id, len(chunks)),
+            },
+            vector=embedding,
+        )
+        objects.append(obj)
+    return objects
+
+
+def _object_to_record(obj, tenant_id: str) -> dict[str, Any]:
+    """Convert a chunk object fetched with its vector into an exported chunk record."""
+    try:
+        metadata = json.loads(obj.properties.get("metadata") or "{}")
+    except ValueError:
+        metadata = {}
+    return {
+        "id": str(obj.uuid),
+        "text": obj.properties.get("text", ""),
+        "source": obj.properties.get("source", ""),
+        "source_id": metadata.get("source_id"),
+        "source_chunk_count": metadata.get("total_chunks"),
+        "created_at": obj.properties.get("createdAt", ""),
+        "chunk_index": obj.properties.get("chunkIndex", 0),
+        "tenant_id": tenant_id,
+        "embedding": _object_vector(obj),
+    }
+
+
+def _object_vector(obj) -> list[float]:
+    vector = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+    return list(vector or [])
+
+
+def _embedding_lookup_query(ids: list[str], filters) -> dict[str, Any]:
+    """fetch_objects arguments returning only the stored vectors of the given ids."""
+    id_filter = Filter.by_id().contains_any(ids)
+    return {
+        "filters": id_filter if filters is None else id_filter & filters,
+        "limit": len(ids),
+        "include_vector": True,
+        "return_properties": [],
+    }
+
+
+def _document_chunks_query(title: str, filters) -> dict[str, Any]:
+    """fetch_objects arguments listing candidate chunks of a document (see _stale_chunk_ids)."""
+    source_filter = Filter.by_property("source").equal(title)
+    return {
+        "filters": source_filter if filters is None else source_filter & filters,
+        "limit": _MAX_DOCUMENT_CHUNKS,
+        "return_properties": ["source", "chunkIndex", "metadata"],
+    }
+
+
+def _stale_chunk_ids(objects, title: str, keep: set[str]) -> list[str]:
+    """
+    Ids of a document's stored chunks that its new version no longer has.
+
+    ``source`` is a word-tokenized TEXT property, so the equal filter also matches
+    titles sharing its words ("Report" matches "Q3 Financial Report"); only
+    objects whose title is exactly ``title`` are pruned.
+    """
+    return [
+        str(obj.uuid)
+        for obj in objects
+        if obj.properties.get("source") == title and str(obj.uuid) not in keep
+    ]
+
+
+def _moved_chunk_updates(
+    objects, title: str, ids: list[str], source_id: str
+) -> dict[str, dict[str, Any]]:
+    """
+    Property updates for kept chunks of a document whose position or chunk count changed.
+
+    Chunks already stored are not re-inserted, so their vectors stay untouched and
+    only ``chunkIndex`` and ``total_chunks`` are patched, as the Neo4j upsert does.
+    """
+    positions = {chunk_id: i for i, chunk_id in enumerate(ids)}
+    updates = {}
+    for obj in objects:
+        chunk_id = str(obj.uuid)
+        if obj.properties.get("source") != title or chunk_id not in positions:
+            continue
+        metadata = _chunk_metadata(source_id, len(ids))
+        if (
+            obj.properties.get("chunkIndex") != positions[chunk_id]
+            or obj.properties.get("metadata") != metadata
+        ):
+            updates[chunk_id] = {"chunkIndex": positions[chunk_id], "metadata": metadata}
+    return updates
+
+
+def _raise_on_insert_errors(result, what: str) -> None:
+    """Fail an upsert whose batch insert was partly rejected, before anything is pruned."""
+    if getattr(result, "has_errors", False):
+        raise RuntimeError(f"Weaviate rejected {len(result.errors)} {what}")
+
+
+def _record_to_data_object(record: dict[str, Any], tenant_id: str, dimensions: int | None) -> Any:
+    """Build the chunk DataObject for an exported chunk record, keeping its id."""
+    from weaviate.classes.data import DataObject
+
+    metadata = {"source_id": record["source_id"], "total_chunks": record.get("source_chunk_count")}
+    return DataObject(
+        uuid=record["id"],
+        properties={
+            "text": record["text"],
+            "source": record["source"],
+            "tenantId": tenant_id,
+            "createdAt": record["created_at"],
+            "chunkIndex": record["chunk_index"],
+            "documentType": "organizational_document",
+            "metadata": json.dumps(metadata),
+        },
+        vector=truncate_embedding(record["embedding"], dimensions),
+    )
+
+
+def _object_to_result(obj, score_field: str) -> dict[str, Any]:
+    """Convert a Weaviate object into the common search result shape."""
+    return {
+        "id": str(obj.uuid),
+        "text": obj.properties.get("text", ""),
+        "source": obj.properties.get("source", ""),
+        "score": getattr(obj.metadata, score_field, 0.0) if obj.metadata else 0.0,
+        "created_at": obj.properties.get("createdAt", ""),
+        "document_type": obj.properties.get("documentType", ""),
+        "chunk_index": obj.properties.get("chunkIndex", 0),
+    }
+
+
+def _near_vector_batch_query(
+    collection_name: str,
+    query_vectors: list[list[float]],
+    k: int,
+    tenant_id: str,
+    multi_tenancy: bool = True,
+) -> str:
+    """Build one GraphQL Get with an aliased nearVector block per query vector."""
+    fields = "text source createdAt documentType chunkIndex _additional { id distance }"
+    if multi_tenancy:
+        scope = f"tenant: {json.dumps(_tenant_name(tenant_id))}, "
+    else:
+        scope = (
+            f'where: {{path: ["tenantId"], operator: Equal, valueText: {json.dumps(tenant_id)}}}, '
+        )
+    blocks = [
+        f"q{i}: {collection_name}({scope}nearVector: {{vector: {json.dumps(vector)}}}, "
+        f"limit: {k}) {{ {fields} }}"
+        for i, vector in enumerate(query_vectors)
+    ]
+    return "{ Get { " + " ".join(blocks) + " } }"
+
+
+def _graphql_item_to_result(item: dict[str, Any]) -> dict[str, Any]:
+    """Convert a raw GraphQL Get item into the common search result shape."""
+    additional = item.get("_additional") or {}
+    return {
+        "id": additional.get("id", ""),
+        "text": item.get("text", ""),
+        "source": item.get("source", ""),
+        "score": additional.get("distance", 0.0),
+        "created_at": item.get("createdAt", ""),
+        "document_type": item.get("documentType", ""),
+        "chunk_index": item.get("chunkIndex", 0),
+    }
+
+
+def _group_sources(objects, limit: int) -> list[dict[str, Any]]:
+    """Group chunk objects by source title and return the most recent sources."""
+    sources_map = {}
+    for obj in objects:
+        source = obj.properties.get("source", "Unknown")
+        created_at = obj.properties.get("createdAt", "")
+
+        if source not in sources_map:
+            sources_map[source] = {
+                "title": source,
+                "created_at": created_at,
+                "chunk_count": 1,
+                "type": "document",
+                "document_type": obj.properties.get("documentType", ""),
+            }
+        else:
+            sources_map[source]["chunk_count"] += 1
+
+    # Convert to list and sort by creation time
+    sources = list(sources_map.values())
+    sources.sort(key=lambda x: x["created_at"], reverse=True)
+
+    return sources[:limit]
+
+
+class WeaviateStore(IHybridVectorStore, IReindexableStore, IEmbeddingStore):
     """
     Weaviate implementation of vector store.
     Provides fast semantic search with HNSW indexing and hybrid search capabilities.
+
+    The collection uses Weaviate native multi-tenancy: each tenant gets its own
+    shard, created on first upsert, so queries only touch that tenant's index.
+    Call ``deactivate_idle_tenants`` periodically to unload idle tenants from
+    memory. Idleness is judged from a shared usage collection that every process
+    writes a tenant's last use to (at most every ``tenant_idle_seconds / 10``), so
+    a tenant busy in one worker is not unloaded by another. Collections created
+    before multi-tenancy fall back to filtering on the ``tenantId`` property.
+
+    Every upload also writes one small object to a vectorless Source collection,
+    so listing recent sources does not read chunk objects.
+
+    Pass a shared ``client`` (see VectorStoreRegistry) to reuse one connection
+    across stores; a shared client is left open by ``close``.
     """
 
-    def __init__(self, config):
+    def __init__(self, config, client=None):
         if not WEAVIATE_AVAILABLE:
             raise ImportError(
                 "Weaviate is not installed. Install with: pip install weaviate-client"
@@ -36,126 +490,317 @@ class WeaviateStore(IHybridVectorStore):
         self.api_key = getattr(config, "api_key", None)
         self.collection_name = getattr(config, "collection_name", "AntifragileDoc")
         self.embedding_dimensions = config.embedding_dimensions
+        self.source_collection_name = getattr(
+            config, "source_collection_name", f"{self.collection_name}Source"
+        )
+        self.usage_collection_name = getattr(
+            config, "usage_collection_name", f"{self.collection_name}TenantUsage"
+        )
+        self.multi_tenancy = getattr(config, "multi_tenancy", True)
+        self.tenant_idle_seconds = getattr(config, "tenant_idle_seconds", 3600.0)
+        self.offload_idle_tenants = getattr(config, "offload_idle_tenants", False)
+        self.quantization = getattr(config, "quantization", None)
+        self.pq_segments = getattr(config, "pq_segments", None)
+        self.truncate_dimensions = getattr(config, "truncate_dimensions", None)
+        self.hnsw_ef = getattr(config, "hnsw_ef", 64)
 
-        # Connect to Weaviate
-        if self.api_key:
-            self.client = weaviate.connect_to_wcs(
-                cluster_url=self.url, auth_credentials=weaviate.auth.AuthApiKey(self.api_key)
-            )
-        else:
-            # Local connection - extract host and port properly
-            import re
-
-            # Extract host and port from URL like http://localhost:8081
-            url_match = re.match(r"https?://([^:]+):?(\d+)?", self.url)
-            if url_match:
-                host = url_match.group(1)
-                port = int(url_match.group(2)) if url_match.group(2) else 8080
-                self.client = weaviate.connect_to_local(host=host, port=port)
-            else:
-                # Fallback to simple parsing
-                host = self.url.replace("http://", "").replace("https://", "").split(":")[0]
-                self.client = weaviate.connect_to_local(host=host)
+        # Active tenants known to this process -> last use (monotonic), and deactivated ones
+        self._tenant_last_used: dict[str, float] = {}
+        self._inactive_tenants: set[str] = set()
+        # Tenant -> when this process last wrote its use to the usage collection (monotonic)
+        self._usage_published: dict[str, float] = {}
+        self._tenant_lock = threading.Lock()
+
+        # Connect to Weaviate unless a shared client was handed in
+        self._owns_client = client is None
+        self.client = client or connect_client(config)
 
         logger.info(f"Connected to Weaviate at {self.url}")
         self._ensure_schema()
 
     def _ensure_schema(self):
-        """Ensure the collection schema exists."""
+        """Ensure the chunk and source collections exist and load their tenants."""
         try:
             # Check if collection exists
             if not self.client.collections.exists(self.collection_name):
                 logger.info(f"Creating Weaviate collection: {self.collection_name}")
 
                 # Create collection with vector configuration
-                collection = self.client.collections.create(
-                    name=self.collection_name,
-                    properties=[
-                        Property(name="text", data_type=DataType.TEXT),
-                        Property(name="source", data_type=DataType.TEXT),
-                        Property(name="tenantId", data_type=DataType.TEXT),
-                        Property(name="createdAt", data_type=DataType.TEXT),
-                        Property(
-                            name="chunkIndex", data_type=DataType.INT, skip_vectorization=True
-                        ),
-                        Property(name="documentType", data_type=DataType.TEXT),
-                        Property(name="metadata", data_type=DataType.TEXT),
-                    ],
-                    vectorizer_config=Configure.Vectorizer.none(),  # Use custom embeddings
-                    vector_index_config=Configure.VectorIndex.hnsw(
-                        distance_metric=VectorDistances.COSINE,
-                        ef_construction=128,
-                        ef=64,
-                        max_connections=16,
-                        dynamic_ef_min=100,
-                        dynamic_ef_max=500,
-                        dynamic_ef_factor=4,
-                    ),
+                self.client.collections.create(
+                    **_collection_schema(
+                        self.collection_name,
+                        self.multi_tenancy,
+                        self.quantization,
+                        self.pq_segments,
+                        self.hnsw_ef,
+                    )
                 )
                 logger.info(f"Created collection {self.collection_name}")
+            else:
+                collection = self.client.collections.get(self.collection_name)
+                config = collection.config.get()
+                if self.multi_tenancy and not config.multi_tenancy_config.enabled:
+                    logger.warning(
+                        f"Collection {self.collection_name} predates multi-tenancy, "
+                        "falling back to tenantId filtering"
+                    )
+                    self.multi_tenancy = False
+
+                updates = _index_updates(
+                    config.vector_index_config, self.quantization, self.pq_segments, self.hnsw_ef
+                )
+                if updates:
+                    collection.config.update(
+                        vector_index_config=Reconfigure.VectorIndex.hnsw(**updates)
+                    )
+                    logger.info(f"Updated HNSW {sorted(updates)} on {self.collection_name}")
+
+            if not self.client.collections.exists(self.source_collection_name):
+                self.client.collections.create(
+                    **_source_collection_schema(self.source_collection_name, self.multi_tenancy)
+                )
+                logger.info(f"Created collection {self.source_collection_name}")
+
+            if self.multi_tenancy:
+                if not self.client.collections.exists(self.usage_collection_name):
+                    self.client.collections.create(
+                        **_usage_collection_schema(self.usage_collection_name)
+                    )
+                    logger.info(f"Created collection {self.usage_collection_name}")
+                self._load_tenants()
         except Exception as e:
             logger.warning(f"Error ensuring schema: {e}")
 
+    def _load_tenants(self):
+        collection = self.client.collections.get(self.collection_name)
+        now = time.monotonic()
+        with self._tenant_lock:
+            for name, tenant in collection.tenants.get().items():
+                if tenant.activity_status == TenantActivityStatus.ACTIVE:
+                    self._tenant_last_used[name] = now
+                else:
+                    self._inactive_tenants.add(name)
+
+    def _update_tenants(self, tenants: list[Any]) -> None:
+        """Apply tenant status changes to the chunk collection and then the source collection."""
+        self.client.collections.get(self.collection_name).tenants.update(tenants)
+        try:
+            self.client.collections.get(self.source_collection_name).tenants.update(tenants)
+        except Exception as e:
+            # Tenants created before the source collection existed have no source shard
+            logger.debug(f"Source tenant update skipped: {e}")
+
+    def _create_tenant(self, name: str) -> None:
+        for collection_name in (self.collection_name, self.source_collection_name):
+            try:
+                self.client.collections.get(collection_name).tenants.create([Tenant(name=name)])
+            except Exception as e:
+                # Another process may have created it first
+                logger.debug(f"Tenant {name} not created in {collection_name}: {e}")
+        logger.info(f"Created Weaviate tenant {name}")
+
+    def _scoped(self, tenant_id: str, create: bool = False, collection_name: str | None = None):
+        """
+        Collection handle scoped to a tenant, plus the filter needed without multi-tenancy.
+
+        With ``create`` the tenant is created if this process has not seen it yet;
+        tenants deactivated by ``deactivate_idle_tenants`` are reactivated first.
+        Returns the chunk collection unless ``collection_name`` is given.
+        """
+        collection = self.client.collections.get(collection_name or self.collection_name)
+        if not self.multi_tenancy:
+            return collection, Filter.by_property("tenantId").equal(tenant_id)
+
+        name = _tenant_name(tenant_id)
+        with self._tenant_lock:
+            known = name in self._tenant_last_used
+            inactive = name in self._inactive_tenants
+
+        if inactive:
+            self._update_tenants([Tenant(name=name, activity_status=TenantActivityStatus.ACTIVE)])
+            logger.info(f"Reactivated Weaviate tenant {name}")
+        elif create and not known:
+            self._create_tenant(name)
+
+        with self._tenant_lock:
+            self._inactive_tenants.discard(name)
+            if create or known or inactive:
+                self._tenant_last_used[name] = time.monotonic()
+
+        self._publish_use(name)
+        return collection.with_tenant(name), None
+
+    def _publish_use(self, name: str, force: bool = False) -> None:
+        """Write a tenant's last use to the shared usage collection, throttled per tenant."""
+        now = time.monotonic()
+        with self._tenant_lock:
+            published = self._usage_published.get(name)
+            if not force and published is not None:
+                if now - published < self.tenant_idle_seconds / 10:
+                    return
+            self._usage_published[name] = now
+
+        try:
+            result = self.client.collections.get(self.usage_collection_name).data.insert_many(
+                [_usage_object(name, datetime.now(UTC))]
+            )
+            if result.has_errors:
+                raise RuntimeError(next(iter(result.errors.values())).message)
+        except Exception as e:
+            # Idleness then relies on the other processes' writes; retried on a later use
+            with self._tenant_lock:
+                self._usage_published.pop(name, None)
+            logger.debug(f"Tenant usage not recorded for {name}: {e}")
+
+    def _shared_last_used(self) -> dict[str, datetime]:
+        """Last use of every tenant recorded in the usage collection, by any process."""
+        usage = self.client.collections.get(self.usage_collection_name)
+        return {
+            obj.properties["tenant"]: obj.properties["lastUsed"]
+            for obj in usage.iterator(return_properties=["tenant", "lastUsed"])
+        }
+
+    def deactivate_idle_tenants(self, idle_seconds: float | None = None) -> list[str]:
+        """
+        Unload tenants that have not been used for a while to reduce memory.
+
+        Tenants become INACTIVE (or OFFLOADED to cold storage when
+        ``offload_idle_tenants`` is set) and are reactivated on their next use.
+        A tenant is idle when no process has used it for ``idle_seconds``
+        according to the shared usage collection; active tenants without a
+        recorded use get one now, starting their idle clock.
+
+        Args:
+            idle_seconds: Idle time before deactivation (defaults to the configured value)
+
+        Returns:
+            Names of the tenants that were deactivated
+        """
+        if not self.multi_tenancy:
+            return []
+
+        idle_seconds = self.tenant_idle_seconds if idle_seconds is None else idle_seconds
+        try:
+            tenants = self.client.collections.get(self.collection_name).tenants.get()
+            last_used = self._shared_last_used()
+        except Exception as e:
+            logger.error(f"Weaviate tenant usage lookup error: {e}")
+            return []
+
+        active = [
+            name
+            for name, tenant in tenants.items()
+            if tenant.activity_status == TenantActivityStatus.ACTIVE
+        ]
+        for name in active:
+            if name not in last_used:
+                self._publish_use(name, force=True)
+        idle = _idle_tenants(active, last_used, idle_seconds, datetime.now(UTC))
+        if not idle:
+            return []
+
+        status = (
+            TenantActivityStatus.OFFLOADED
+            if self.offload_idle_tenants
+            else TenantActivityStatus.INACTIVE
+        )
+        try:
+            self._update_tenants([Tenant(name=name, activity_status=status) for name in idle])
+        except Exception as e:
+            logger.error(f"Weaviate tenant deactivation error: {e}")
+            return []
+
+        with self._tenant_lock:
+            for name in idle:
+                self._tenant_last_used.pop(name, None)
+                self._usage_published.pop(name, None)
+                self._inactive_tenants.add(name)
+        logger.info(f"Deactivated {len(idle)} idle Weaviate tenants ({status.value})")
+        return idle
+
     def search(self, tenant_id: str, query_vector: list[float], k: int = 5) -> list[dict[str, Any]]:
-        """Search for similar vectors in Weaviate."""
+        """Search for similar vectors within the tenant's shard."""
         try:
-            collection = self.client.collections.get(self.collection_name)
-
-            # Perform vector search (tenant filtering disabled for demo)
-            # TODO: Re-enable tenant filtering for multi-tenant production
-            response = collection.query.near_vector(near_vector=query_vector, limit=k)
-
-            results = []
-            for obj in response.objects:
-                results.append(
-                    {
-                        "id": str(obj.uuid),
-                        "text": obj.properties.get("text", ""),
-                        "source": obj.properties.get("source", ""),
-                        "score": getattr(obj.metadata, "distance", 0.0) if obj.metadata else 0.0,
-                        "created_at": obj.properties.get("createdAt", ""),
-                        "document_type": obj.properties.get("documentType", ""),
-                        "chunk_index": obj.properties.get("chunkIndex", 0),
-                    }
-                )
+            collection, filters = self._scoped(tenant_id)
+            response = collection.query.near_vector(
+                near_vector=truncate_embedding(query_vector, self.truncate_dimensions),
+                limit=k,
+                filters=filters,
+            )
 
-            return results
+            return [_object_to_result(obj, "distance") for obj in response.objects]
 
         except Exception as e:
             logger.error(f"Weaviate search error: {e}")
             return []
 
+    def search_many(
+        self, tenant_id: str, query_vectors: list[list[float]], k: int = 5
+    ) -> list[list[dict[str, Any]]]:
+        """Search several query vectors with a single batched GraphQL nearVector request."""
+        if not query_vectors:
+            return []
+
+        try:
+            # Reactivates the tenant if needed; the raw query scopes itself
+            self._scoped(tenant_id)
+            response = self.client.graphql_raw_query(
+                _near_vector_batch_query(
+                    self.collection_name,
+                    truncate_embeddings(query_vectors, self.truncate_dimensions),
+                    k,
+                    tenant_id,
+                    self.multi_tenancy,
+                )
+            )
+            if response.errors:
+                raise RuntimeError(response.errors)
+
+            batch = response.get or {}
+            return [
+                [_graphql_item_to_result(item) for item in batch.get(f"q{i}") or []]
+                for i in range(len(query_vectors))
+            ]
+
+        except Exception as e:
+            logger.warning(f"Weaviate batched search failed, querying one by one: {e}")
+            return [self.search(tenant_id, query_vector, k) for query_vector in query_vectors]
+
     def upsert_chunks(
         self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
     ) -> str:
-        """Insert document chunks with embeddings into Weaviate."""
+        """Insert document chunks with embeddings into the tenant's shard."""
         try:
-            collection = self.client.collections.get(self.collection_name)
-            source_id = str(uuid.uuid4())
-            now = datetime.utcnow().isoformat() + "Z"
-
-            # Batch insert chunks using proper DataObject format
-            from weaviate.classes.data import DataObject
-
-            objects = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings, strict=False)):
-                obj = DataObject(
-                    properties={
-                        "text": chunk,
-                        "source": title,
-                        "tenantId": tenant_id,
-                        "createdAt": now,
-                        "chunkIndex": i,
-                        "documentType": "organizational_document",
-                        "metadata": f'{{"source_id": "{source_id}", "total_chunks": {len(chunks)}}}',
-                    },
-                    vector=embedding,
-                )
-                objects.append(obj)
+            collection, filters = self._scoped(tenant_id, create=True)
+            source_id = document_source_id(tenant_id, title)
+
+            # Batch insert the new chunks using proper DataObject format
+            embeddings = truncate_embeddings(embeddings, self.truncate_dimensions)
+            objects = _build_data_objects(tenant_id, title, chunks, embeddings, source_id)
+            if objects:
+                _raise_on_insert_errors(collection.data.insert_many(objects), "chunks")
 
-            # Insert batch
-            collection.data.insert_many(objects)
-            logger.info(f"Inserted {len(chunks)} chunks for source {title}")
+            # Drop chunks that the previous version of this document had (only reached
+            # once every new chunk is stored, so a failed insert keeps the old copy)
+            ids = chunk_ids(tenant_id, title, chunks)
+            keep = set(ids)
+            response = collection.query.fetch_objects(**_document_chunks_query(title, filters))
+            stale = _stale_chunk_ids(response.objects, title, keep)
+            if stale:
+                collection.data.delete_many(where=Filter.by_id().contains_any(stale))
+
+            # Kept chunks may have moved within the document
+            moved = _moved_chunk_updates(response.objects, title, ids, source_id)
+            for chunk_id, properties in moved.items():
+                collection.data.update(uuid=chunk_id, properties=properties)
+            logger.info(
+                f"Inserted {len(objects)} new chunks for source {title}, "
+                f"removed {len(stale)} stale chunks, updated {len(moved)} moved chunks"
+            )
+
+            # Record the upload for get_recent_sources (batch inserts overwrite by uuid)
+            sources, _ = self._scoped(tenant_id, collection_name=self.source_collection_name)
+            sources.data.insert_many([_build_source_object(tenant_id, title, len(keep), source_id)])
 
             return source_id
 
@@ -163,39 +808,108 @@ class WeaviateStore(IHybridVectorStore):
             logger.error(f"Weaviate upsert error: {e}")
             return ""
 
-    def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
-        """Get recently ingested sources for a tenant."""
-        try:
-            collection = self.client.collections.get(self.collection_name)
+    def iter_chunk_page(
+        self, tenant_id: str, after: str | None = None, limit: int = 500
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """Read one page of the tenant's chunks in uuid order, with vectors."""
+        collection, filters = self._scoped(tenant_id)
+
+        # The cursor API cannot be combined with filters, so legacy single-tenant
+        # collections are paged in full and filtered here
+        response = collection.query.fetch_objects(limit=limit, after=after, include_vector=True)
+        objects = response.objects
+
+        records = [
+            _object_to_record(obj, tenant_id)
+            for obj in objects
+            if filters is None or obj.properties.get("tenantId") == tenant_id
+        ]
+        cursor = str(objects[-1].uuid) if len(objects) == limit else None
+        return records, cursor
+
+    def missing_chunk_ids(self, tenant_id: str, chunk_ids: list[str]) -> set[str]:
+        """Return the chunk ids with no stored object."""
+        if not chunk_ids:
+            return set()
+
+        return set(chunk_ids) - self._existing_ids(tenant_id, chunk_ids)
+
+    def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored (uncompressed) vectors of the given chunks, in one lookup by id."""
+        if not chunk_ids:
+            return {}
+
+        collection, filters = self._scoped(tenant_id)
+        response = collection.query.fetch_objects(**_embedding_lookup_query(chunk_ids, filters))
+        return {str(obj.uuid): _object_vector(obj) for obj in response.objects}
+
+    def _existing_ids(
+        self, tenant_id: str, ids: list[str], collection_name: str | None = None
+    ) -> set[str]:
+        collection, filters = self._scoped(tenant_id, collection_name=collection_name)
+        id_filter = Filter.by_id().contains_any(ids)
+        response = collection.query.fetch_objects(
+            filters=id_filter if filters is None else id_filter & filters,
+            limit=len(ids),
+            return_properties=[],
+        )
+        return {str(obj.uuid) for obj in response.objects}
+
+    def upsert_chunk_records(self, tenant_id: str, records: list[dict[str, Any]]) -> int:
+        """Batch-load exported chunk records and any Source objects they need."""
+        if not records:
+            return 0
+
+        collection, _ = self._scoped(tenant_id, create=True)
+        result = collection.data.insert_many(
+            [_record_to_data_object(r, tenant_id, self.truncate_dimensions) for r in records]
+        )
+        _raise_on_insert_errors(result, "chunk records")
 
-            # Query for recent sources
-            response = collection.query.fetch_objects(
-                where=Filter.by_property("tenantId").equal(tenant_id),
-                limit=limit * 10,  # Get more to group by source
+        sources: dict[str, dict[str, Any]] = {}
+        for record in records:
+            sources.setdefault(record["source_id"], record)
+        missing = set(sources) - self._existing_ids(
+            tenant_id, list(sources), self.source_collection_name
+        )
+        if missing:
+            source_collection, _ = self._scoped(
+                tenant_id, collection_name=self.source_collection_name
+            )
+            source_collection.data.insert_many(
+                [
+                    _build_source_object(
+                        tenant_id,
+                        sources[source_id]["source"],
+                        sources[source_id].get("source_chunk_count") or 0,
+                        source_id,
+                        sources[source_id]["created_at"],
+                    )
+                    for source_id in missing
+                ]
             )
 
-            # Group by source and get recent ones
-            sources_map = {}
-            for obj in response.objects:
-                source = obj.properties.get("source", "Unknown")
-                created_at = obj.properties.get("createdAt", "")
-
-                if source not in sources_map:
-                    sources_map[source] = {
-                        "title": source,
-                        "created_at": created_at,
-                        "chunk_count": 1,
-                        "type": "document",
-                        "document_type": obj.properties.get("documentType", ""),
-                    }
-                else:
-                    sources_map[source]["chunk_count"] += 1
+        return len(records)
 
-            # Convert to list and sort by creation time
-            sources = list(sources_map.values())
-            sources.sort(key=lambda x: x["created_at"], reverse=True)
+    def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Get recently ingested sources for a tenant from the Source collection."""
+        try:
+            sources, filters = self._scoped(tenant_id, collection_name=self.source_collection_name)
+            response = sources.query.fetch_objects(
+                filters=filters,
+                limit=limit,
+                sort=Sort.by_property("createdAt", ascending=False),
+            )
+            if response.objects:
+                return [_source_object_to_source(obj) for obj in response.objects]
+        except Exception as e:
+            logger.warning(f"Weaviate source listing failed, grouping chunks instead: {e}")
 
-            return sources[:limit]
+        # Data ingested before the Source collection existed only has chunk objects
+        try:
+            collection, filters = self._scoped(tenant_id)
+            response = collection.query.fetch_objects(filters=filters, limit=limit * 10)
+            return _group_sources(response.objects, limit)
 
         except Exception as e:
             logger.error(f"Weaviate get_recent_sources error: {e}")
@@ -215,29 +929,16 @@ class WeaviateStore(IHybridVectorStore):
             alpha: Weight for vector vs keyword search (0.0 = keyword only, 1.0 = vector only)
         """
         try:
-            collection = self.client.collections.get(self.collection_name)
-
-            # Perform hybrid search (tenant filtering disabled for demo)
-            # TODO: Re-enable tenant filtering for multi-tenant production
+            collection, filters = self._scoped(tenant_id)
             response = collection.query.hybrid(
-                query=query, vector=query_vector, alpha=alpha, limit=k
+                query=query,
+                vector=truncate_embedding(query_vector, self.truncate_dimensions),
+                alpha=alpha,
+                limit=k,
+                filters=filters,
             )
 
-            results = []
-            for obj in response.objects:
-                results.append(
-                    {
-                        "id": str(obj.uuid),
-                        "text": obj.properties.get("text", ""),
-                        "source": obj.properties.get("source", ""),
-                        "score": getattr(obj.metadata, "score", 0.0) if obj.metadata else 0.0,
-                        "created_at": obj.properties.get("createdAt", ""),
-                        "document_type": obj.properties.get("documentType", ""),
-                        "chunk_index": obj.properties.get("chunkIndex", 0),
-                    }
-                )
-
-            return results
+            return [_object_to_result(obj, "score") for obj in response.objects]
 
         except Exception as e:
             logger.error(f"Weaviate hybrid search error: {e}")
@@ -245,11 +946,353 @@ class WeaviateStore(IHybridVectorStore):
             return self.search(tenant_id, query_vector, k)
 
     def close(self):
-        """Close the Weaviate connection."""
-        if hasattr(self, "client"):
+        """Close the Weaviate connection unless it is shared."""
+        if hasattr(self, "client") and self._owns_client:
             self.client.close()
 
 
+class AsyncWeaviateStore(IAsyncHybridVectorStore, IAsyncEmbeddingStore):
+    """
+    Async Weaviate vector store built on the v4 async client.
+
+    Mirrors WeaviateStore (per-tenant shards, Source collection) without blocking the
+    event loop. Call ``connect()`` once before use to open the client and ensure
+    the collection schema.
+    """
+
+    def __init__(self, config, client=None):
+        if not WEAVIATE_AVAILABLE:
+            raise ImportError(
+                "Weaviate is not installed. Install with: pip install weaviate-client"
+            )
+
+        self.url = config.url
+        self.api_key = getattr(config, "api_key", None)
+        self.collection_name = getattr(config, "collection_name", "AntifragileDoc")
+        self.embedding_dimensions = config.embedding_dimensions
+        self.source_collection_name = getattr(
+            config, "source_collection_name", f"{self.collection_name}Source"
+        )
+        self.usage_collection_name = getattr(
+            config, "usage_collection_name", f"{self.collection_name}TenantUsage"
+        )
+        self.multi_tenancy = getattr(config, "multi_tenancy", True)
+        self.tenant_idle_seconds = getattr(config, "tenant_idle_seconds", 3600.0)
+        self.offload_idle_tenants = getattr(config, "offload_idle_tenants", False)
+        self.quantization = getattr(config, "quantization", None)
+        self.pq_segments = getattr(config, "pq_segments", None)
+        self.truncate_dimensions = getattr(config, "truncate_dimensions", None)
+        self.hnsw_ef = getattr(config, "hnsw_ef", 64)
+
+        # Only touched from the event loop, so no lock is needed
+        self._tenant_last_used: dict[str, float] = {}
+        self._inactive_tenants: set[str] = set()
+        self._usage_published: dict[str, float] = {}
+
+        self._owns_client = client is None
+        self.client = client or async_client(config)
+
+    async def connect(self) -> None:
+        """Open the client connection, ensure both collections and load their tenants."""
+        if not self.client.is_connected():
+            await self.client.connect()
+        logger.info(f"Connected to Weaviate (async) at {self.url}")
+
+        try:
+            if not await self.client.collections.exists(self.collection_name):
+                logger.info(f"Creating Weaviate collection: {self.collection_name}")
+                await self.client.collections.create(
+                    **_collection_schema(
+                        self.collection_name,
+                        self.multi_tenancy,
+                        self.quantization,
+                        self.pq_segments,
+                        self.hnsw_ef,
+                    )
+                )
+                logger.info(f"Created collection {self.collection_name}")
+            else:
+                collection = self.client.collections.get(self.collection_name)
+                config = await collection.config.get()
+                if self.multi_tenancy and not config.multi_tenancy_config.enabled:
+                    logger.warning(
+                        f"Collection {self.collection_name} predates multi-tenancy, "
+                        "falling back to tenantId filtering"
+                    )
+                    self.multi_tenancy = False
+
+                updates = _index_updates(
+                    config.vector_index_config, self.quantization, self.pq_segments, self.hnsw_ef
+                )
+                if updates:
+                    await collection.config.update(
+                        vector_index_config=Reconfigure.VectorIndex.hnsw(**updates)
+                    )
+                    logger.info(f"Updated HNSW {sorted(updates)} on {self.collection_name}")
+
+            if not await self.client.collections.exists(self.source_collection_name):
+                await self.client.collections.create(
+                    **_source_collection_schema(self.source_collection_name, self.multi_tenancy)
+                )
+                logger.info(f"Created collection {self.source_collection_name}")
+
+            if self.multi_tenancy:
+                if not await self.client.collections.exists(self.usage_collection_name):
+                    await self.client.collections.create(
+                        **_usage_collection_schema(self.usage_collection_name)
+                    )
+                    logger.info(f"Created collection {self.usage_collection_name}")
+                collection = self.client.collections.get(self.collection_name)
+                now = time.monotonic()
+                for name, tenant in (await collection.tenants.get()).items():
+                    if tenant.activity_status == TenantActivityStatus.ACTIVE:
+                        self._tenant_last_used[name] = now
+                    else:
+                        self._inactive_tenants.add(name)
+        except Exception as e:
+            logger.warning(f"Error ensuring schema: {e}")
+
+    async def _update_tenants(self, tenants: list[Any]) -> None:
+        """Apply tenant status changes to the chunk collection and then the source collection."""
+        await self.client.collections.get(self.collection_name).tenants.update(tenants)
+        try:
+            await self.client.collections.get(self.source_collection_name).tenants.update(tenants)
+        except Exception as e:
+            # Tenants created before the source collection existed have no source shard
+            logger.debug(f"Source tenant update skipped: {e}")
+
+    async def _create_tenant(self, name: str) -> None:
+        for collection_name in (self.collection_name, self.source_collection_name):
+            try:
+                collection = self.client.collections.get(collection_name)
+                await collection.tenants.create([Tenant(name=name)])
+            except Exception as e:
+                # Another process may have created it first
+                logger.debug(f"Tenant {name} not created in {collection_name}: {e}")
+        logger.info(f"Created Weaviate tenant {name}")
+
+    async def _scoped(
+        self, tenant_id: str, create: bool = False, collection_name: str | None = None
+    ):
+        """Collection handle scoped to a tenant, plus the filter needed without multi-tenancy."""
+        collection = self.client.collections.get(collection_name or self.collection_name)
+        if not self.multi_tenancy:
+            return collection, Filter.by_property("tenantId").equal(tenant_id)
+
+        name = _tenant_name(tenant_id)
+        known = name in self._tenant_last_used
+        inactive = name in self._inactive_tenants
+
+        if inactive:
+            await self._update_tenants(
+                [Tenant(name=name, activity_status=TenantActivityStatus.ACTIVE)]
+            )
+            logger.info(f"Reactivated Weaviate tenant {name}")
+        elif create and not known:
+            await self._create_tenant(name)
+
+        self._inactive_tenants.discard(name)
+        if create or known or inactive:
+            self._tenant_last_used[name] = time.monotonic()
+
+        await self._publish_use(name)
+        return collection.with_tenant(name), None
+
+    async def _publish_use(self, name: str, force: bool = False) -> None:
+        """Write a tenant's last use to the shared usage collection, throttled per tenant."""
+        now = time.monotonic()
+        published = self._usage_published.get(name)
+        if not force and published is not None:
+            if now - published < self.tenant_idle_seconds / 10:
+                return
+        self._usage_published[name] = now
+
+        try:
+            usage = self.client.collections.get(self.usage_collection_name)
+            result = await usage.data.insert_many([_usage_object(name, datetime.now(UTC))])
+            if result.has_errors:
+                raise RuntimeError(next(iter(result.errors.values())).message)
+        except Exception as e:
+            self._usage_published.pop(name, None)
+            logger.debug(f"Tenant usage not recorded for {name}: {e}")
+
+    async def _shared_last_used(self) -> dict[str, datetime]:
+        """Last use of every tenant recorded in the usage collection, by any process."""
+        usage = self.client.collections.get(self.usage_collection_name)
+        return {
+            obj.properties["tenant"]: obj.properties["lastUsed"]
+            async for obj in usage.iterator(return_properties=["tenant", "lastUsed"])
+        }
+
+    async def deactivate_idle_tenants(self, idle_seconds: float | None = None) -> list[str]:
+        """
+        Unload tenants no process has used for ``idle_seconds`` (INACTIVE, or
+        OFFLOADED if configured), judged from the shared usage collection.
+        """
+        if not self.multi_tenancy:
+            return []
+
+        idle_seconds = self.tenant_idle_seconds if idle_seconds is None else idle_seconds
+        try:
+            tenants = await self.client.collections.get(self.collection_name).tenants.get()
+            last_used = await self._shared_last_used()
+        except Exception as e:
+            logger.error(f"Weaviate async tenant usage lookup error: {e}")
+            return []
+
+        active = [
+            name
+            for name, tenant in tenants.items()
+            if tenant.activity_status == TenantActivityStatus.ACTIVE
+        ]
+        for name in active:
+            if name not in last_used:
+                await self._publish_use(name, force=True)
+        idle = _idle_tenants(active, last_used, idle_seconds, datetime.now(UTC))
+        if not idle:
+            return []
+
+        status = (
+            TenantActivityStatus.OFFLOADED
+            if self.offload_idle_tenants
+            else TenantActivityStatus.INACTIVE
+        )
+        try:
+            await self._update_tenants([Tenant(name=name, activity_status=status) for name in idle])
+        except Exception as e:
+            logger.error(f"Weaviate async tenant deactivation error: {e}")
+            return []
+
+        for name in idle:
+            self._tenant_last_used.pop(name, None)
+            self._usage_published.pop(name, None)
+            self._inactive_tenants.add(name)
+        logger.info(f"Deactivated {len(idle)} idle Weaviate tenants ({status.value})")
+        return idle
+
+    async def search(
+        self, tenant_id: str, query_vector: list[float], k: int = 5
+    ) -> list[dict[str, Any]]:
+        """Search for similar vectors within the tenant's shard."""
+        try:
+            collection, filters = await self._scoped(tenant_id)
+            response = await collection.query.near_vector(
+                near_vector=truncate_embedding(query_vector, self.truncate_dimensions),
+                limit=k,
+                filters=filters,
+            )
+
+            return [_object_to_result(obj, "distance") for obj in response.objects]
+
+        except Exception as e:
+            logger.error(f"Weaviate async search error: {e}")
+            return []
+
+    async def get_embeddings(self, tenant_id: str, chunk_ids: list[str]) -> dict[str, list[float]]:
+        """Stored (uncompressed) vectors of the given chunks, in one lookup by id."""
+        if not chunk_ids:
+            return {}
+
+        collection, filters = await self._scoped(tenant_id)
+        response = await collection.query.fetch_objects(
+            **_embedding_lookup_query(chunk_ids, filters)
+        )
+        return {str(obj.uuid): _object_vector(obj) for obj in response.objects}
+
+    async def upsert_chunks(
+        self, tenant_id: str, title: str, chunks: list[str], embeddings: list[list[float]]
+    ) -> str:
+        """Insert document chunks with embeddings into the tenant's shard."""
+        try:
+            collection, filters = await self._scoped(tenant_id, create=True)
+            source_id = document_source_id(tenant_id, title)
+
+            embeddings = truncate_embeddings(embeddings, self.truncate_dimensions)
+            objects = _build_data_objects(tenant_id, title, chunks, embeddings, source_id)
+            if objects:
+                _raise_on_insert_errors(await collection.data.insert_many(objects), "chunks")
+
+            ids = chunk_ids(tenant_id, title, chunks)
+            keep = set(ids)
+            response = await collection.query.fetch_objects(
+                **_document_chunks_query(title, filters)
+            )
+            stale = _stale_chunk_ids(response.objects, title, keep)
+            if stale:
+                await collection.data.delete_many(where=Filter.by_id().contains_any(stale))
+
+            moved = _moved_chunk_updates(response.objects, title, ids, source_id)
+            for chunk_id, properties in moved.items():
+                await collection.data.update(uuid=chunk_id, properties=properties)
+            logger.info(
+                f"Inserted {len(objects)} new chunks for source {title}, "
+                f"removed {len(stale)} stale chunks, updated {len(moved)} moved chunks"
+            )
+
+            sources, _ = await self._scoped(tenant_id, collection_name=self.source_collection_name)
+            await sources.data.insert_many(
+                [_build_source_object(tenant_id, title, len(keep), source_id)]
+            )
+
+            return source_id
+
+        except Exception as e:
+            logger.error(f"Weaviate async upsert error: {e}")
+            return ""
+
+    async def get_recent_sources(self, tenant_id: str, limit: int = 20) -> list[dict[str, Any]]:
+        """Get recently ingested sources for a tenant from the Source collection."""
+        try:
+            sources, filters = await self._scoped(
+                tenant_id, collection_name=self.source_collection_name
+            )
+            response = await sources.query.fetch_objects(
+                filters=filters,
+                limit=limit,
+                sort=Sort.by_property("createdAt", ascending=False),
+            )
+            if response.objects:
+                return [_source_object_to_source(obj) for obj in response.objects]
+        except Exception as e:
+            logger.warning(f"Weaviate source listing failed, grouping chunks instead: {e}")
+
+        # Data ingested before the Source collection existed only has chunk objects
+        try:
+            collection, filters = await self._scoped(tenant_id)
+            response = await collection.query.fetch_objects(filters=filters, limit=limit * 10)
+            return _group_sources(response.objects, limit)
+
+        except Exception as e:
+            logger.error(f"Weaviate async get_recent_sources error: {e}")
+            return []
+
+    async def hybrid_search(
+        self, tenant_id: str, query: str, query_vector: list[float], k: int = 5, alpha: float = 0.7
+    ) -> list[dict[str, Any]]:
+        """Perform hybrid search combining vector similarity and keyword matching."""
+        try:
+            collection, filters = await self._scoped(tenant_id)
+            response = await collection.query.hybrid(
+                query=query,
+                vector=truncate_embedding(query_vector, self.truncate_dimensions),
+                alpha=alpha,
+                limit=k,
+                filters=filters,
+            )
+
+            return [_object_to_result(obj, "score") for obj in response.objects]
+
+        except Exception as e:
+            logger.error(f"Weaviate async hybrid search error: {e}")
+            # Fallback to vector search
+            return await self.search(tenant_id, query_vector, k)
+
+    async def close(self):
+        """Close the Weaviate connection unless it is shared."""
+        if self._owns_client:
+            await self.client.close()
+
+
 class WeaviateConfig:
     """Configuration for Weaviate store."""
 
@@ -259,8 +1302,36 @@ class WeaviateConfig:
         api_key: str | None = None,
         collection_name: str = "AntifragileDoc",
         embedding_dimensions: int = 1536,
+        multi_tenancy: bool = True,
+        tenant_idle_seconds: float = 3600.0,
+        offload_idle_tenants: bool = False,
+        source_collection_name: str | None = None,
+        usage_collection_name: str | None = None,
+        quantization: str | None = None,
+        pq_segments: int | None = None,
+        truncate_dimensions: int | None = None,
+        hnsw_ef: int = 64,
     ):
         self.url = url
         self.api_key = api_key
         self.collection_name = collection_name
+        # Vectorless per-upload collection backing get_recent_sources
+        self.source_collection_name = source_collection_name or f"{collection_name}Source"
+        # Vectorless collection of each tenant's last use, shared by every process
+        self.usage_collection_name = usage_collection_name or f"{collection_name}TenantUsage"
         self.embedding_dimensions = embedding_dimensions
+        # One Weaviate shard per tenant (only applies when the collection is created)
+        self.multi_tenancy = multi_tenancy
+        # deactivate_idle_tenants() unloads tenants unused for this long; offloading
+        # moves them to cold storage and needs an offload module on the server
+        self.tenant_idle_seconds = tenant_idle_seconds
+        self.offload_idle_tenants = offload_idle_tenants
+        # HNSW vector compression: "pq" (product), "bq" (binary), "sq" (scalar) or None.
+        # Applied at creation, or enabled on an existing uncompressed collection
+        self.quantization = quantization
+        # PQ segment count (None lets Weaviate pick); must divide the vector dimensions
+        self.pq_segments = pq_segments
+        # Matryoshka-style truncation applied to stored and query embeddings (None keeps all)
+        self.truncate_dimensions = truncate_dimensions
+        # HNSW search list size; can be lowered when CompoundVectorStore reranks exactly
+        self.hnsw_ef = hnsw_ef
@@ -61,6 +61,14 @@ class Settings:
     # File storage settings
     upload_directory: str = "./uploads"
     max_file_size_mb: int = 100
+    max_extracted_chars: int = 20_000_000  # Text kept per document; extraction stops here
+    extraction_workers: int = 2  # Parallel PDF/Word/Excel parsing processes per worker
+    extraction_timeout_seconds: int = 120  # Parsing processes are killed after this
+    extraction_memory_limit_mb: int = 1024  # Address-space cap per parsing process
+    claim_check_threshold_chars: int = 256 * 1024  # Longer text goes to MinIO (0 = inline)
+    extraction_cache: str = "local"  # Extracted-text cache: "local", "minio" or "off"
+    extraction_cache_dir: str = "./.cache/extraction"  # Directory for the "local" cache
+    extraction_cache_max_mb: int = 2048  # Oldest "local" entries are pruned beyond this
     allowed_file_types: list[str] = field(
         default_factory=lambda: [".pdf", ".docx", ".txt", ".md", ".csv", ".json"]
     )
@@ -215,6 +223,30 @@ class Settings:
         if max_file_size := os.getenv("MAX_FILE_SIZE_MB"):
             settings.max_file_size_mb = int(max_file_size)
 
+        if max_extracted_chars := os.getenv("MAX_EXTRACTED_CHARS"):
+            settings.max_extracted_chars = int(max_extracted_chars)
+
+        if extraction_workers := os.getenv("EXTRACTION_WORKERS"):
+            settings.extraction_workers = int(extraction_workers)
+
+        if extraction_timeout := os.getenv("EXTRACTION_TIMEOUT_SECONDS"):
+            settings.extraction_timeout_seconds = int(extraction_timeout)
+
+        if extraction_memory := os.getenv("EXTRACTION_MEMORY_LIMIT_MB"):
+            settings.extraction_memory_limit_mb = int(extraction_memory)
+
+        if claim_check_threshold := os.getenv("CLAIM_CHECK_THRESHOLD_CHARS"):
+            settings.claim_check_threshold_chars = int(claim_check_threshold)
+
+        if extraction_cache := os.getenv("EXTRACTION_CACHE"):
+            settings.extraction_cache = extraction_cache.lower()
+
+        if extraction_cache_dir := os.getenv("EXTRACTION_CACHE_DIR"):
+            settings.extraction_cache_dir = extraction_cache_dir
+
+        if extraction_cache_max := os.getenv("EXTRACTION_CACHE_MAX_MB"):
+            settings.extraction_cache_max_mb = int(extraction_cache_max)
+
         return settings
 
     def validate(self) -> None:
@@ -244,6 +276,24 @@ class Settings:
         if self.max_file_size_mb <= 0:
             raise ValueError("max_file_size_mb must be positive")
 
+        if self.max_extracted_chars <= 0:
+            raise ValueError("max_extracted_chars must be positive")
+
+        if self.extraction_workers <= 0:
+            raise ValueError("extraction_workers must be positive")
+
+        if self.extraction_timeout_seconds <= 0:
+            raise ValueError("extraction_timeout_seconds must be positive")
+
+        if self.claim_check_threshold_chars < 0:
+            raise ValueError("claim_check_threshold_chars must not be negative")
+
+        if self.extraction_cache not in ["local", "minio", "off"]:
+            raise ValueError(f"Invalid extraction_cache: {self.extraction_cache}")
+
+        if self.extraction_cache_max_mb <= 0:
+            raise ValueError("extraction_cache_max_mb must be positive")
+
         # Validate security settings in production
         if self.environment == "production":
             if self.secret_key == "development-secret-key-change-in-production":
@@ -299,6 +349,7 @@ class Settings:
                 "max_concurrent_workflows": self.max_concurrent_workflows,
                 "max_concurrent_activities": self.max_concurrent_activities,
                 "max_file_size_mb": self.max_file_size_mb,
+                "max_extracted_chars": self.max_extracted_chars,
             },
         }
 
@@ -0,0 +1,127 @@
+"""
+Tests for document text extraction: the streaming size cap, the extraction
+process pool's limits and the content-addressed extraction cache.
+"""
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from activity import extraction_cache
+from activity.document_activities import (
+    _extractor_key,
+    iter_document_text,
+    process_document_upload,
+)
+from activity.extraction_cache import LocalExtractionCache
+from activity.extraction_pool import ExtractionError, ExtractionPool, resource
+
+
+def test_iter_document_text_truncates_at_size_cap(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("abcdefghij" * 10)
+
+    segments = list(iter_document_text(str(path), max_chars=25))
+
+    assert "".join(segment.text for segment in segments) == ("abcdefghij" * 10)[:25]
+    assert segments[-1].truncated
+    assert not any(segment.truncated for segment in segments[:-1])
+
+
+def test_iter_document_text_without_cap_keeps_everything(tmp_path):
+    path = tmp_path / "notes.md"
+    path.write_text("# Title\n\nBody\n")
+
+    segments = list(iter_document_text(str(path)))
+
+    assert "".join(segment.text for segment in segments) == "# Title\n\nBody\n"
+    assert not any(segment.truncated for segment in segments)
+
+
+def test_iter_document_text_raises_on_unreadable_file(tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_bytes(b"a,b\n\xff\xfe\n")
+
+    with pytest.raises(ExtractionError):
+        list(iter_document_text(str(path)))
+
+
+def test_pool_times_out_slow_extraction(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello")
+    # Starting the child alone takes longer than this
+    pool = ExtractionPool(max_workers=1, timeout_seconds=0.001)
+
+    with pytest.raises(ExtractionError, match="timed out"):
+        pool.extract(str(path), max_chars=100)
+
+
+@pytest.mark.skipif(resource is None, reason="memory limits need the resource module")
+def test_pool_fails_extraction_over_memory_limit(tmp_path):
+    path = tmp_path / "huge.txt"
+    # Sparse file: 512 MB of text to hold in memory, almost nothing on disk
+    with path.open("wb") as f:
+        f.truncate(512 * 1024 * 1024)
+    pool = ExtractionPool(max_workers=1, timeout_seconds=60, memory_limit_mb=256)
+
+    with pytest.raises(ExtractionError, match="memory limit"):
+        pool.extract(str(path), max_chars=1024**4)
+
+
+def test_pool_returns_extracted_text(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("hello pool")
+    pool = ExtractionPool(max_workers=1, timeout_seconds=60)
+
+    assert pool.extract(str(path), max_chars=100) == ("hello pool", 0)
+
+
+def test_local_cache_miss_then_hit(tmp_path):
+    cache = LocalExtractionCache(str(tmp_path))
+
+    assert cache.get("abc") is None
+    cache.put("abc", "extracted text", 3)
+    assert cache.get("abc") == ("extracted text", 3)
+
+
+def test_local_cache_prunes_least_recently_used(tmp_path):
+    cache = LocalExtractionCache(str(tmp_path), max_bytes=10**9)
+    for age, key in enumerate(["newest", "middle", "oldest"]):
+        cache.put(key, key * 100, 1)
+        path = cache._path(key)
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime - 100 * (age + 1)))
+
+    # Room for three entries: the oldest is pruned on the next write
+    entry_size = cache._path("newest").stat().st_size
+    cache.max_bytes = 3 * entry_size + entry_size // 2
+    cache.put("latest", "x" * 100, 1)
+
+    assert cache.get("oldest") is None
+    assert cache.get("middle") is not None
+    assert cache.get("latest") is not None
+
+
+def test_extractor_key_depends_on_file_type():
+    assert _extractor_key(".csv", 100) != _extractor_key(".txt", 100)
+    assert _extractor_key(".csv", 100) != _extractor_key(".csv", 200)
+
+
+@pytest.mark.asyncio
+async def test_failed_extraction_is_not_cached(tmp_path, monkeypatch):
+    cache = LocalExtractionCache(str(tmp_path / "cache"))
+    settings = SimpleNamespace(max_extracted_chars=1000, claim_check_threshold_chars=0)
+    monkeypatch.setattr(extraction_cache, "get_extraction_cache", lambda: cache)
+    monkeypatch.setattr("shared.config.get_settings", lambda: settings)
+
+    bad = tmp_path / "table.csv"
+    bad.write_bytes(b"a,b\n\xff\xfe\n")
+    failed = await process_document_upload(str(bad))
+    assert failed.extracted_text.startswith("Text extraction failed")
+    assert not list(Path(cache.directory).glob("*/*.json.gz"))
+
+    good = tmp_path / "table2.csv"
+    good.write_text("a,b\n1,2\n")
+    await process_document_upload(str(good))
+    assert len(list(Path(cache.directory).glob("*/*.json.gz"))) == 1
@@ -0,0 +1,35 @@
+"""
+Replay tests for DocumentProcessingWorkflow.
+
+Histories in test/histories come from earlier versions of the workflow; the
+current code must replay them without non-determinism errors, which is what
+the workflow.patched() markers guarantee for runs still in flight at deploy.
+
+document_processing_pre_patch.json is a two-document run of the workflow
+before the concurrent fan-out and single-analysis changes (summary activity,
+then extraction and analysis, one document at a time). It replays cleanly
+against that version of the workflow.
+"""
+
+from pathlib import Path
+
+import pytest
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer, UnsandboxedWorkflowRunner
+
+from workflow.document_processing_workflow import DocumentProcessingWorkflow
+
+HISTORIES = Path(__file__).parent / "histories"
+
+
+@pytest.mark.asyncio
+async def test_replays_pre_patch_history():
+    history = WorkflowHistory.from_json(
+        "document-processing-pre-patch",
+        (HISTORIES / "document_processing_pre_patch.json").read_text(),
+    )
+    # Replay only compares commands with the history, so the sandbox adds nothing here
+    replayer = Replayer(
+        workflows=[DocumentProcessingWorkflow], workflow_runner=UnsandboxedWorkflowRunner()
+    )
+    await replayer.replay_workflow(history)
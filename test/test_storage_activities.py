@@ -0,0 +1,186 @@
+"""
+Tests for the MinIO storage helpers: claim-check text loading, streamed
+document transfers and the local spill directory used while MinIO is unavailable.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from activity import storage_activities
+from activity.document_activities import DocumentInfo, resolve_extracted_text
+from activity.storage_activities import StorageActivities
+
+
+class FakeObject:
+    def __init__(self, data: bytes):
+        self.data = data
+
+    def read(self) -> bytes:
+        return self.data
+
+    def close(self) -> None:
+        pass
+
+    def release_conn(self) -> None:
+        pass
+
+
+class FakeMinio:
+    """In-memory stand-in for the few MinIO client calls these helpers make"""
+
+    def __init__(self):
+        self.objects: dict[tuple[str, str], bytes] = {}
+        self.part_sizes: list[int] = []
+
+    def bucket_exists(self, _bucket_name: str) -> bool:
+        return True
+
+    def put_object(self, bucket_name, object_name, data, length, **_kwargs):
+        self.objects[(bucket_name, object_name)] = data.read(length)
+
+    def get_object(self, bucket_name: str, object_name: str) -> FakeObject:
+        return FakeObject(self.objects[(bucket_name, object_name)])
+
+    def fput_object(self, bucket_name, object_name, file_path, part_size, **_kwargs):
+        self.part_sizes.append(part_size)
+        self.objects[(bucket_name, object_name)] = Path(file_path).read_bytes()
+        return SimpleNamespace(etag="etag")
+
+    def stat_object(self, bucket_name: str, object_name: str):
+        return SimpleNamespace(size=len(self.objects[(bucket_name, object_name)]))
+
+    def fget_object(self, bucket_name: str, object_name: str, file_path: str) -> None:
+        Path(file_path).write_bytes(self.objects[(bucket_name, object_name)])
+
+
+@pytest.fixture
+def minio(monkeypatch):
+    client = FakeMinio()
+    monkeypatch.setattr(storage_activities, "get_minio_client", lambda *_args: client)
+    return client
+
+
+@pytest.fixture
+def offline_storage(monkeypatch, tmp_path):
+    def unavailable(*_args):
+        raise ConnectionError("MinIO is down")
+
+    monkeypatch.setattr(storage_activities, "get_minio_client", unavailable)
+    monkeypatch.setenv("MINIO_SPILL_DIR", str(tmp_path / "spill"))
+    storage = StorageActivities()
+    assert storage.minio_client is None
+    return storage
+
+
+@pytest.mark.usefixtures("minio")
+def test_load_text_round_trip():
+    storage = StorageActivities()
+
+    stored = storage.store_text("claim-checked text")
+
+    assert stored["sha256"] == hashlib.sha256(b"claim-checked text").hexdigest()
+    assert storage.load_text(stored["ref"], stored["sha256"]) == "claim-checked text"
+
+
+def test_load_text_rejects_hash_mismatch(minio):
+    storage = StorageActivities()
+    stored = storage.store_text("original text")
+    minio.objects[("documents", f"extracted/{stored['sha256']}.txt")] = b"tampered text"
+
+    with pytest.raises(ValueError, match="hash mismatch"):
+        storage.load_text(stored["ref"], stored["sha256"])
+
+
+@pytest.mark.usefixtures("minio")
+def test_load_text_rejects_malformed_reference():
+    with pytest.raises(ValueError, match="Invalid text reference"):
+        StorageActivities().load_text("documents/extracted/abc.txt")
+
+
+@pytest.mark.asyncio
+async def test_resolve_extracted_text_loads_claim_checked_text(minio, monkeypatch):
+    storage = StorageActivities()
+    monkeypatch.setattr(storage_activities, "get_storage_activities", lambda: storage)
+    stored = storage.store_text("full document text")
+    info = DocumentInfo(
+        file_path="report.txt",
+        file_name="report.txt",
+        file_size=18,
+        file_type=".txt",
+        extracted_text="full",
+        text_ref=stored["ref"],
+        text_sha256=stored["sha256"],
+    )
+
+    assert await resolve_extracted_text(info) == "full document text"
+
+    minio.objects[("documents", f"extracted/{stored['sha256']}.txt")] = b"other text"
+    with pytest.raises(ValueError, match="hash mismatch"):
+        await resolve_extracted_text(info)
+
+
+@pytest.mark.asyncio
+async def test_document_file_round_trip_through_spill_dir(minio, monkeypatch, tmp_path):
+    monkeypatch.setenv("MINIO_SPILL_DIR", str(tmp_path / "spill"))
+    storage = StorageActivities()
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF-1.4 report")
+
+    stored = await storage.store_document_file_in_minio(str(source), "reports")
+    local_copy = await storage.retrieve_document_to_file(stored["file_path"])
+
+    assert stored["file_path"].startswith("minio://documents/documents/reports/")
+    assert minio.part_sizes == [storage.part_size]
+    assert Path(local_copy).parent == storage.spill_dir
+    assert Path(local_copy).read_bytes() == b"%PDF-1.4 report"
+
+    destination = tmp_path / "copy.pdf"
+    assert await storage.retrieve_document_to_file(stored["storage_path"], str(destination))
+    assert destination.read_bytes() == b"%PDF-1.4 report"
+
+
+def test_spill_path_removes_only_expired_copies(offline_storage):
+    storage = offline_storage
+    storage.spill_ttl_seconds = 3600
+    storage.spill_dir.mkdir(parents=True)
+    expired = storage.spill_dir / "old_report.pdf"
+    expired.write_bytes(b"x" * 10)
+    old = time.time() - 7200
+    os.utime(expired, (old, old))
+    recent = storage.spill_dir / "new_report.pdf"
+    recent.write_bytes(b"y" * 10)
+
+    path = storage._spill_path("report.pdf", 10)
+
+    assert not expired.exists()
+    assert recent.exists()
+    assert path.parent == storage.spill_dir
+    assert path.name.endswith("_report.pdf")
+
+
+def test_spill_path_raises_when_directory_is_full(offline_storage):
+    storage = offline_storage
+    storage.spill_max_bytes = 15
+    storage.spill_dir.mkdir(parents=True)
+    (storage.spill_dir / "held.pdf").write_bytes(b"z" * 10)
+
+    with pytest.raises(RuntimeError, match="No room"):
+        storage._spill_path("report.pdf", 10)
+
+    assert storage._spill_path("small.txt", 5).parent == storage.spill_dir
+
+
+def test_reconnects_after_failed_setup(offline_storage, monkeypatch):
+    storage = offline_storage
+    client = FakeMinio()
+    monkeypatch.setattr(storage_activities, "get_minio_client", lambda *_args: client)
+
+    assert storage.store_text("text") is None  # Retried only once reconnect_seconds pass
+    storage.reconnect_seconds = 0
+    assert storage.store_text("text") is not None
+    assert storage.minio_client is client
@@ -17,6 +17,7 @@ Worker (default-queue) -> General Activities -> Services
 
 import asyncio
 import logging
+import os
 
 from temporalio.client import Client
 from temporalio.worker import Worker
@@ -24,8 +25,11 @@ from temporalio.worker import Worker
 from activity.activities import (
     # Document processing activities (non-AI)
     process_document_upload,
+    # Storage activities (class-based)
+    StorageActivities,
     # System activities
     cleanup_old_data,
+    deactivate_idle_vector_tenants,
     health_check_external_services,
     schedule_competitor_scan,
     send_scheduled_notification,
@@ -38,15 +42,18 @@ from activity.activities import (
     start_model_improvement,
     validate_training_readiness,
 )
+from service.vector_store import close_vector_store_registry
 
 # Import shared configuration
 from shared.config.defaults import DEFAULT_QUEUE, get_temporal_address
+from workflow.scheduler_workflow import start_idle_tenant_workflow
 
 # Import consolidated modules (proper naming convention)
 from workflow.workflows import (
     CompetitorMonitoringWorkflow,
     DailyInteractionWorkflow,
     DocumentProcessingWorkflow,
+    IdleTenantWorkflow,
     OrganizationOnboardingWorkflow,
 )
 
@@ -69,6 +76,9 @@ async def main():
     client = await Client.connect(temporal_address)
     logger.info(f"Connected to Temporal at {temporal_address}")
 
+    # Class-based activities share one instance (and its MinIO client)
+    storage_activities = StorageActivities()
+
     # Create worker with all workflows and default activities
     worker = Worker(
         client,
@@ -79,12 +89,19 @@ async def main():
             DocumentProcessingWorkflow,
             DailyInteractionWorkflow,
             CompetitorMonitoringWorkflow,
+            IdleTenantWorkflow,
         ],
         activities=[
             # Document processing activities (non-AI)
             process_document_upload,
+            # Document storage activities
+            storage_activities.store_document_in_minio,
+            storage_activities.store_document_file_in_minio,
+            storage_activities.retrieve_document_from_minio,
+            storage_activities.retrieve_document_to_file,
             # System activities
             cleanup_old_data,
+            deactivate_idle_vector_tenants,
             health_check_external_services,
             schedule_competitor_scan,
             send_scheduled_notification,
@@ -105,17 +122,26 @@ async def main():
     logger.info("  - DocumentProcessingWorkflow")
     logger.info("  - DailyInteractionWorkflow")
     logger.info("  - CompetitorMonitoringWorkflow")
+    logger.info("  - IdleTenantWorkflow")
 
     logger.info("Registered activities:")
     logger.info("  - Document processing (1 activity)")
+    logger.info("  - Document storage (4 activities)")
     logger.info("  - Organizational learning (7 activities)")
-    logger.info("  - System activities (4 activities)")
+    logger.info("  - System activities (5 activities)")
 
     logger.info("Architecture: Default Worker <-> General Activities <-> Services")
     logger.info("Note: ML and OpenAI activities handled by specialized workers")
 
-    # Start worker
-    await worker.run()
+    # Unload idle Weaviate tenants hourly (no-op if the cron workflow already runs)
+    if os.getenv("WEAVIATE_URL"):
+        await start_idle_tenant_workflow(client)
+
+    # Start worker; release pooled vector store drivers when it stops
+    try:
+        await worker.run()
+    finally:
+        await close_vector_store_registry()
 
 
 if __name__ == "__main__":
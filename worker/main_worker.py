@@ -17,17 +17,20 @@ Temporal routes activity execution to workers that have registered those activit
 
 import asyncio
 import logging
+import os
 
 from temporalio.client import Client
 from temporalio.worker import Worker
 
 from activity.activities import (
+    StorageActivities,
     analyze_document_content,
     cancel_training_job,
     check_training_job_status,
     # System activities
     cleanup_old_data,
     collect_model_feedback,
+    deactivate_idle_vector_tenants,
     generate_document_summary,
     get_organization_training_history,
     health_check_external_services,
@@ -42,15 +45,18 @@ from activity.activities import (
     synthesize_wisdom,
     validate_training_readiness,
 )
+from service.vector_store import close_vector_store_registry
 
 # Import shared configuration
 from shared.config.defaults import TASK_QUEUE_NAME, get_temporal_address
+from workflow.scheduler_workflow import start_idle_tenant_workflow
 
 # Import consolidated modules (proper naming convention)
 from workflow.workflows import (
     CompetitorMonitoringWorkflow,
     DailyInteractionWorkflow,
     DocumentProcessingWorkflow,
+    IdleTenantWorkflow,
     OrganizationOnboardingWorkflow,
 )
 
@@ -75,6 +81,9 @@ async def main():
     client = await Client.connect(temporal_address)
     logger.info(f"Connected to Temporal at {temporal_address}")
 
+    # Class-based activities share one instance (and its MinIO client)
+    storage_activities = StorageActivities()
+
     # Create worker with all workflows and activities
     worker = Worker(
         client,
@@ -85,14 +94,21 @@ async def main():
             DocumentProcessingWorkflow,
             DailyInteractionWorkflow,
             CompetitorMonitoringWorkflow,
+            IdleTenantWorkflow,
         ],
         activities=[
             # Document processing activities
             process_document_upload,
             analyze_document_content,
             generate_document_summary,
+            # Document storage activities
+            storage_activities.store_document_in_minio,
+            storage_activities.store_document_file_in_minio,
+            storage_activities.retrieve_document_from_minio,
+            storage_activities.retrieve_document_to_file,
             # System activities
             cleanup_old_data,
+            deactivate_idle_vector_tenants,
             health_check_external_services,
             schedule_competitor_scan,
             send_scheduled_notification,
@@ -117,17 +133,26 @@ async def main():
     logger.info("  - DocumentProcessingWorkflow")
     logger.info("  - DailyInteractionWorkflow")
     logger.info("  - CompetitorMonitoringWorkflow")
+    logger.info("  - IdleTenantWorkflow")
 
     logger.info("Registered activities:")
     logger.info("  - Document processing (3 activities)")
+    logger.info("  - Document storage (4 activities)")
     logger.info("  - Organizational learning (7 activities)")
-    logger.info("  - System activities (4 activities)")
+    logger.info("  - System activities (5 activities)")
     logger.info("  - Demo interaction (2 activities)")
 
     logger.info("Architecture: Worker (Temporal) <-> Activities <-> Services (Independent)")
 
-    # Start worker
-    await worker.run()
+    # Unload idle Weaviate tenants hourly (no-op if the cron workflow already runs)
+    if os.getenv("WEAVIATE_URL"):
+        await start_idle_tenant_workflow(client)
+
+    # Start worker; release pooled vector store drivers when it stops
+    try:
+        await worker.run()
+    finally:
+        await close_vector_store_registry()
 
 
 if __name__ == "__main__":
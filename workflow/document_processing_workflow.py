@@ -2,39 +2,52 @@
 Document Processing Workflow - Business process for handling document uploads.
 
 This workflow orchestrates the complete document processing pipeline:
-1. Quick summary generation for immediate admin feedback
-2. Full document analysis for business intelligence
-3. Storage and indexing for future retrieval
+1. Text extraction (once per document)
+2. Document analysis (one LLM call per document)
+3. Quick summary for admin feedback and full analysis for business intelligence,
+   both taken from that single analysis
+4. Storage of the original document in MinIO for future retrieval
 
 This is a proper business workflow that coordinates multiple activities.
 """
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 
 from temporalio import workflow
 from temporalio.common import RetryPolicy
 
-# Mark shared.models as pass-through since it contains Pydantic models
+# Mark shared.models as pass-through since it contains Pydantic models, and the
+# class-based storage activities, of which only the method references are used here
 with workflow.unsafe.imports_passed_through():
+    from activity.storage_activities import StorageActivities
     from shared.models.types import ModelPreference, Priority
 
 from activity.document_activities import (
     DocumentSummaryResult,
     DocumentSummaryWorkflowResult,
+    failed_summary,
     process_document_upload,  # Pure technical activity
+    summary_from_analysis,
 )
 from activity.organizational_learning_activities import (
     TrainingJobSubmission,
     submit_model_training_job,
     validate_training_readiness,
 )
-from agent_activity.ai_activities import (
+from agent_activity.ai_activities import (  # AI-powered activities
     analyze_document_content,
-    generate_document_summary,  # AI-powered activities
+    generate_document_summary,
 )
 from shared.config.defaults import DEFAULT_QUEUE, OPENAI_QUEUE
 
+# Patch markers: workflows started before these changes replay their original
+# command sequence (documents one at a time; summary and analysis extracted separately)
+CONCURRENT_DOCUMENTS_PATCH = "document-processing-concurrent-documents"
+SINGLE_ANALYSIS_PATCH = "document-processing-single-analysis"
+STORE_DOCUMENTS_PATCH = "document-processing-store-documents"
+
 
 @dataclass
 class DocumentProcessingRequest:
@@ -44,6 +57,10 @@ class DocumentProcessingRequest:
     priority: Priority = Priority.NORMAL
     admin_notification: bool = True
     deep_analysis: bool = True
+    # Documents processed at once; each runs its extraction and analysis activities in turn
+    max_concurrent_documents: int = 5
+    # Keep a copy of each uploaded file in MinIO (see DocumentResult.storage_info)
+    store_documents: bool = True
 
     # Organizational learning options (business-level only)
     organization_name: str = ""
@@ -64,6 +81,18 @@ class DocumentResult:
     error: str | None = None
 
 
+@dataclass
+class DocumentProcessingProgress:
+    """Live progress of a document processing run (see get_processing_status)"""
+
+    stage: str = "initializing"
+    total_documents: int = 0
+    completed_documents: int = 0
+    successful_documents: int = 0
+    failed_documents: int = 0
+    in_flight: list[str] = field(default_factory=list)
+
+
 @dataclass
 class DocumentProcessingResult:
     """Result from document processing workflow"""
@@ -88,7 +117,8 @@ class DocumentProcessingWorkflow:
     Business workflow for document processing.
 
     Handles multiple documents with both quick summaries for admin UI
-    and full analysis for business intelligence.
+    and full analysis for business intelligence. Documents are processed
+    concurrently, at most ``max_concurrent_documents`` at a time.
 
     Usage in OrganizationOnboardingWorkflow:
         doc_result = await workflow.execute_child_workflow(
@@ -97,6 +127,9 @@ class DocumentProcessingWorkflow:
         )
     """
 
+    def __init__(self) -> None:
+        self._progress = DocumentProcessingProgress()
+
     @workflow.run
     async def run(self, request: DocumentProcessingRequest) -> DocumentProcessingResult:
         """
@@ -109,88 +142,57 @@ class DocumentProcessingWorkflow:
             Complete processing results with summaries and analysis
         """
 
+        max_in_flight = max(1, request.max_concurrent_documents)
         workflow.logger.info(
-            f"Starting document processing for {len(request.file_paths)} documents"
+            f"Starting document processing for {len(request.file_paths)} documents "
+            f"({max_in_flight} at a time)"
         )
 
         request_id = f"doc-proc-{workflow.info().workflow_id}"
-        results = []
-        admin_summaries = []
-        business_analysis = []
-        successful_count = 0
-
-        # Process each document
-        for i, file_path in enumerate(request.file_paths):
-            workflow.logger.info(
-                f"Processing document {i + 1}/{len(request.file_paths)}: {file_path}"
-            )
-
-            doc_result = DocumentResult(file_path=file_path)
-
-            try:
-                # Step 1: Quick summary for admin UI (immediate feedback)
-                if request.admin_notification:
-                    quick_summary = await workflow.execute_activity(
-                        generate_document_summary,
-                        file_path,
-                        start_to_close_timeout=timedelta(minutes=5),
-                        task_queue=OPENAI_QUEUE,  # Route to OpenAI worker
-                        retry_policy=RetryPolicy(
-                            initial_interval=timedelta(seconds=5),
-                            maximum_attempts=3,
-                        ),
-                    )
-                    doc_result.quick_summary = quick_summary
-                    admin_summaries.append(quick_summary)
-                    workflow.logger.info(f"Quick summary completed for: {file_path}")
-
-                # Step 2: Full analysis for business intelligence (if requested)
-                if request.deep_analysis:
-                    # Process document upload
-                    document_info = await workflow.execute_activity(
-                        process_document_upload,
-                        file_path,
-                        start_to_close_timeout=timedelta(minutes=5),
-                        task_queue=DEFAULT_QUEUE,  # Route to default worker
-                        retry_policy=RetryPolicy(
-                            initial_interval=timedelta(seconds=5),
-                            maximum_attempts=2,
-                        ),
-                    )
-
-                    # Analyze content
-                    full_analysis = await workflow.execute_activity(
-                        analyze_document_content,
-                        document_info,
-                        start_to_close_timeout=timedelta(minutes=10),
-                        task_queue=OPENAI_QUEUE,  # Route to OpenAI worker
-                        retry_policy=RetryPolicy(
-                            initial_interval=timedelta(seconds=10),
-                            maximum_attempts=3,
-                        ),
-                    )
-
-                    doc_result.full_analysis = full_analysis
-                    business_analysis.append(full_analysis)
-                    workflow.logger.info(f"Full analysis completed for: {file_path}")
-
-                # Mark as successful
-                doc_result.success = True
-                successful_count += 1
-
-            except Exception as e:
-                error_msg = f"Document processing failed for {file_path}: {e!s}"
-                workflow.logger.error(error_msg)
-                doc_result.error = error_msg
-                doc_result.success = False
+        self._progress = DocumentProcessingProgress(
+            stage="document_processing", total_documents=len(request.file_paths)
+        )
 
-            results.append(doc_result)
+        # Fan out across documents; the semaphore bounds how many are in flight and
+        # each document updates progress as soon as it finishes
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def process_bounded(index: int, file_path: str) -> DocumentResult:
+            async with semaphore:
+                self._progress.in_flight.append(file_path)
+                try:
+                    doc_result = await self._process_document(request, index, file_path)
+                finally:
+                    self._progress.in_flight.remove(file_path)
+
+            self._progress.completed_documents += 1
+            if doc_result.success:
+                self._progress.successful_documents += 1
+            else:
+                self._progress.failed_documents += 1
+            return doc_result
+
+        if workflow.patched(CONCURRENT_DOCUMENTS_PATCH):
+            # gather keeps results in request order, so replays and reports are stable
+            results = list(
+                await asyncio.gather(
+                    *(process_bounded(i, path) for i, path in enumerate(request.file_paths))
+                )
+            )
+        else:
+            results = []
+            for i, path in enumerate(request.file_paths):
+                results.append(await process_bounded(i, path))
+        admin_summaries = [r.quick_summary for r in results if r.quick_summary]
+        business_analysis = [r.full_analysis for r in results if r.full_analysis]
+        successful_count = self._progress.successful_documents
 
         # Optionally initiate model training (non-blocking)
         training_job_id = ""
         training_initiated = False
 
         if request.enable_model_training and request.organization_name and successful_count > 0:
+            self._progress.stage = "model_training"
             try:
                 # Convert processed documents for training
                 training_documents = []
@@ -257,17 +259,160 @@ class DocumentProcessingWorkflow:
             training_initiated=training_initiated,
         )
 
+        self._progress.stage = "completed"
         workflow.logger.info(
             f"Document processing completed: {successful_count}/{len(request.file_paths)} successful"
         )
 
         return final_result
 
+    async def _process_document(
+        self, request: DocumentProcessingRequest, index: int, file_path: str
+    ) -> DocumentResult:
+        """Extract and analyze one document; the admin summary reuses the analysis."""
+        workflow.logger.info(
+            f"Processing document {index + 1}/{len(request.file_paths)}: {file_path}"
+        )
+
+        doc_result = DocumentResult(file_path=file_path)
+        if not (request.admin_notification or request.deep_analysis):
+            doc_result.success = True
+            return doc_result
+
+        try:
+            if workflow.patched(SINGLE_ANALYSIS_PATCH):
+                await self._extract_and_analyze(request, file_path, doc_result)
+            else:
+                await self._summarize_then_analyze(request, file_path, doc_result)
+
+            # Mark as successful
+            doc_result.success = True
+
+        except Exception as e:
+            error_msg = f"Document processing failed for {file_path}: {e!s}"
+            workflow.logger.error(error_msg)
+            doc_result.error = error_msg
+            doc_result.success = False
+            if request.admin_notification:
+                # The admin UI still lists the document, flagged as failed
+                doc_result.quick_summary = failed_summary(
+                    file_path, error_msg, workflow.now().isoformat()
+                )
+
+        return doc_result
+
+    async def _extract_and_analyze(
+        self, request: DocumentProcessingRequest, file_path: str, doc_result: DocumentResult
+    ) -> None:
+        """Extract and analyze a document once; both results come from that analysis."""
+        # Step 1: Extract the document once
+        document_info = await workflow.execute_activity(
+            process_document_upload,
+            file_path,
+            start_to_close_timeout=timedelta(minutes=5),
+            heartbeat_timeout=timedelta(minutes=1),  # Extraction heartbeats while parsing
+            task_queue=DEFAULT_QUEUE,  # Route to default worker
+            retry_policy=RetryPolicy(
+                initial_interval=timedelta(seconds=5),
+                maximum_attempts=2,
+            ),
+        )
+
+        # Step 2: Analyze it once; both the admin summary and the business
+        # analysis come from this single LLM call
+        full_analysis = await workflow.execute_activity(
+            analyze_document_content,
+            document_info,
+            start_to_close_timeout=timedelta(minutes=10),
+            task_queue=OPENAI_QUEUE,  # Route to OpenAI worker
+            retry_policy=RetryPolicy(
+                initial_interval=timedelta(seconds=10),
+                maximum_attempts=3,
+            ),
+        )
+
+        # Quick summary for admin UI, derived without another activity
+        if request.admin_notification:
+            doc_result.quick_summary = summary_from_analysis(
+                full_analysis, workflow.now().isoformat()
+            )
+            workflow.logger.info(f"Quick summary completed for: {file_path}")
+
+        # Full analysis for business intelligence (if requested)
+        if request.deep_analysis:
+            doc_result.full_analysis = full_analysis
+            workflow.logger.info(f"Full analysis completed for: {file_path}")
+
+        # Step 3: Keep the original in MinIO, streamed from disk; documents passed
+        # as minio:// references are already stored
+        if (
+            request.store_documents
+            and not file_path.startswith("minio://")
+            and workflow.patched(STORE_DOCUMENTS_PATCH)
+        ):
+            try:
+                doc_result.storage_info = await workflow.execute_activity_method(
+                    StorageActivities.store_document_file_in_minio,
+                    args=[file_path, document_info.file_type.lstrip(".") or "unknown"],
+                    start_to_close_timeout=timedelta(minutes=10),
+                    task_queue=DEFAULT_QUEUE,  # Route to default worker
+                    retry_policy=RetryPolicy(
+                        initial_interval=timedelta(seconds=5),
+                        maximum_attempts=3,
+                    ),
+                )
+            except Exception as e:
+                # The analysis is already done; a missing copy is not a failed document
+                workflow.logger.warning(f"Could not store {file_path}: {e}")
+
+    async def _summarize_then_analyze(
+        self, request: DocumentProcessingRequest, file_path: str, doc_result: DocumentResult
+    ) -> None:
+        """Pre-patch sequence: summary activity first, then a separate extraction and analysis."""
+        # Step 1: Quick summary for admin UI (immediate feedback)
+        if request.admin_notification:
+            doc_result.quick_summary = await workflow.execute_activity(
+                generate_document_summary,
+                file_path,
+                start_to_close_timeout=timedelta(minutes=5),
+                task_queue=OPENAI_QUEUE,  # Route to OpenAI worker
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=5),
+                    maximum_attempts=3,
+                ),
+            )
+            workflow.logger.info(f"Quick summary completed for: {file_path}")
+
+        # Step 2: Full analysis for business intelligence (if requested)
+        if request.deep_analysis:
+            document_info = await workflow.execute_activity(
+                process_document_upload,
+                file_path,
+                start_to_close_timeout=timedelta(minutes=5),
+                heartbeat_timeout=timedelta(minutes=1),
+                task_queue=DEFAULT_QUEUE,  # Route to default worker
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=5),
+                    maximum_attempts=2,
+                ),
+            )
+            doc_result.full_analysis = await workflow.execute_activity(
+                analyze_document_content,
+                document_info,
+                start_to_close_timeout=timedelta(minutes=10),
+                task_queue=OPENAI_QUEUE,  # Route to OpenAI worker
+                retry_policy=RetryPolicy(
+                    initial_interval=timedelta(seconds=10),
+                    maximum_attempts=3,
+                ),
+            )
+            workflow.logger.info(f"Full analysis completed for: {file_path}")
+
     @workflow.query
     def get_processing_status(self) -> dict:
-        """Query to get current processing status"""
+        """Query to get current processing status and per-document progress"""
         return {
-            "status": "processing",
+            "status": "completed" if self._progress.stage == "completed" else "processing",
             "workflow_id": workflow.info().workflow_id,
-            "stage": "document_processing",
+            **asdict(self._progress),
         }
@@ -55,6 +55,7 @@ class OnboardingRequest:
     competitors: list[str] | None = None  # Known competitors
     admin_emails: list[str] | None = None  # Admin notification recipients
     priority: Priority = Priority.NORMAL
+    max_concurrent_documents: int = 5  # Documents processed in parallel by the child workflow
 
     # AI Training Options (business-level only)
     enable_ai_customization: bool = True  # Enable organizational AI model training
@@ -160,6 +161,7 @@ class OrganizationOnboardingWorkflow:
                 priority=request.priority,
                 admin_notification=True,
                 deep_analysis=True,
+                max_concurrent_documents=request.max_concurrent_documents,
                 # Organizational learning parameters (business-level only)
                 organization_name=request.organization_name,
                 organization_id=request.organization_name.lower().replace(" ", "-"),
@@ -17,6 +17,7 @@ from activity.scheduler_activities import (
     CompetitorScanResult,
     ScheduledTaskResult,
     cleanup_old_data,
+    deactivate_idle_vector_tenants,
     health_check_external_services,
     schedule_competitor_scan,
     send_scheduled_notification,
@@ -256,6 +257,50 @@ class MaintenanceWorkflow:
             return results
 
 
+@workflow.defn
+class IdleTenantWorkflow:
+    """
+    Hourly unloading of Weaviate tenants no worker has used for the configured idle time.
+    Workers start it on boot when WEAVIATE_URL is set (see start_idle_tenant_workflow).
+
+    Usage:
+        # Start cron workflow
+        await client.start_workflow(
+            IdleTenantWorkflow.run,
+            id=IDLE_TENANT_WORKFLOW_ID,
+            cron_schedule="0 * * * *",  # Every hour
+            task_queue=DEFAULT_QUEUE,
+        )
+    """
+
+    @workflow.run
+    async def run(self) -> ScheduledTaskResult:
+        """Deactivate idle tenants"""
+        return await workflow.execute_activity(
+            deactivate_idle_vector_tenants,
+            start_to_close_timeout=workflow.timedelta(minutes=5),
+            task_queue=DEFAULT_QUEUE,  # Route to default worker
+        )
+
+
+IDLE_TENANT_WORKFLOW_ID = "weaviate-idle-tenant-deactivation"
+
+
+async def start_idle_tenant_workflow(client) -> None:
+    """Start the hourly IdleTenantWorkflow unless it is already scheduled (call from workers)."""
+    from temporalio.exceptions import WorkflowAlreadyStartedError
+
+    try:
+        await client.start_workflow(
+            IdleTenantWorkflow.run,
+            id=IDLE_TENANT_WORKFLOW_ID,
+            cron_schedule="0 * * * *",
+            task_queue=DEFAULT_QUEUE,
+        )
+    except WorkflowAlreadyStartedError:
+        pass
+
+
 @workflow.defn
 class AdHocSchedulerWorkflow:
     """
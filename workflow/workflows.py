@@ -18,6 +18,7 @@ from workflow.daily_interaction_workflow import (
     DailyInteractionWorkflow,
 )
 from workflow.document_processing_workflow import (
+    DocumentProcessingProgress,
     DocumentProcessingRequest,
     DocumentProcessingResult,
     DocumentProcessingWorkflow,
@@ -30,6 +31,7 @@ from workflow.organization_onboarding_workflow import (
 )
 from workflow.scheduler_workflow import (
     CompetitorMonitoringWorkflow,
+    IdleTenantWorkflow,
     WeeklyCompetitorReportRequest,
     WeeklyCompetitorReportResult,
 )
@@ -45,12 +47,14 @@ __all__ = [
     "DocumentProcessingWorkflow",
     "DocumentProcessingRequest",
     "DocumentProcessingResult",
+    "DocumentProcessingProgress",
     # Daily Interaction (Demo Workflow)
     "DailyInteractionWorkflow",
     "DailyInteractionRequest",
     "DailyInteractionResult",
     # Scheduler/Monitoring
     "CompetitorMonitoringWorkflow",
+    "IdleTenantWorkflow",
     "WeeklyCompetitorReportRequest",
     "WeeklyCompetitorReportResult",
 ]